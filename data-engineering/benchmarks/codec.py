@@ -0,0 +1,140 @@
+"""
+JSON encode and decode time of one pipeline run, per codec
+
+Usage:
+    python -m benchmarks.codec [GAMES] [--profile recommendation] [--repeat 3]
+
+Decodes the IGDB responses of a ``GAMES``-game run (500-game windows from the
+mock catalog) and the RAWG detail responses of as many games, then encodes
+the processed games as a JSON document and as JSON Lines. Each installed
+backend is timed in compatibility mode and, for the fast backends, without
+it. Compatibility-mode output is checked to be byte-identical to the
+standard library's.
+"""
+
+import argparse
+import gc
+import io
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.mock_server import MockCatalog, MockSettings
+from src.sho_da_igram.api.igdb_client import MAX_QUERY_LIMIT, profile_fields
+from src.sho_da_igram.utils import codec
+from src.sho_da_igram.utils.codec import JsonCodec
+from src.sho_da_igram.utils.records import GameRecord, record_from_dict
+from src.sho_da_igram.utils.utils import IGDBDataHandler, RAWGDataHandler
+
+
+def render_responses(games: int, profile: str) -> Dict[str, List[bytes]]:
+    """Response bodies of a run, per source."""
+    catalog = MockCatalog(MockSettings(games=games))
+    fields = profile_fields(profile)
+    igdb = [
+        catalog.igdb_query(
+            f"fields {fields}\nlimit {MAX_QUERY_LIMIT};\noffset {offset};"
+        ).encode("utf-8")
+        for offset in range(0, games, MAX_QUERY_LIMIT)
+    ]
+    rawg = [
+        catalog.render("rawg_detail", game_id).encode("utf-8")
+        for game_id in range(1, games + 1)
+    ]
+    return {"igdb": igdb, "rawg": rawg}
+
+
+def processed_records(responses: Dict[str, List[bytes]]) -> List[GameRecord]:
+    """The run's processed games, as the collector holds them."""
+    games = [game for body in responses["igdb"] for game in codec.loads(body)]
+    details = [codec.loads(body) for body in responses["rawg"]]
+    processed = (
+        IGDBDataHandler.process_batch(games).records
+        + RAWGDataHandler.process_batch(details).records
+    )
+    return [record_from_dict(game) for game in processed]
+
+
+def best_seconds(run: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """Fastest of ``repeat`` runs, and the last run's result."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def time_codec(
+    json_codec: JsonCodec,
+    responses: Dict[str, List[bytes]],
+    records: List[GameRecord],
+    repeat: int,
+) -> Dict[str, Any]:
+    """Decode and encode times of one codec, with its encoded outputs."""
+    bodies = responses["igdb"] + responses["rawg"]
+    dicts = [record.to_dict() for record in records]
+
+    def decode() -> None:
+        for body in bodies:
+            json_codec.loads(body)
+
+    def encode_document() -> str:
+        stream = io.StringIO()
+        json_codec.dump_document(records, stream, 2)
+        return stream.getvalue()
+
+    def encode_lines() -> str:
+        return "".join(json_codec.dumps_line(game) + "\n" for game in dicts)
+
+    decode_seconds, _ = best_seconds(decode, repeat)
+    document_seconds, document = best_seconds(encode_document, repeat)
+    lines_seconds, lines = best_seconds(encode_lines, repeat)
+    return {
+        "decode": decode_seconds,
+        "json": document_seconds,
+        "ndjson": lines_seconds,
+        "outputs": (document, lines),
+    }
+
+
+def main() -> None:
+    """Time every installed codec and print one row per codec and mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("games", nargs="?", type=int, default=5000)
+    parser.add_argument("--profile", default="recommendation")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    responses = render_responses(args.games, args.profile)
+    records = processed_records(responses)
+    megabytes = sum(map(len, responses["igdb"] + responses["rawg"])) / 2**20
+    print(
+        f"{args.games} IGDB + {args.games} RAWG games, {megabytes:.1f} MB of "
+        f"responses ({args.profile} profile)\n"
+    )
+
+    codecs = [JsonCodec("stdlib")]
+    for backend in ("orjson", "msgspec"):
+        try:
+            codecs += [JsonCodec(backend), JsonCodec(backend, compat=False)]
+        except ValueError:
+            print(f"  {backend} is not installed; skipping it")
+
+    print(f"{'codec':<22}{'decode':>9}{'json':>9}{'ndjson':>9}{'total':>9}  output")
+    reference = None
+    for json_codec in codecs:
+        result = time_codec(json_codec, responses, records, args.repeat)
+        reference = reference or result["outputs"]
+        output = "identical" if result["outputs"] == reference else "differs"
+        total = result["decode"] + result["json"] + result["ndjson"]
+        mode = "compat" if json_codec.compat else "fast"
+        print(
+            f"{json_codec.backend + ' ' + mode:<22}{result['decode']:>8.2f}s"
+            f"{result['json']:>8.2f}s{result['ndjson']:>8.2f}s{total:>8.2f}s"
+            f"  {output}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+"""Local mock of the RAWG and IGDB endpoints the pipeline calls"""
+
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+RAWG_PREFIX = "/rawg/api"
+IGDB_PREFIX = "/igdb/v4"
+
+# List fields repeated ``payload_scale`` times to grow responses
+SCALED_FIELDS = {
+    "rawg": ("tags", "short_screenshots", "stores", "platforms"),
+    "igdb": ("screenshots", "artworks", "keywords", "similar_games", "release_dates"),
+}
+SCALED_TEXT = {"rawg": ("description", "description_raw"), "igdb": ("storyline",)}
+
+RELEASE_START = datetime(1990, 1, 1, tzinfo=timezone.utc)
+
+# Stand-ins for the values that differ between generated games
+PLACEHOLDERS = {
+    name: f"@@{name}@@"
+    for name in (
+        "id",
+        "name",
+        "slug",
+        "first_release_date",
+        "total_rating_count",
+        "released",
+    )
+}
+RESULTS_PLACEHOLDER = "@@results@@"
+
+QUERY_PATTERN = re.compile(r'query (\w+) "([^"]+)" \{(.*?)\};', re.S)
+
+
+@dataclass
+class MockSettings:
+    """
+    How the mock answers
+
+    Latency is ``latency`` seconds plus up to ``jitter`` more, per request.
+    ``error_rate`` of requests fail with 503 and ``throttle_rate`` with 429 and
+    a ``retry_after`` second Retry-After header.
+    """
+
+    games: int = 1000
+    latency: float = 0.02
+    jitter: float = 0.01
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: float = 0.1
+    payload_scale: int = 1
+    seed: int = 42
+
+
+@dataclass
+class MockStats:
+    """Requests answered by the mock, by endpoint and status"""
+
+    requests: int = 0
+    bytes_sent: int = 0
+    statuses: Counter = field(default_factory=Counter)
+    endpoints: Counter = field(default_factory=Counter)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary for reports."""
+        return {
+            "requests": self.requests,
+            "bytes_sent": self.bytes_sent,
+            "statuses": {str(code): n for code, n in sorted(self.statuses.items())},
+            "endpoints": dict(sorted(self.endpoints.items())),
+        }
+
+
+def load_fixture(name: str) -> Dict[str, Any]:
+    """Load a recorded response from the fixtures directory."""
+    with open(FIXTURES_DIR / name, encoding="utf-8") as fixture_file:
+        return json.load(fixture_file)
+
+
+def scale_payload(record: Dict[str, Any], source: str, scale: int) -> None:
+    """Repeat a record's list fields and long texts ``scale`` times, in place."""
+    if scale <= 1:
+        return
+    for name in SCALED_FIELDS[source]:
+        if isinstance(record.get(name), list):
+            record[name] = record[name] * scale
+    for name in SCALED_TEXT[source]:
+        if record.get(name):
+            record[name] = "\n\n".join([record[name]] * scale)
+
+
+def project_fields(record: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """Keep only the dotted ``fields`` paths of a record, as IGDB does."""
+    projected: Dict[str, Any] = {"id": record["id"]}
+
+    def copy_path(source: Any, target: Dict[str, Any], parts: List[str]) -> None:
+        if not isinstance(source, dict) or parts[0] not in source:
+            return
+        value = source[parts[0]]
+        if len(parts) == 1:
+            target[parts[0]] = value
+        elif isinstance(value, list):
+            items = target.setdefault(parts[0], [{} for _ in value])
+            for item, projected_item in zip(value, items):
+                copy_path(item, projected_item, parts[1:])
+        elif isinstance(value, dict):
+            copy_path(value, target.setdefault(parts[0], {}), parts[1:])
+
+    for name in fields:
+        copy_path(record, projected, name.split("."))
+    return projected
+
+
+class MockCatalog:
+    """
+    Games generated from the fixtures
+
+    Game ``n`` is the fixture with its ID, name, slug, release date and rating
+    count changed. It ranks ``n``-th by rating count, so IGDB's ``sort
+    total_rating_count desc`` and ``sort id asc`` give the same order. Each
+    fixture is serialized once per field list with placeholders for those
+    values, so rendering a game is a few string substitutions and the mock
+    spends little of the CPU the benchmark is measuring.
+    """
+
+    def __init__(self, settings: MockSettings) -> None:
+        self.settings = settings
+        self.fixtures = {
+            "rawg_item": load_fixture("rawg_games_item.json"),
+            "rawg_detail": load_fixture("rawg_game_detail.json"),
+            "igdb": load_fixture("igdb_game.json"),
+        }
+        for kind, record in self.fixtures.items():
+            scale_payload(record, kind.split("_")[0], settings.payload_scale)
+        self._templates: Dict[Tuple[str, Optional[str]], str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def released(game_id: int) -> datetime:
+        """Release date of a generated game."""
+        return RELEASE_START + timedelta(days=(game_id * 37) % 12000)
+
+    def _template(self, kind: str, fields: Optional[str]) -> str:
+        key = (kind, fields)
+        with self._lock:
+            template = self._templates.get(key)
+        if template is not None:
+            return template
+
+        record = dict(self.fixtures[kind])
+        record.update(
+            {
+                "id": PLACEHOLDERS["id"],
+                "name": PLACEHOLDERS["name"],
+                "slug": PLACEHOLDERS["slug"],
+            }
+        )
+        if kind == "igdb":
+            record["first_release_date"] = PLACEHOLDERS["first_release_date"]
+            record["total_rating_count"] = PLACEHOLDERS["total_rating_count"]
+        else:
+            record["released"] = PLACEHOLDERS["released"]
+        if fields is not None:
+            names = [name.strip() for name in fields.split(",")]
+            record = project_fields(record, names)
+        template = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            self._templates[key] = template
+        return template
+
+    def render(self, kind: str, game_id: int, fields: Optional[str] = None) -> str:
+        """JSON of one generated game, with only ``fields`` if given."""
+        fixture = self.fixtures[kind]
+        released = self.released(game_id)
+        values = {
+            "id": str(game_id),
+            "name": json.dumps(f"{fixture['name']} #{game_id}"),
+            "slug": json.dumps(f"{fixture['slug']}-{game_id}"),
+            "first_release_date": str(int(released.timestamp())),
+            "total_rating_count": str(self.settings.games - game_id + 10),
+            "released": json.dumps(released.date().isoformat()),
+        }
+        rendered = self._template(kind, fields)
+        for name, placeholder in PLACEHOLDERS.items():
+            rendered = rendered.replace(json.dumps(placeholder), values[name])
+        return rendered
+
+    def rawg_page(self, page: int, page_size: int) -> Optional[str]:
+        """JSON of one page of the RAWG games list, or None past the last page."""
+        total = self.settings.games
+        start = (page - 1) * page_size
+        if page < 1 or (start >= total and page > 1):
+            return None
+        end = min(start + page_size, total)
+        results = ",".join(self.render("rawg_item", i + 1) for i in range(start, end))
+        return json.dumps(
+            {
+                "count": total,
+                "next": None if end >= total else f"?page={page + 1}",
+                "previous": None if page == 1 else f"?page={page - 1}",
+                "results": RESULTS_PLACEHOLDER,
+            },
+            separators=(",", ":"),
+        ).replace(json.dumps(RESULTS_PLACEHOLDER), f"[{results}]")
+
+    def rawg_detail(self, game_id: int) -> Optional[str]:
+        """JSON of one RAWG game's details, or None if it does not exist."""
+        if not 1 <= game_id <= self.settings.games:
+            return None
+        return self.render("rawg_detail", game_id)
+
+    def igdb_query(self, query: str) -> str:
+        """
+        JSON answer to an Apicalypse games query
+
+        Supports the clauses the pipeline sends: ``fields``, ID lists and
+        cursors, release date and ``updated_at`` filters, ``limit`` and
+        ``offset``.
+        """
+        ids = re.search(r"where id = \(([\d,\s]+)\)", query)
+        single = re.search(r"where id = (\d+);", query)
+        if ids:
+            game_ids = [int(value) for value in ids.group(1).split(",")]
+        elif single:
+            game_ids = [int(single.group(1))]
+        else:
+            game_ids = list(range(1, self.settings.games + 1))
+        game_ids = [i for i in game_ids if 1 <= i <= self.settings.games]
+
+        cursor = re.search(r"id > (\d+)", query)
+        if cursor:
+            game_ids = [i for i in game_ids if i > int(cursor.group(1))]
+        for op, value in re.findall(r"first_release_date (>=|<|=) (\d+|null)", query):
+            if value == "null":
+                game_ids = []
+                continue
+            bound = datetime.fromtimestamp(int(value), timezone.utc)
+            if op == ">=":
+                game_ids = [i for i in game_ids if self.released(i) >= bound]
+            else:
+                game_ids = [i for i in game_ids if self.released(i) < bound]
+        updated = re.search(r"updated_at > (\d+)", query)
+        if updated and int(updated.group(1)) >= self.fixtures["igdb"]["updated_at"]:
+            game_ids = []
+
+        limit = re.search(r"limit (\d+);", query)
+        offset = re.search(r"offset (\d+);", query)
+        start = int(offset.group(1)) if offset else 0
+        game_ids = game_ids[start : start + (int(limit.group(1)) if limit else 10)]
+
+        fields = re.search(r"fields\s+(.*?);", query, re.S)
+        selected = (
+            fields.group(1) if fields and fields.group(1).strip() != "*" else None
+        )
+        return "[" + ",".join(self.render("igdb", i, selected) for i in game_ids) + "]"
+
+
+class MockServer:
+    """
+    Threaded HTTP server answering RAWG and IGDB requests from a catalog
+
+    RAWG lives under ``/rawg/api`` and IGDB under ``/igdb/v4``; use
+    :attr:`rawg_base_url` and :attr:`igdb_base_url` as the clients' base URLs.
+    """
+
+    def __init__(self, settings: Optional[MockSettings] = None) -> None:
+        self.settings = settings or MockSettings()
+        self.catalog = MockCatalog(self.settings)
+        self.stats = MockStats()
+        self._rng = random.Random(self.settings.seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Root URL of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def rawg_base_url(self) -> str:
+        """Base URL to give RAWG clients."""
+        return f"{self.url}{RAWG_PREFIX}"
+
+    @property
+    def igdb_base_url(self) -> str:
+        """Base URL to give IGDB clients."""
+        return f"{self.url}{IGDB_PREFIX}"
+
+    def configure(self, settings: MockSettings) -> None:
+        """Swap in new settings and a fresh catalog, clearing the stats."""
+        catalog = MockCatalog(settings)
+        with self._lock:
+            self.settings = settings
+            self.catalog = catalog
+            self.stats = MockStats()
+            self._rng = random.Random(settings.seed)
+
+    def start(self) -> "MockServer":
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _draw(self) -> Tuple[float, Optional[int]]:
+        """Latency of the next request and the failure status it gets, if any."""
+        with self._lock:
+            settings = self.settings
+            delay = settings.latency + self._rng.random() * settings.jitter
+            roll = self._rng.random()
+        if roll < settings.error_rate:
+            return delay, 503
+        if roll < settings.error_rate + settings.throttle_rate:
+            return delay, 429
+        return delay, None
+
+    def _record(self, endpoint: str, status: int, size: int) -> None:
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.bytes_sent += size
+            self.stats.statuses[status] += 1
+            self.stats.endpoints[endpoint] += 1
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send(
+                self,
+                endpoint: str,
+                status: int,
+                payload: Any,
+                headers: Optional[Dict[str, str]] = None,
+            ) -> None:
+                # Strings are JSON already rendered by the catalog
+                if not isinstance(payload, str):
+                    payload = json.dumps(payload, separators=(",", ":"))
+                body = payload.encode("utf-8")
+                # Count the response before the client can see it
+                server._record(endpoint, status, len(body))
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _answer(self, endpoint: str) -> bool:
+                """Sleep for the drawn latency and send a failure if drawn."""
+                delay, failure = server._draw()
+                time.sleep(delay)
+                if failure == 503:
+                    self._send(endpoint, 503, {"message": "Service Unavailable"})
+                elif failure == 429:
+                    retry_after = str(server.settings.retry_after)
+                    headers = {"Retry-After": retry_after}
+                    self._send(endpoint, 429, {"message": "Too Many Requests"}, headers)
+                return failure is None
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                if not url.path.startswith(f"{RAWG_PREFIX}/games"):
+                    self._send("unknown", 404, {"detail": "Not found."})
+                    return
+                detail = re.fullmatch(rf"{RAWG_PREFIX}/games/(\d+)", url.path)
+                endpoint = "rawg games/{id}" if detail else "rawg games"
+                if not self._answer(endpoint):
+                    return
+
+                if detail:
+                    game = server.catalog.rawg_detail(int(detail.group(1)))
+                    if game is None:
+                        self._send(endpoint, 404, {"detail": "Not found."})
+                    else:
+                        self._send(endpoint, 200, game)
+                    return
+
+                params = parse_qs(url.query)
+                page = server.catalog.rawg_page(
+                    int(params.get("page", ["1"])[0]),
+                    int(params.get("page_size", ["20"])[0]),
+                )
+                if page is None:
+                    self._send(endpoint, 404, {"detail": "Invalid page."})
+                else:
+                    self._send(endpoint, 200, page)
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                query = body.decode("utf-8")
+                endpoint = f"igdb {self.path.rsplit('/', 1)[-1]}"
+                if self.path == f"{IGDB_PREFIX}/games":
+                    if self._answer(endpoint):
+                        self._send(endpoint, 200, server.catalog.igdb_query(query))
+                elif self.path == f"{IGDB_PREFIX}/multiquery":
+                    if self._answer(endpoint):
+                        results = ",".join(
+                            f'{{"name":{json.dumps(name)},'
+                            f'"result":{server.catalog.igdb_query(inner)}}}'
+                            for _, name, inner in QUERY_PATTERN.findall(query)
+                        )
+                        self._send(endpoint, 200, f"[{results}]")
+                else:
+                    self._send("unknown", 404, {"message": "Not found"})
+
+        return Handler
+
+
+def main() -> None:
+    """Serve the mock until interrupted, for manual runs of the pipeline."""
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else MockSettings.games
+    with MockServer(MockSettings(games=games)) as server:
+        print(f"RAWG_BASE_URL={server.rawg_base_url}")
+        print(f"IGDB_BASE_URL={server.igdb_base_url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Record-processing throughput of the data handlers
+
+Usage:
+    python -m benchmarks.processing [GAMES] [--workers N] [--repeat N]
+
+Processes ``GAMES`` copies of the fixture records three ways: one
+``process_game_data`` call per game (as the fetchers used to), one inline
+``process_batch`` call, and ``process_batch`` across ``--workers`` processes.
+Reports games per second for each, best of ``--repeat`` runs.
+"""
+
+import argparse
+import copy
+import gc
+import os
+import time
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from benchmarks.mock_server import load_fixture
+from src.sho_da_igram.utils.utils import (
+    GameDataHandler,
+    IGDBDataHandler,
+    RAWGDataHandler,
+)
+
+HANDLERS: Dict[str, Tuple[Type[GameDataHandler], str]] = {
+    "rawg": (RAWGDataHandler, "rawg_game_detail.json"),
+    "igdb": (IGDBDataHandler, "igdb_game.json"),
+}
+
+
+def clone_games(fixture: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+    """Independent copies of a fixture record with distinct IDs."""
+    games = []
+    for game_id in range(1, count + 1):
+        game = copy.deepcopy(fixture)
+        game["id"] = game_id
+        games.append(game)
+    return games
+
+
+def per_record(
+    handler: Type[GameDataHandler], games: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Process games one call at a time, skipping invalid ones."""
+    processed = []
+    for game in games:
+        try:
+            processed.append(handler.process_game_data(game))
+        except Exception:
+            continue
+    return processed
+
+
+def best_rate(run: Callable[[], int], games: int, repeat: int) -> float:
+    """Best games per second over ``repeat`` runs of ``run``."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        processed = run()
+        best = min(best, time.perf_counter() - started)
+        assert processed == games, f"processed {processed} of {games} games"
+    return games / best
+
+
+def main() -> None:
+    """Time each processing path per source and print the rates."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("games", nargs="?", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    workers = max(args.workers, 1)
+
+    for source, (handler, fixture) in HANDLERS.items():
+        games = clone_games(load_fixture(fixture), args.games)
+        paths = {
+            "per-record": lambda: len(per_record(handler, games)),
+            "batch": lambda: len(handler.process_batch(games).records),
+            f"batch x{workers}": lambda: len(
+                handler.process_batch(games, workers).records
+            ),
+        }
+        print(f"\n{source}: {args.games} games")
+        baseline = None
+        for name, run in paths.items():
+            rate = best_rate(run, args.games, args.repeat)
+            baseline = baseline or rate
+            print(f"  {name:<12}{rate:>12,.0f} games/s  ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
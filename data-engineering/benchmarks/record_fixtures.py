@@ -0,0 +1,83 @@
+"""
+Record the mock server's fixtures from the live APIs
+
+Usage:
+    python -m benchmarks.record_fixtures [RAWG_ID IGDB_ID]
+
+Saves one RAWG games list item, that game's RAWG details and one IGDB game
+with every field of the "full" profile, using the keys in ``.env``. The mock
+server clones these records, so their size sets the benchmark payload size.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+from benchmarks.mock_server import FIXTURES_DIR
+from src.sho_da_igram.api.igdb_client import IGDBClient
+from src.sho_da_igram.api.rawg_client import RAWGClient
+from src.sho_da_igram.utils.config import Config
+
+# The Witcher 3: Wild Hunt on each source
+DEFAULT_RAWG_ID = 3328
+DEFAULT_IGDB_ID = 1942
+
+
+def save_fixture(name: str, record: Dict[str, Any]) -> None:
+    """Write a fixture, replacing the recorded one."""
+    path = Path(FIXTURES_DIR) / name
+    with open(path, "w", encoding="utf-8") as fixture_file:
+        json.dump(record, fixture_file, indent=2, ensure_ascii=False)
+        fixture_file.write("\n")
+    print(f"  ✅ {path} ({len(json.dumps(record))} bytes)")
+
+
+def main() -> None:
+    """Fetch and save the fixtures."""
+    args = sys.argv[1:]
+    if len(args) not in (0, 2):
+        print("❌ Usage: python -m benchmarks.record_fixtures [RAWG_ID IGDB_ID]")
+        sys.exit(1)
+    rawg_id, igdb_id = (
+        (int(arg) for arg in args)
+        if args
+        else (
+            DEFAULT_RAWG_ID,
+            DEFAULT_IGDB_ID,
+        )
+    )
+
+    config = Config.from_env()
+    rawg = RAWGClient(api_key=config.rawg_api_key, base_url=config.rawg_base_url)
+    try:
+        detail = rawg.get_game_details(rawg_id)
+        page = rawg.get_games_page(1, 1, search=detail["slug"], search_exact=True)
+        item = next(
+            (game for game in page["results"] if game["id"] == rawg_id),
+            page["results"][0],
+        )
+    finally:
+        rawg.close()
+
+    igdb = IGDBClient(
+        client_id=config.igdb_client_id or "",
+        access_token=config.igdb_access_token or "",
+        field_profile="full",
+        base_url=config.igdb_base_url,
+    )
+    try:
+        game = igdb.get_game_by_id(igdb_id)
+    finally:
+        igdb.close()
+    if not game:
+        print(f"❌ IGDB game {igdb_id} not found")
+        sys.exit(1)
+
+    save_fixture("rawg_games_item.json", item)
+    save_fixture("rawg_game_detail.json", detail)
+    save_fixture("igdb_game.json", game)
+
+
+if __name__ == "__main__":
+    main()
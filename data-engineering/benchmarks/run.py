@@ -0,0 +1,324 @@
+"""
+Offline pipeline benchmarks against the local mock server
+
+Usage:
+    python -m benchmarks.run [SCENARIO ...] [--save-baseline] [--tolerance 0.25]
+
+Each scenario fetches games end to end with RAWGDataFetcher or IGDBDataFetcher
+in a fresh process, so peak RSS belongs to that run alone. Results are compared
+with ``benchmarks/baseline.json`` and the exit status is 1 if any metric
+regressed by more than the tolerance.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.mock_server import MockServer, MockSettings
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.25
+
+# Metrics where a higher value is better; for the others lower is better
+HIGHER_IS_BETTER = ("requests_per_s", "games_per_s")
+COMPARED_METRICS = HIGHER_IS_BETTER + ("p50_ms", "p99_ms", "peak_rss_mb")
+
+
+@dataclass
+class Scenario:
+    """One benchmark run: a source, a fetch mode and how the mock behaves"""
+
+    source: str
+    games: int
+    async_mode: bool = False
+    latency: float = 0.02
+    jitter: float = 0.01
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    payload_scale: int = 1
+    field_profile: str = "recommendation"
+
+    def mock_settings(self) -> MockSettings:
+        """Mock server settings for this scenario."""
+        return MockSettings(
+            # Room for a last partial page or window past the requested games
+            games=self.games + 500,
+            latency=self.latency,
+            jitter=self.jitter,
+            error_rate=self.error_rate,
+            throttle_rate=self.throttle_rate,
+            payload_scale=self.payload_scale,
+        )
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "rawg": Scenario("rawg", games=400),
+    "rawg-async": Scenario("rawg", games=400, async_mode=True),
+    "rawg-faults": Scenario("rawg", games=400, error_rate=0.05, throttle_rate=0.03),
+    "igdb": Scenario("igdb", games=20000),
+    "igdb-async": Scenario("igdb", games=20000, async_mode=True),
+    "igdb-full-x4": Scenario("igdb", games=5000, payload_scale=4, field_profile="full"),
+    "igdb-faults": Scenario("igdb", games=20000, error_rate=0.05, throttle_rate=0.03),
+}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process, in MiB."""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def time_requests(latencies: List[float]) -> None:
+    """Record the duration of every httpx request sent by this process."""
+    import httpx
+
+    sync_send = httpx.Client.send
+    async_send = httpx.AsyncClient.send
+
+    def timed_send(self: httpx.Client, *args: Any, **kwargs: Any) -> httpx.Response:
+        started = time.perf_counter()
+        try:
+            return sync_send(self, *args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    async def timed_async_send(
+        self: httpx.AsyncClient, *args: Any, **kwargs: Any
+    ) -> httpx.Response:
+        started = time.perf_counter()
+        try:
+            return await async_send(self, *args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    httpx.Client.send = timed_send
+    httpx.AsyncClient.send = timed_async_send
+
+
+def run_fetch(scenario: Scenario, rawg_url: str, igdb_url: str) -> Dict[str, Any]:
+    """
+    Fetch a scenario's games through the real fetcher (in a worker process)
+
+    Returns:
+        Games written, wall seconds, request latencies and peak RSS
+    """
+    from loguru import logger
+
+    from src.sho_da_igram.data.fetcher import IGDBDataFetcher, RAWGDataFetcher
+    from src.sho_da_igram.utils.config import Config
+    from src.sho_da_igram.utils.utils import JsonUtils
+
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+    latencies: List[float] = []
+    time_requests(latencies)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        config = Config(
+            rawg_api_key="benchmark",
+            rawg_rate_limit=0.0,
+            rawg_base_url=rawg_url,
+            igdb_client_id="benchmark",
+            igdb_access_token="benchmark",
+            igdb_rate_limit=0.0,
+            igdb_field_profile=scenario.field_profile,
+            igdb_base_url=igdb_url,
+            data_dir=data_dir,
+            async_mode=scenario.async_mode,
+            cache_enabled=False,
+            retry_base_delay=0.05,
+            log_to_file=False,
+        )
+        fetcher_class = (
+            RAWGDataFetcher if scenario.source == "rawg" else IGDBDataFetcher
+        )
+        fetcher = fetcher_class(config)
+        started = time.perf_counter()
+        try:
+            output_path = fetcher.fetch_games_to_json(scenario.games)
+        finally:
+            fetcher.close()
+        seconds = time.perf_counter() - started
+        games = len(JsonUtils.load_records(output_path))
+
+    return {
+        "games": games,
+        "seconds": seconds,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_scenario(server: MockServer, name: str) -> Dict[str, Any]:
+    """Run one scenario against the mock in a fresh process and collect metrics."""
+    scenario = SCENARIOS[name]
+    server.configure(scenario.mock_settings())
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        result = pool.submit(
+            run_fetch, scenario, server.rawg_base_url, server.igdb_base_url
+        ).result()
+
+    stats = server.stats.to_dict()
+    seconds = result["seconds"]
+    return {
+        "scenario": asdict(scenario),
+        "games": result["games"],
+        "seconds": round(seconds, 3),
+        "requests": stats["requests"],
+        "requests_per_s": round(stats["requests"] / seconds, 2),
+        "games_per_s": round(result["games"] / seconds, 2),
+        "p50_ms": round(result["p50_ms"], 2),
+        "p99_ms": round(result["p99_ms"], 2),
+        "mean_ms": round(result["mean_ms"], 2),
+        "peak_rss_mb": round(result["peak_rss_mb"], 1),
+        "mb_received": round(stats["bytes_sent"] / (1024 * 1024), 2),
+        "statuses": stats["statuses"],
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float,
+) -> List[Tuple[str, str, float, float]]:
+    """
+    Find metrics worse than the baseline by more than ``tolerance``
+
+    Returns:
+        (scenario, metric, baseline value, current value) per regression
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        for metric in COMPARED_METRICS:
+            before, after = reference.get(metric), result.get(metric)
+            if not before or after is None:
+                continue
+            if metric in HIGHER_IS_BETTER:
+                worse = after < before * (1 - tolerance)
+            else:
+                worse = after > before * (1 + tolerance)
+            if worse:
+                regressions.append((name, metric, before, after))
+    return regressions
+
+
+def change(before: Optional[float], after: float) -> str:
+    """Relative change for the results table."""
+    if not before:
+        return ""
+    return f" ({(after - before) / before:+.0%})"
+
+
+def print_results(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]
+) -> None:
+    """Print one block of metrics per scenario, with changes from the baseline."""
+    for name, result in results.items():
+        reference = baseline.get(name, {})
+        statuses = ", ".join(f"{code}: {n}" for code, n in result["statuses"].items())
+        print(f"\n{name}: {result['games']} games in {result['seconds']:.2f}s")
+        for metric in COMPARED_METRICS:
+            value = result[metric]
+            print(f"  {metric:<15}{value:>10}{change(reference.get(metric), value)}")
+        print(f"  {'requests':<15}{result['requests']:>10}  [{statuses}]")
+        print(f"  {'mb_received':<15}{result['mb_received']:>10}")
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Scenario results of the stored baseline, if there is one."""
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as baseline_file:
+        return json.load(baseline_file)["scenarios"]
+
+
+def save_baseline(path: Path, results: Dict[str, Dict[str, Any]]) -> None:
+    """Store results as the new baseline, keeping other scenarios' entries."""
+    scenarios = {**load_baseline(path), **results}
+    baseline = {
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "processor": platform.processor() or platform.machine(),
+        },
+        "scenarios": dict(sorted(scenarios.items())),
+    }
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2)
+        baseline_file.write("\n")
+    print(f"\n💾 Saved baseline to {path}")
+
+
+def main() -> None:
+    """Run the selected scenarios and compare them with the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "scenarios", nargs="*", metavar="SCENARIO", help=", ".join(SCENARIOS)
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--output", type=Path, help="Also write results as JSON")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    names = args.scenarios or list(SCENARIOS)
+    baseline = load_baseline(args.baseline)
+    results: Dict[str, Dict[str, Any]] = {}
+    with MockServer() as server:
+        for name in names:
+            print(f"⏱️  Running {name}...", flush=True)
+            results[name] = run_scenario(server, name)
+
+    print_results(results, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    if not baseline:
+        print(f"\n💡 No baseline at {args.baseline}; run with --save-baseline")
+    elif regressions:
+        print(f"\n❌ Regressed by more than {args.tolerance:.0%}:")
+        for name, metric, before, after in regressions:
+            print(f"  {name} {metric}: {before} → {after}")
+        sys.exit(1)
+    else:
+        print(f"\n✅ No regressions beyond {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,42 @@
 """Main entry point"""
 
 import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 from loguru import logger
 
 from src.sho_da_igram.data.fetcher import IGDBDataFetcher, RAWGDataFetcher
+from src.sho_da_igram.data.matching import match_outputs
+from src.sho_da_igram.data.sharding import (
+    ShardWorker,
+    merge_shards,
+    plan_shards,
+    shard_dir,
+)
+from src.sho_da_igram.data.tag_index import update_tag_index
+from src.sho_da_igram.utils.codec import configure_codec
 from src.sho_da_igram.utils.config import Config
+from src.sho_da_igram.utils.metrics import get_metrics, write_summary
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of one source's pipeline run"""
+
+    source: str
+    output_file: Optional[Path] = None
+    records: int = 0
+    failures: int = 0
+    duplicates: int = 0
+    skipped: int = 0
+    units: int = 0
+    seconds: float = 0.0
+    error: Optional[Exception] = None
 
 
 def setup_environment(config: Config) -> None:
@@ -14,68 +44,392 @@ def setup_environment(config: Config) -> None:
     Path(config.data_dir).mkdir(parents=True, exist_ok=True)
 
     config.setup_logging()
+    codec = configure_codec(config.json_backend, config.json_compat)
 
     logger.info(f"Data directory: {config.data_dir}")
     logger.info(f"Fetch limit: {config.fetch_limit}")
+    logger.info(f"JSON backend: {codec.backend} (compat: {codec.compat})")
 
 
-def run_rawg_pipeline(config: Config) -> Path:
+def run_rawg_pipeline(
+    config: Config, resume: bool = False, delta: bool = False
+) -> PipelineResult:
     """Run the RAWG data pipeline."""
     fetcher = RAWGDataFetcher(config)
 
     try:
         logger.info("Starting RAWG data fetch process")
-        output_file = fetcher.fetch_games_to_json(limit=config.fetch_limit)
+        output_file = fetcher.fetch_games_to_json(
+            limit=config.fetch_limit, resume=resume, delta=delta
+        )
         logger.info("RAWG pipeline completed successfully")
-        return output_file
+        return PipelineResult(
+            source="rawg",
+            output_file=output_file,
+            records=fetcher.report.fetched,
+            failures=len(fetcher.report.failures),
+            duplicates=fetcher.report.duplicates,
+            skipped=fetcher.report.skipped,
+        )
 
     finally:
         fetcher.close()
 
 
-def run_igdb_pipeline(config: Config) -> Path:
+def run_igdb_pipeline(
+    config: Config, resume: bool = False, delta: bool = False
+) -> PipelineResult:
     """Run the IGDB data pipeline."""
     fetcher = IGDBDataFetcher(config)
 
     try:
         logger.info("Starting IGDB data fetch process")
-        output_file = fetcher.fetch_games_to_json(limit=config.fetch_limit)
+        output_file = fetcher.fetch_games_to_json(
+            limit=config.fetch_limit, resume=resume, delta=delta
+        )
         logger.info("IGDB pipeline completed successfully")
-        return output_file
+        return PipelineResult(
+            source="igdb",
+            output_file=output_file,
+            records=fetcher.report.fetched,
+            failures=len(fetcher.report.failures),
+            duplicates=fetcher.report.duplicates,
+            skipped=fetcher.report.skipped,
+        )
 
     finally:
         fetcher.close()
 
 
+SHARD_STEPS = ["plan", "work", "merge"]
+
+
+def run_shard_step(step: str, source: str, config: Config) -> PipelineResult:
+    """
+    Run one step of a sharded fetch for a source
+
+    ``plan`` fills the work queue, ``work`` claims and fetches units until the
+    queue is drained (start as many workers as the rate limits allow, on any
+    host sharing DATA_DIR), and ``merge`` writes the usual output file.
+    """
+    if step == "plan":
+        queue, _ = plan_shards(source, config, config.fetch_limit)
+        try:
+            units = sum(queue.counts().values())
+        finally:
+            queue.close()
+        return PipelineResult(
+            source=source, output_file=shard_dir(config, source), units=units
+        )
+
+    if step == "work":
+        worker = ShardWorker(source, config)
+        try:
+            units = worker.run()
+            return PipelineResult(
+                source=source,
+                output_file=shard_dir(config, source),
+                records=worker.fetched,
+                units=units,
+            )
+        finally:
+            worker.close()
+
+    output_file, report = merge_shards(source, config)
+    return PipelineResult(
+        source=source,
+        output_file=output_file,
+        records=report.fetched,
+        failures=len(report.failures),
+        duplicates=report.duplicates,
+    )
+
+
+PIPELINES: Dict[str, Callable[[Config, bool, bool], PipelineResult]] = {
+    "rawg": run_rawg_pipeline,
+    "igdb": run_igdb_pipeline,
+}
+
+
+def run_timed(
+    source: str,
+    config: Config,
+    resume: bool = False,
+    delta: bool = False,
+    shard: Optional[str] = None,
+) -> PipelineResult:
+    """Run one pipeline, timing it and capturing its error instead of raising."""
+    started = time.perf_counter()
+    try:
+        if shard:
+            result = run_shard_step(shard, source, config)
+        else:
+            result = PIPELINES[source](config, resume, delta)
+    except Exception as e:
+        logger.error(f"{source.upper()} pipeline failed: {e}")
+        result = PipelineResult(source=source, error=e)
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def run_pipelines(
+    config: Config,
+    sources: List[str],
+    resume: bool = False,
+    delta: bool = False,
+    shard: Optional[str] = None,
+) -> List[PipelineResult]:
+    """
+    Run the selected pipelines at the same time, one thread per source
+
+    Each source has its own host, credentials and rate limiter, so they do not
+    slow each other down. Threads are daemonic so Ctrl+C still exits promptly;
+    checkpoints make the interrupted runs resumable.
+    """
+    results: Dict[str, PipelineResult] = {}
+
+    def run(source: str) -> None:
+        results[source] = run_timed(source, config, resume, delta, shard)
+
+    threads = [
+        threading.Thread(
+            target=run, args=(source,), name=f"{source}-pipeline", daemon=True
+        )
+        for source in sources
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return [results[source] for source in sources]
+
+
+def print_summary(results: List[PipelineResult], wall_time: float) -> None:
+    """Print per-source outcomes, record counts and timings."""
+    print("\n📊 Summary")
+    for result in results:
+        name = result.source.upper()
+        if result.error:
+            print(f"  ❌ {name}: failed after {result.seconds:.1f}s: {result.error}")
+            continue
+        details = [
+            f"{count} {label}"
+            for count, label in (
+                (result.units, "work units"),
+                (result.failures, "failed requests"),
+                (result.duplicates, "duplicates dropped"),
+                (result.skipped, "unchanged skipped"),
+            )
+            if count
+        ]
+        extra = "".join(f", {detail}" for detail in details)
+        print(
+            f"  ✅ {name}: {result.records} games in {result.seconds:.1f}s"
+            f"{extra} → {result.output_file}"
+        )
+    total = sum(result.records for result in results)
+    print(f"  ⏱️  {total} games in {wall_time:.1f}s total")
+
+
+def run_summary(results: List[PipelineResult], wall_time: float) -> Dict[str, Any]:
+    """The JSON run summary: per-source outcomes plus the run's metrics."""
+    metrics = get_metrics()
+    sources = {
+        result.source: {
+            "records": result.records,
+            "failures": result.failures,
+            "duplicates": result.duplicates,
+            "skipped": result.skipped,
+            "units": result.units,
+            "seconds": round(result.seconds, 3),
+            "records_per_s": (
+                round(result.records / result.seconds, 1) if result.seconds else 0.0
+            ),
+            "error": str(result.error) if result.error else None,
+        }
+        for result in results
+    }
+    return {
+        "started_at": datetime.fromtimestamp(
+            metrics.started_at, timezone.utc
+        ).isoformat(),
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+        "seconds": round(wall_time, 3),
+        "success": not any(result.error for result in results),
+        "sources": sources,
+        **metrics.summary(),
+    }
+
+
+def export_metrics(
+    config: Config, results: List[PipelineResult], wall_time: float
+) -> None:
+    """
+    Write the run's metrics as a Prometheus textfile and a JSON summary
+
+    Failing to write them is logged but does not fail the run.
+    """
+    metrics = get_metrics()
+    for result in results:
+        metrics.set("run_records", result.records, source=result.source)
+        metrics.set("run_failures", result.failures, source=result.source)
+        metrics.set("run_duration_seconds", result.seconds, source=result.source)
+        metrics.set("run_success", 0 if result.error else 1, source=result.source)
+    metrics.set("last_run_timestamp_seconds", time.time())
+
+    try:
+        if config.metrics_textfile:
+            metrics.write_textfile(Path(config.metrics_textfile))
+            logger.info(f"Wrote Prometheus metrics to {config.metrics_textfile}")
+        if config.metrics_summary:
+            write_summary(Path(config.metrics_summary), run_summary(results, wall_time))
+            logger.info(f"Wrote run summary to {config.metrics_summary}")
+    except OSError as e:
+        logger.error(f"Failed to write metrics: {e}")
+
+
+def run_match(config: Config, paths: List[str]) -> None:
+    """
+    Match RAWG games to IGDB games in existing outputs
+
+    Reads the given RAWG and IGDB files, or the newest of each in DATA_DIR.
+    """
+    if len(paths) not in (0, 2):
+        print("❌ Usage: main.py match [RAWG_FILE IGDB_FILE]")
+        sys.exit(1)
+
+    print("\n🔗 Matching RAWG games to IGDB games...")
+    rawg_path, igdb_path = (Path(path) for path in paths) if paths else (None, None)
+    output_file, report = match_outputs(Path(config.data_dir), rawg_path, igdb_path)
+    print(
+        f"  ✅ {report.matched} matches from {report.rawg_games} RAWG × "
+        f"{report.igdb_games} IGDB games ({report.candidates} pairs scored) "
+        f"in {report.seconds:.1f}s → {output_file}"
+    )
+
+
+def run_similar(config: Config, paths: List[str]) -> None:
+    """
+    Precompute TF-IDF similar games from existing outputs
+
+    Reads the given files, or the newest output of each source in DATA_DIR.
+    """
+    try:
+        from src.sho_da_igram.data.similarity import compute_similar_games
+    except ImportError as e:
+        print(f"❌ {e}")
+        print("💡 Run: uv sync --extra similarity")
+        sys.exit(1)
+
+    print("\n🧮 Computing TF-IDF similar games...")
+    output_file, report = compute_similar_games(
+        Path(config.data_dir),
+        [Path(path) for path in paths],
+        top_k=config.similarity_top_k,
+        min_score=config.similarity_min_score,
+        workers=config.similarity_workers,
+        compression=config.output_compression,
+    )
+    print(
+        f"  ✅ {report.pairs} similar pairs for {report.games} games in "
+        f"{sum(report.timings.values()):.1f}s → {output_file}"
+    )
+
+
+def run_tags(config: Config, paths: List[str]) -> None:
+    """
+    Update the MinHash tag index and write tag-overlap neighbours
+
+    Inserts the given files (such as delta outputs) into the saved index, or
+    rebuilds it from the newest output of each source in DATA_DIR.
+    """
+    print("\n🏷️  Indexing game tags...")
+    output_file, report = update_tag_index(
+        Path(config.data_dir),
+        [Path(path) for path in paths],
+        top_k=config.tag_top_k,
+        min_jaccard=config.tag_min_jaccard,
+        bands=config.tag_lsh_bands,
+        rows=config.tag_lsh_rows,
+        compression=config.output_compression,
+    )
+    print(
+        f"  ✅ {report.pairs} neighbour pairs for {report.games} games "
+        f"({report.candidates} candidate sets scored) in {report.seconds:.1f}s "
+        f"→ {output_file}"
+    )
+
+
 def main():
     """Run the data pipeline."""
     print("🎮 Sho Da Igram - Data Pipeline")
 
     # Get pipeline choice from command line or default to both
-    pipeline_type = sys.argv[1] if len(sys.argv) > 1 else "both"
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    resume = "--resume" in sys.argv[1:]
+    refresh = "--refresh" in sys.argv[1:]
+    delta = "--delta" in sys.argv[1:]
+    shard = next(
+        (arg.split("=", 1)[1] for arg in sys.argv[1:] if arg.startswith("--shard=")),
+        None,
+    )
+    pipeline_type = args[0] if args else "both"
+
+    if pipeline_type not in ["rawg", "igdb", "both", "match", "similar", "tags"]:
+        print(
+            "❌ Invalid pipeline type. Use: rawg, igdb, or both "
+            "[--resume] [--refresh] [--delta] [--shard=plan|work|merge], "
+            "match [RAWG_FILE IGDB_FILE], similar [FILE ...], or tags [FILE ...]"
+        )
+        sys.exit(1)
 
-    if pipeline_type not in ["rawg", "igdb", "both"]:
-        print("❌ Invalid pipeline type. Use: rawg, igdb, or both")
+    if shard is not None and (shard not in SHARD_STEPS or resume or delta):
+        print(
+            "❌ Use --shard=plan, --shard=work or --shard=merge, "
+            "without --resume or --delta"
+        )
         sys.exit(1)
 
     print(f"Running {pipeline_type.upper()} pipeline...")
 
     try:
         config = Config.from_env()
+        if refresh:
+            config.cache_bypass = True
         setup_environment(config)
 
-        if pipeline_type in ["rawg", "both"]:
-            print("\n📥 Fetching game data from RAWG API...")
-            rawg_output = run_rawg_pipeline(config)
-            print(f"✅ RAWG data saved to: {rawg_output}")
+        if pipeline_type == "match":
+            run_match(config, args[1:])
+            return
+        if pipeline_type == "similar":
+            run_similar(config, args[1:])
+            return
+        if pipeline_type == "tags":
+            run_tags(config, args[1:])
+            return
+
+        sources = ["rawg", "igdb"] if pipeline_type == "both" else [pipeline_type]
+        print(f"\n📥 Fetching game data from {', '.join(sources).upper()}...")
+        started = time.perf_counter()
+        results = run_pipelines(config, sources, resume, delta, shard)
+        wall_time = time.perf_counter() - started
+        print_summary(results, wall_time)
+        export_metrics(config, results, wall_time)
 
-        if pipeline_type in ["igdb", "both"]:
-            print("\n📥 Fetching game data from IGDB API...")
-            igdb_output = run_igdb_pipeline(config)
-            print(f"✅ IGDB data saved to: {igdb_output}")
+        errors = [result.error for result in results if result.error]
+        if any(isinstance(error, ValueError) for error in errors):
+            print("💡 Make sure to set required API keys in your .env file")
+        if errors:
+            sys.exit(1)
 
         print("\n🎉 Pipeline(s) completed successfully!")
 
+    except KeyboardInterrupt:
+        logger.warning("Pipeline interrupted")
+        print("\n⏸️  Interrupted. Re-run with --resume to continue from the checkpoint")
+        sys.exit(130)
+
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
         print(f"❌ Configuration error: {e}")
@@ -0,0 +1,46 @@
+"""Helpers for looking up many games by ID"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkLookupResult:
+    """Per-ID outcome of a bulk lookup"""
+
+    found: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    missing: List[int] = field(default_factory=list)
+    failed: Dict[int, str] = field(default_factory=dict)
+
+    def record_chunk(
+        self, ids: List[int], games: List[Dict[str, Any]], id_field: str = "id"
+    ) -> None:
+        """Sort one chunk's response into found and missing IDs."""
+        for game in games:
+            if game.get(id_field) is not None:
+                self.found[int(game[id_field])] = game
+        self.missing.extend(game_id for game_id in ids if game_id not in self.found)
+
+    def record_failure(self, ids: List[int], error: str) -> None:
+        """Mark every ID of a chunk whose request failed."""
+        for game_id in ids:
+            self.failed[game_id] = error
+
+    def summary(self) -> str:
+        """One-line description for logs."""
+        return (
+            f"{len(self.found)} found, {len(self.missing)} missing, "
+            f"{len(self.failed)} failed"
+        )
+
+
+def dedupe_ids(game_ids: Iterable[Any]) -> List[int]:
+    """Normalize IDs to ints and drop duplicates, keeping first-seen order."""
+    return list(dict.fromkeys(int(game_id) for game_id in game_ids))
+
+
+def chunked(items: List[T], size: int) -> List[List[T]]:
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    return [items[start : start + size] for start in range(0, len(items), size)]
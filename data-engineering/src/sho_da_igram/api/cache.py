@@ -0,0 +1,184 @@
+"""On-disk cache for API responses"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+# Request parameters that identify the caller rather than the resource
+UNCACHED_PARAMS = frozenset({"key"})
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace so equivalent IGDB queries share a cache key."""
+    return " ".join(query.split())
+
+
+def make_cache_key(
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    body: Optional[str] = None,
+) -> str:
+    """
+    Build a content-addressed key for a request
+
+    Args:
+      method: HTTP method
+      url: Request URL without query string
+      params: Query parameters; credentials are left out of the key
+      body: Request body, normalized with ``normalize_query``
+
+    Returns:
+      SHA-256 hex digest of the canonical request
+    """
+    canonical = {
+        "method": method.upper(),
+        "url": url,
+        "params": {
+            k: str(v)
+            for k, v in sorted((params or {}).items())
+            if k not in UNCACHED_PARAMS
+        },
+        "body": normalize_query(body) if body is not None else None,
+    }
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache with TTL expiry and LRU eviction
+
+    Bodies are stored as the raw response bytes under a key derived from the
+    request. Entries older than ``ttl`` are treated as misses, and once the
+    cache grows past ``max_bytes`` the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float = 86400.0,
+        max_bytes: int = 512 * 1024 * 1024,
+        bypass: bool = False,
+    ) -> None:
+        """
+        Open (or create) the cache database
+
+        Args:
+          path: SQLite file to store responses in
+          ttl: Seconds an entry stays fresh
+          max_bytes: Total body size to keep before evicting
+          bypass: Skip lookups but still store fresh responses
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+            "ON responses (accessed_at)"
+        )
+        self._size = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+        logger.info(
+            f"Response cache at {self.path} ({self._size / 1_048_576:.1f} MB"
+            f"{', bypassed' if bypass else ''})"
+        )
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a fresh response body
+
+        Returns:
+          Stored body, or None on a miss, an expired entry or when bypassed
+        """
+        if self.bypass:
+            self.misses += 1
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, body: bytes) -> None:
+        """Store a response body, evicting old entries if over the size cap."""
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, body, size, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, body, len(body), now, now),
+            )
+            self._size += len(body) - (previous[0] if previous else 0)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under the size cap."""
+        evicted = 0
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        for key, size in rows:
+            if self._size <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._size -= size
+            evicted += 1
+        logger.debug(f"Evicted {evicted} cached responses")
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._size = 0
+
+    def close(self) -> None:
+        """Close the database, logging the hit rate for this run."""
+        total = self.hits + self.misses
+        if total:
+            logger.info(
+                f"Response cache: {self.hits}/{total} hits "
+                f"({self.hits / total:.0%})"
+            )
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,241 @@
+"""Pools of API credentials, each with its own rate limiter"""
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import httpx
+from loguru import logger
+
+from .rate_limiter import RateLimiter, get_rate_limiter
+
+# Statuses meaning the credential itself was refused
+REJECTED_STATUS_CODES = frozenset({401, 403})
+
+
+class NoCredentialsError(Exception):
+    """Raised when every credential in a pool has been removed"""
+
+
+def fingerprint(values: Dict[str, str]) -> str:
+    """Short, non-reversible ID for a credential, safe to use in names."""
+    encoded = "\n".join(f"{k}={v}" for k, v in sorted(values.items()))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass
+class Credential:
+    """One API key (or key pair) and its usage in this process"""
+
+    label: str
+    values: Dict[str, str]
+    limiter: RateLimiter
+    requests: int = 0
+    throttled: int = 0
+    rejected: int = 0
+    strikes: int = 0
+    removed_until: float = 0.0
+
+    @property
+    def removed_for_good(self) -> bool:
+        """Whether the credential was refused and will not be used again."""
+        return self.removed_until == float("inf")
+
+
+class CredentialPool:
+    """
+    Spreads requests over several credentials of one API
+
+    Every credential has its own token bucket, so throughput grows with the
+    number of keys. Each request goes to the credential that can send
+    soonest. A credential answered with 401/403 ``max_strikes`` times in a
+    row is removed for the rest of the run; one answered with 429 that often
+    is set aside for ``cooldown`` seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        credentials: List[Dict[str, str]],
+        rate_limit: float,
+        burst: int = 1,
+        max_in_flight: int = 1,
+        max_strikes: int = 3,
+        cooldown: float = 300.0,
+    ) -> None:
+        """
+        Initialize the pool
+
+        Args:
+          name: API name used in labels and logs
+          credentials: Request parameters or headers of each credential
+          rate_limit: Average seconds between requests, per credential
+          burst: Requests allowed back to back, per credential
+          max_in_flight: Requests allowed to be open at once, per credential
+          max_strikes: Consecutive 401/403 or 429 answers before removal
+          cooldown: Seconds a throttled credential is set aside
+        """
+        if not credentials:
+            raise ValueError(f"At least one {name} credential is required")
+
+        self.name = name
+        self.max_strikes = max_strikes
+        self.cooldown = cooldown
+        self.credentials = [
+            Credential(
+                label=f"{name}#{index}",
+                values=values,
+                limiter=get_rate_limiter(
+                    f"{name}:{fingerprint(values)}", rate_limit, burst, max_in_flight
+                ),
+            )
+            for index, values in enumerate(credentials, start=1)
+        ]
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of credentials, including removed ones."""
+        return len(self.credentials)
+
+    def pick(self) -> Tuple[Credential, float]:
+        """
+        Choose the credential for the next request and reserve its token
+
+        The token is taken under the pool's lock, so callers picking at the
+        same time see each other's reservations and spread over the keys.
+        Pass the returned time to the credential's ``limiter.acquire``.
+
+        Returns:
+          The active credential whose limiter frees up soonest (if all are
+          cooling down, the one that comes back first) and the time its
+          reserved request may start
+
+        Raises:
+          NoCredentialsError: If every credential was refused
+        """
+        now = time.monotonic()
+        with self._lock:
+            active = [c for c in self.credentials if c.removed_until <= now]
+            if active:
+                credential = min(
+                    active, key=lambda c: (c.limiter.wait_time(), c.requests)
+                )
+            else:
+                cooling = [c for c in self.credentials if not c.removed_for_good]
+                if not cooling:
+                    raise NoCredentialsError(
+                        f"Every {self.name} credential was refused"
+                    )
+                credential = min(cooling, key=lambda c: c.removed_until)
+            return credential, credential.limiter.reserve()
+
+    def observe(self, credential: Credential, response: httpx.Response) -> bool:
+        """
+        Record the response to a request sent with ``credential``
+
+        Args:
+          credential: Credential the request was sent with
+          response: Completed HTTP response
+
+        Returns:
+          True if the credential was refused or throttled and another one is
+          available to re-send the request with right away
+        """
+        throttled = credential.limiter.observe(response)
+        rejected = response.status_code in REJECTED_STATUS_CODES
+        with self._lock:
+            credential.requests += 1
+            if not throttled and not rejected:
+                if response.is_success:
+                    credential.strikes = 0
+                return False
+
+            if rejected:
+                credential.rejected += 1
+            else:
+                credential.throttled += 1
+            credential.strikes += 1
+            if credential.strikes >= self.max_strikes:
+                self._remove(credential, for_good=rejected)
+
+            now = time.monotonic()
+            return any(
+                other is not credential and other.removed_until <= now
+                for other in self.credentials
+            )
+
+    def _remove(self, credential: Credential, for_good: bool) -> None:
+        credential.strikes = 0
+        if for_good:
+            credential.removed_until = float("inf")
+            logger.error(f"Removed {credential.label}: refused {self.max_strikes}x")
+        else:
+            credential.removed_until = time.monotonic() + self.cooldown
+            logger.warning(
+                f"Setting {credential.label} aside for {self.cooldown:.0f}s: "
+                f"throttled {self.max_strikes}x"
+            )
+
+    def usage(self) -> Dict[str, Dict[str, int]]:
+        """Request, throttle and refusal counts per credential label."""
+        with self._lock:
+            return {
+                c.label: {
+                    "requests": c.requests,
+                    "throttled": c.throttled,
+                    "rejected": c.rejected,
+                }
+                for c in self.credentials
+            }
+
+    def log_usage(self) -> None:
+        """Log how much each credential was used during this run."""
+        for credential in self.credentials:
+            if not credential.requests:
+                continue
+            state = " (removed)" if credential.removed_for_good else ""
+            logger.info(
+                f"{credential.label}: {credential.requests} requests, "
+                f"{credential.throttled} throttled, "
+                f"{credential.rejected} refused{state}"
+            )
+
+
+_pools: Dict[Tuple[str, ...], CredentialPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_credential_pool(
+    name: str,
+    credentials: List[Dict[str, str]],
+    rate_limit: float,
+    burst: int = 1,
+    max_in_flight: int = 1,
+    max_strikes: int = 3,
+    cooldown: float = 300.0,
+) -> CredentialPool:
+    """
+    Get the process-wide pool for a set of credentials, creating it on first use
+
+    Sync and async clients built from the same credentials share one pool, so
+    usage counts and removals apply to both.
+    """
+    key = (name, *(fingerprint(values) for values in credentials))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = CredentialPool(
+                name,
+                credentials,
+                rate_limit,
+                burst,
+                max_in_flight,
+                max_strikes,
+                cooldown,
+            )
+            _pools[key] = pool
+            logger.debug(f"Created {name} credential pool with {pool.size} keys")
+        return pool
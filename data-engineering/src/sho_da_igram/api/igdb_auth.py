@@ -0,0 +1,180 @@
+"""IGDB (Twitch) app access tokens, cached on disk and refreshed before expiry"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+from .credentials import Credential
+
+TOKEN_URL = "https://id.twitch.tv/oauth2/token"
+
+
+class TokenProvider:
+    """
+    Hands out a valid app access token for one Twitch client ID
+
+    The token and its expiry are kept in a JSON file shared by every run, so
+    a new token is only requested when the cached one is within
+    ``refresh_margin`` seconds of expiring, or after IGDB refused it.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        cache_path: Path,
+        refresh_margin: float = 600.0,
+    ) -> None:
+        """
+        Load the cached token, if there is one
+
+        Args:
+          client_id: Twitch Client ID
+          client_secret: Twitch Client Secret
+          cache_path: JSON file holding tokens by client ID
+          refresh_margin: Seconds before expiry to fetch a new token
+        """
+        if not client_id or not client_secret:
+            raise ValueError("Client ID and Client Secret must be provided")
+
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.cache_path = Path(cache_path)
+        self.refresh_margin = refresh_margin
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+        cached = self._load_cache().get(client_id)
+        if cached:
+            self._token = cached["access_token"]
+            self._expires_at = cached["expires_at"]
+
+    def token(self) -> str:
+        """
+        Get a token that is valid for at least ``refresh_margin`` more seconds
+
+        Raises:
+          httpx.HTTPError: If a new token was needed and Twitch refused it
+        """
+        with self._lock:
+            if self._token and time.time() < self._expires_at - self.refresh_margin:
+                return self._token
+            return self._refresh()
+
+    def invalidate(self, token: str) -> None:
+        """Drop a token IGDB refused, unless it was already replaced."""
+        with self._lock:
+            if self._token == token:
+                self._expires_at = 0.0
+
+    def refresh(self) -> Tuple[str, float]:
+        """
+        Fetch and cache a new token right away
+
+        Returns:
+          The token and its expiry as a Unix timestamp
+        """
+        with self._lock:
+            return self._refresh(), self._expires_at
+
+    def _refresh(self) -> str:
+        """Request a new token; the caller holds the lock."""
+        response = httpx.post(
+            TOKEN_URL,
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "grant_type": "client_credentials",
+            },
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        token_data = response.json()
+
+        self._token = token_data["access_token"]
+        self._expires_at = time.time() + token_data["expires_in"]
+        self._save_cache()
+        logger.info(
+            f"Refreshed IGDB token for {self.client_id[:6]}..., valid for "
+            f"{token_data['expires_in'] // 3600} hours"
+        )
+        return self._token
+
+    def _load_cache(self) -> Dict[str, Any]:
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable token cache {self.cache_path}: {e}")
+            return {}
+
+    def _save_cache(self) -> None:
+        """Write the token atomically, readable by the owner only."""
+        tokens = self._load_cache()
+        tokens[self.client_id] = {
+            "access_token": self._token,
+            "expires_at": self._expires_at,
+        }
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+            json.dump(tokens, cache_file)
+        os.replace(tmp_path, self.cache_path)
+
+
+def credential_headers(
+    credential: Credential, token_provider: Optional[TokenProvider]
+) -> Dict[str, str]:
+    """Headers for a credential, with a managed token if it has a provider."""
+    if token_provider is None or (
+        credential.values.get("Client-ID") != token_provider.client_id
+    ):
+        return credential.values
+    return {**credential.values, "Authorization": f"Bearer {token_provider.token()}"}
+
+
+def renew_token(
+    headers: Dict[str, str], token_provider: Optional[TokenProvider]
+) -> bool:
+    """
+    Drop a managed token IGDB answered 401 to
+
+    Returns:
+      True if the request should be re-sent once with a fresh token
+    """
+    if token_provider is None or (headers.get("Client-ID") != token_provider.client_id):
+        return False
+    logger.warning("IGDB refused the access token, refreshing it")
+    token_provider.invalidate(headers["Authorization"].removeprefix("Bearer "))
+    return True
+
+
+_providers: Dict[str, TokenProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_token_provider(
+    client_id: str,
+    client_secret: str,
+    cache_path: Path,
+    refresh_margin: float = 600.0,
+) -> TokenProvider:
+    """Get the process-wide token provider for a client ID."""
+    with _providers_lock:
+        provider = _providers.get(client_id)
+        if provider is None:
+            provider = TokenProvider(
+                client_id, client_secret, cache_path, refresh_margin
+            )
+            _providers[client_id] = provider
+        return provider
@@ -0,0 +1,148 @@
+"""Batch concurrent IGDB queries into /multiquery requests"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+DEFAULT_BATCH_WAIT = 0.05
+
+PendingQuery = Tuple[str, str, Future]
+Results = List[List[Dict[str, Any]]]
+
+
+class IGDBQueryBatcher:
+    """
+    Groups queries from concurrent threads into /multiquery requests
+
+    Each caller gets back only its own result. A batch is sent as soon as
+    ``max_size`` queries are pending, or ``max_wait`` seconds after the first
+    one arrived. A failed request fails every query in its batch.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List[Tuple[str, str]]], Results],
+        max_size: int,
+        max_wait: float = DEFAULT_BATCH_WAIT,
+    ) -> None:
+        """
+        Initialize the batcher
+
+        Args:
+          send: Runs (endpoint, query) pairs and returns one result per query,
+            usually the client's ``multiquery``
+          max_size: Queries that fit in one request
+          max_wait: Seconds to wait for more queries before sending a batch
+        """
+        self.send = send
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._pending: List[PendingQuery] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def submit(self, endpoint: str, query: str) -> Future:
+        """Queue a query, returning a future for its result list."""
+        future: Future = Future()
+        batch: List[PendingQuery] = []
+        with self._lock:
+            self._pending.append((endpoint, query, future))
+            if len(self._pending) >= self.max_size:
+                batch = self._take_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_wait, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if batch:
+            self._send(batch)
+        return future
+
+    def query(self, endpoint: str, query: str) -> List[Dict[str, Any]]:
+        """Run a query as part of the next batch and wait for its result."""
+        return self.submit(endpoint, query).result()
+
+    def flush(self) -> None:
+        """Send whatever is pending now."""
+        with self._lock:
+            batch = self._take_pending()
+        if batch:
+            self._send(batch)
+
+    def _take_pending(self) -> List[PendingQuery]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _send(self, batch: List[PendingQuery]) -> None:
+        try:
+            results = self.send([(e, q) for e, q, _ in batch])
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+class AsyncIGDBQueryBatcher:
+    """Asyncio counterpart of ``IGDBQueryBatcher`` for concurrent tasks"""
+
+    def __init__(
+        self,
+        send: Callable[[List[Tuple[str, str]]], Awaitable[Results]],
+        max_size: int,
+        max_wait: float = DEFAULT_BATCH_WAIT,
+    ) -> None:
+        """
+        Initialize the batcher
+
+        Args:
+          send: Coroutine function running (endpoint, query) pairs, usually
+            the client's ``multiquery``
+          max_size: Queries that fit in one request
+          max_wait: Seconds to wait for more queries before sending a batch
+        """
+        self.send = send
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._pending: List[Tuple[str, str, asyncio.Future]] = []
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def query(self, endpoint: str, query: str) -> List[Dict[str, Any]]:
+        """Run a query as part of the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((endpoint, query, future))
+        if len(self._pending) >= self.max_size:
+            self.flush()
+        elif self._handle is None:
+            self._handle = loop.call_later(self.max_wait, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Start sending whatever is pending now."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._send(batch))
+            # Keep a reference so the task is not garbage collected mid-flight
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[str, str, asyncio.Future]]) -> None:
+        try:
+            results = await self.send([(e, q) for e, q, _ in batch])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
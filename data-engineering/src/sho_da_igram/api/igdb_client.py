@@ -1,19 +1,380 @@
 """IGDB API client"""
 
+import asyncio
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import httpx
 from loguru import logger
 
+from ..utils import codec
+from ..utils.utils import IGDBDataHandler
+from .bulk import BulkLookupResult, chunked, dedupe_ids
+from .cache import ResponseCache
+from .credentials import CredentialPool, get_credential_pool
+from .igdb_auth import TokenProvider
+from .igdb_batcher import DEFAULT_BATCH_WAIT, AsyncIGDBQueryBatcher, IGDBQueryBatcher
+from .retry import RetryPolicy, describe_error
+from .transport import ApiTransport
+
 BASE_API_URL = "https://api.igdb.com/v4"
+MAX_QUERY_LIMIT = 500
+MAX_MULTIQUERY_SIZE = 10
+
+# Fields requested when listing top games
+TOP_GAMES_FIELDS = """\
+        name,
+        slug,
+        summary,
+        storyline,
+        first_release_date,
+        rating,
+        rating_count,
+        total_rating,
+        total_rating_count,
+        url,
+        cover.image_id,
+        cover.url,
+        cover.width,
+        cover.height,
+        screenshots.image_id,
+        screenshots.url,
+        artworks.image_id,
+        artworks.url,
+        genres.name,
+        genres.slug,
+        platforms.name,
+        platforms.slug,
+        platforms.platform_family,
+        themes.name,
+        themes.slug,
+        game_modes.name,
+        game_modes.slug,
+        age_ratings.rating,
+        age_ratings.category,
+        age_ratings.content_descriptions.description,
+        franchises.name,
+        franchises.slug,
+        collection.name,
+        collection.slug,
+        similar_games.name,
+        similar_games.slug,
+        keywords.name,
+        keywords.slug,
+        player_perspectives.name,
+        player_perspectives.slug,
+        game_engines.name,
+        game_engines.slug,
+        involved_companies.company.name,
+        involved_companies.developer,
+        involved_companies.publisher,
+        release_dates.date,
+        release_dates.region,
+        release_dates.platform.name,
+        updated_at;"""
+
+# Fields a game needs to be ranked, deduplicated and matched across sources
+MINIMAL_FIELDS = (
+    "name",
+    "slug",
+    "first_release_date",
+    "rating",
+    "rating_count",
+    "total_rating",
+    "total_rating_count",
+    "updated_at",
+)
+
+
+def format_fields(fields: Iterable[str]) -> str:
+    """Lay out field paths as the body of an Apicalypse ``fields`` clause."""
+    return ",\n".join(f"        {field}" for field in fields) + ";"
+
+
+# Field lists by profile name: "recommendation" is exactly what the IGDB data
+# handler consumes, "full" is everything the pipeline has historically pulled
+FIELD_PROFILES = {
+    "minimal": format_fields(MINIMAL_FIELDS),
+    "recommendation": format_fields(IGDBDataHandler.CONSUMED_FIELDS),
+    "full": TOP_GAMES_FIELDS,
+}
+DEFAULT_FIELD_PROFILE = "recommendation"
+
+
+def profile_fields(profile: str) -> str:
+    """
+    Get the ``fields`` clause of a named profile
+
+    Raises:
+      ValueError: If the profile is unknown
+    """
+    try:
+        return FIELD_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown IGDB field profile {profile!r}, "
+            f"use one of {', '.join(FIELD_PROFILES)}"
+        ) from None
+
+
+@dataclass
+class PayloadStats:
+    """
+    Bytes and JSON parse time of IGDB responses for one field profile
+
+    ``bytes_received`` and ``records`` only count responses from the network;
+    parse time includes cached responses too.
+    """
+
+    profile: str
+    responses: int = 0
+    cached: int = 0
+    bytes_received: int = 0
+    records: int = 0
+    parse_seconds: float = 0.0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def parse(self, body: bytes, from_cache: bool = False) -> Any:
+        """Decode a response body, recording its size and parse time."""
+        started = time.perf_counter()
+        data = codec.loads(body)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.responses += 1
+            self.parse_seconds += elapsed
+            if from_cache:
+                self.cached += 1
+            else:
+                self.bytes_received += len(body)
+                self.records += count_records(data)
+        return data
+
+    def summary(self) -> str:
+        """One-line description for logs."""
+        per_record = self.bytes_received / max(1, self.records)
+        return (
+            f"IGDB '{self.profile}' profile: {self.bytes_received / 1_048_576:.2f} MB "
+            f"for {self.records} games (~{per_record:.0f} B/game), "
+            f"{self.responses} responses ({self.cached} cached), "
+            f"{self.parse_seconds:.2f}s parsing"
+        )
+
+
+def count_records(data: Any) -> int:
+    """Count games in a query or /multiquery response."""
+    if not isinstance(data, list):
+        return 0
+    if data and isinstance(data[0], dict) and "result" in data[0]:
+        return sum(len(part.get("result", [])) for part in data)
+    return len(data)
+
+
+def build_top_games_query(
+    limit: int,
+    offset: int,
+    min_rating: int,
+    updated_since: Optional[int] = None,
+    fields: str = FIELD_PROFILES[DEFAULT_FIELD_PROFILE],
+) -> str:
+    """Build the Apicalypse query for a window of top-rated games."""
+    request_limit = min(limit, MAX_QUERY_LIMIT)
+    updated_filter = f" & updated_at > {updated_since}" if updated_since else ""
+
+    return f"""
+    fields
+{fields}
+    where rating >= {min_rating} & rating_count >= 10{updated_filter};
+    sort total_rating_count desc;
+    limit {request_limit};
+    offset {offset};
+    """
+
+
+@dataclass
+class ReleasePartition:
+    """A slice of the catalog by first release date, from ``start`` to ``end``"""
+
+    label: str
+    start: Optional[int] = None
+    end: Optional[int] = None
+    undated: bool = False
+
+    def where_clause(self) -> str:
+        """Apicalypse condition selecting this partition's games."""
+        if self.undated:
+            return "first_release_date = null"
+        conditions = []
+        if self.start is not None:
+            conditions.append(f"first_release_date >= {self.start}")
+        if self.end is not None:
+            conditions.append(f"first_release_date < {self.end}")
+        return " & ".join(conditions)
+
+
+def release_year_partitions(
+    span_years: int, first_year: int = 1980, last_year: Optional[int] = None
+) -> List[ReleasePartition]:
+    """
+    Split the catalog into release date ranges of ``span_years`` years
+
+    Covers everything before ``first_year``, each span up to ``last_year``
+    (the current year by default), everything after, and undated games.
+    """
+    last_year = last_year or datetime.now(timezone.utc).year
+
+    def year_start(year: int) -> int:
+        return int(datetime(year, 1, 1, tzinfo=timezone.utc).timestamp())
+
+    partitions = [ReleasePartition(f"<{first_year}", end=year_start(first_year))]
+    for year in range(first_year, last_year + 1, max(1, span_years)):
+        end_year = min(year + span_years, last_year + 1)
+        partitions.append(
+            ReleasePartition(
+                f"{year}-{end_year - 1}", year_start(year), year_start(end_year)
+            )
+        )
+    partitions[-1].end = None
+    partitions[-1].label = f"{partitions[-1].label.split('-')[0]}+"
+    partitions.append(ReleasePartition("undated", undated=True))
+    return partitions
+
+
+def build_partition_query(
+    partition: ReleasePartition,
+    cursor: int,
+    min_rating: int,
+    updated_since: Optional[int] = None,
+    fields: str = FIELD_PROFILES[DEFAULT_FIELD_PROFILE],
+) -> str:
+    """
+    Build the Apicalypse query for the next page of a release date partition
+
+    Pages by ``id`` rather than offset, so deep pages stay cheap and results do
+    not shift as ratings change between requests.
+    """
+    updated_filter = f" & updated_at > {updated_since}" if updated_since else ""
+
+    return f"""
+    fields
+{fields}
+    where rating >= {min_rating} & rating_count >= 10 & {partition.where_clause()}
+        & id > {cursor}{updated_filter};
+    sort id asc;
+    limit {MAX_QUERY_LIMIT};
+    """
+
+
+def build_game_by_id_query(
+    game_id: int, fields: str = FIELD_PROFILES[DEFAULT_FIELD_PROFILE]
+) -> str:
+    """Build the Apicalypse query for a single game lookup."""
+    return f"""
+    fields
+{fields}
+    where id = {game_id};
+    """
+
+
+def build_games_by_ids_query(
+    game_ids: List[int], fields: str = FIELD_PROFILES[DEFAULT_FIELD_PROFILE]
+) -> str:
+    """Build the Apicalypse query for up to 500 games by ID."""
+    if len(game_ids) > MAX_QUERY_LIMIT:
+        raise ValueError(f"A query can look up at most {MAX_QUERY_LIMIT} IDs")
+    id_list = ",".join(str(game_id) for game_id in game_ids)
+
+    return f"""
+    fields
+{fields}
+    where id = ({id_list});
+    limit {MAX_QUERY_LIMIT};
+    """
+
+
+def build_search_query(search_term: str, limit: int) -> str:
+    """Build the Apicalypse query for a name search."""
+    escaped_term = search_term.replace('"', '\\"')
+
+    return f"""
+    search "{escaped_term}";
+    fields
+        name,
+        slug,
+        summary,
+        first_release_date,
+        rating,
+        rating_count,
+        cover.image_id,
+        cover.url,
+        genres.name,
+        platforms.name;
+    limit {limit};
+    """
+
+
+def build_multiquery(queries: List[Tuple[str, str]]) -> str:
+    """
+    Build a /multiquery body from (endpoint, query) pairs
+
+    Sub-queries are named by their position (``q0``, ``q1``, ...) so results can
+    be matched back to their callers.
+    """
+    if len(queries) > MAX_MULTIQUERY_SIZE:
+        raise ValueError(f"A multiquery holds at most {MAX_MULTIQUERY_SIZE} queries")
+    return "\n".join(
+        f'query {endpoint} "q{index}" {{ {query.strip()} }};'
+        for index, (endpoint, query) in enumerate(queries)
+    )
+
+
+def unpack_multiquery(
+    response: List[Dict[str, Any]], size: int
+) -> List[List[Dict[str, Any]]]:
+    """
+    Split a /multiquery response into one result list per sub-query
+
+    Raises:
+      ValueError: If a sub-query's result is missing from the response
+    """
+    results = {item.get("name"): item.get("result", []) for item in response}
+    try:
+        return [results[f"q{index}"] for index in range(size)]
+    except KeyError as e:
+        raise ValueError(f"IGDB multiquery response is missing {e}") from e
+
+
+def build_auth_headers(client_id: str, access_token: str) -> Dict[str, str]:
+    """Build the headers IGDB expects on every request."""
+    return {
+        "Client-ID": client_id,
+        "Authorization": f"Bearer {access_token}",
+        "Accept": "application/json",
+    }
 
 
 class IGDBClient:
     """Client for interacting with IGDB API"""
 
     def __init__(
-        self, client_id: str, access_token: str, rate_limit: float = 0.25
+        self,
+        client_id: str,
+        access_token: str,
+        rate_limit: float = 0.25,
+        burst: int = 4,
+        max_in_flight: int = 8,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        credentials: Optional[CredentialPool] = None,
+        token_provider: Optional[TokenProvider] = None,
+        field_profile: str = DEFAULT_FIELD_PROFILE,
+        payload_stats: Optional[PayloadStats] = None,
+        base_url: str = BASE_API_URL,
+        batch_wait: float = DEFAULT_BATCH_WAIT,
     ) -> None:
         """
         Initialize the client
@@ -21,70 +382,85 @@ class IGDBClient:
         Args:
           client_id: Twitch Client ID
           access_token: Twitch Access Token
-          rate_limit: Seconds to wait between requests
+          rate_limit: Average seconds between requests
+          burst: Requests allowed back to back after an idle period
+          max_in_flight: Requests allowed to be open at once
+          retry_policy: Retry and circuit breaker settings
+          cache: Cache for query responses (optional)
+          credentials: Client ID and token pairs to rotate requests across;
+            defaults to a pool holding only ``client_id``/``access_token``
+          token_provider: Supplies and renews the token for its client ID,
+            replacing the static ``access_token`` for that client
+          field_profile: Named field list for game queries (see FIELD_PROFILES)
+          payload_stats: Shared response size and parse time counters
+          base_url: API root, overridable for proxies and mock servers
+          batch_wait: Seconds a single-game lookup or search waits for
+            concurrent ones to share its /multiquery request
         """
-        if not client_id or not access_token:
+        if not credentials and not (client_id and (access_token or token_provider)):
             raise ValueError("Client ID and Access Token must be provided")
 
-        self.base_url = BASE_API_URL
+        self.base_url = base_url.rstrip("/")
         self.client_id = client_id
         self.access_token = access_token
         self.rate_limit = rate_limit
-        self._last_request_time = 0.0
-
-        self.client = httpx.Client(
-            timeout=30.0,
-            headers={
-                "Client-ID": client_id,
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json",
-            },
+        self.cache = cache
+        self.fields = profile_fields(field_profile)
+        self.payload = payload_stats or PayloadStats(field_profile)
+        self.token_provider = token_provider
+        self.transport = ApiTransport(
+            "igdb",
+            self.base_url,
+            credentials
+            or get_credential_pool(
+                "igdb",
+                [build_auth_headers(client_id, access_token)],
+                rate_limit,
+                burst,
+                max_in_flight,
+            ),
+            retry_policy,
+            cache,
+            token_provider,
+            credentials_in="headers",
         )
 
-        logger.info(f"Initialized IGDB client with rate limit: {rate_limit}s")
+        self.client = httpx.Client(timeout=30.0)
+        self.batcher = IGDBQueryBatcher(
+            self.multiquery, MAX_MULTIQUERY_SIZE, batch_wait
+        )
 
-    def _wait_for_rate_limit(self) -> None:
-        """Ensure we respect the rate limit"""
-        time_since_last = time.time() - self._last_request_time
-        if time_since_last < self.rate_limit:
-            wait_time = self.rate_limit - time_since_last
-            logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
-            time.sleep(wait_time)
-        self._last_request_time = time.time()
+        logger.info(f"Initialized IGDB client with rate limit: {rate_limit}s")
 
-    def _make_request(self, endpoint: str, query: str) -> List[Dict[str, Any]]:
+    def _make_request(
+        self, endpoint: str, query: str, refresh: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Make a request to the API
 
         Args:
           endpoint: API endpoint to call
           query: IGDB query string
+          refresh: Skip a cached response but still store the new one
 
         Returns:
           List of JSON response data
 
         Raises:
-          httpx.HTTPError: If request fails
-          Exception: For any other errors
+          httpx.HTTPError: If the request failed after retries
+          CircuitOpenError: If IGDB's circuit breaker is open
         """
-        self._wait_for_rate_limit()
-
-        url = f"{self.base_url}/{endpoint}"
-
-        try:
-            response = self.client.post(url, content=query)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"IGDB request failed for {endpoint}: {e}")
-            logger.error(f"Query was: {query}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error for {endpoint}: {e}")
-            raise
+        request = self.transport.build("POST", endpoint, content=query, cacheable=True)
+        body, from_cache = self.transport.send(self.client, request, refresh)
+        return self.payload.parse(body, from_cache=from_cache)
 
     def get_top_games(
-        self, limit: int = 100, offset: int = 0, min_rating: int = 70
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        min_rating: int = 70,
+        updated_since: Optional[int] = None,
+        refresh: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Get top-rated games with comprehensive data
@@ -93,129 +469,77 @@ class IGDBClient:
           limit: Number of games to retrieve (max 500 per request)
           offset: Offset for pagination
           min_rating: Minimum rating threshold
+          updated_since: Only games updated after this Unix timestamp (optional)
+          refresh: Skip a cached response but still store the new one
 
         Returns:
           List of game data dictionaries
         """
-        request_limit = min(limit, 500)
-
-        query = f"""
-        fields
-            name,
-            slug,
-            summary,
-            storyline,
-            first_release_date,
-            rating,
-            rating_count,
-            total_rating,
-            total_rating_count,
-            url,
-            cover.image_id,
-            cover.url,
-            cover.width,
-            cover.height,
-            screenshots.image_id,
-            screenshots.url,
-            artworks.image_id,
-            artworks.url,
-            genres.name,
-            genres.slug,
-            platforms.name,
-            platforms.slug,
-            platforms.platform_family,
-            themes.name,
-            themes.slug,
-            game_modes.name,
-            game_modes.slug,
-            age_ratings.rating,
-            age_ratings.category,
-            age_ratings.content_descriptions.description,
-            franchises.name,
-            franchises.slug,
-            collection.name,
-            collection.slug,
-            similar_games.name,
-            similar_games.slug,
-            keywords.name,
-            keywords.slug,
-            player_perspectives.name,
-            player_perspectives.slug,
-            game_engines.name,
-            game_engines.slug,
-            involved_companies.company.name,
-            involved_companies.developer,
-            involved_companies.publisher,
-            release_dates.date,
-            release_dates.region,
-            release_dates.platform.name;
-        where rating >= {min_rating} & rating_count >= 10;
-        sort total_rating_count desc;
-        limit {request_limit};
-        offset {offset};
-        """
-
-        return self._make_request("games", query)
+        query = build_top_games_query(
+            limit, offset, min_rating, updated_since, self.fields
+        )
+        return self._make_request("games", query, refresh)
 
     def get_game_by_id(self, game_id: int) -> Optional[Dict[str, Any]]:
         """
         Get detailed game information by IGDB ID
 
+        Lookups from concurrent threads are batched into /multiquery requests.
+
         Args:
             game_id: IGDB game ID
 
         Returns:
             Game data dictionary or None if not found
         """
-        query = f"""
-        fields
-            name,
-            slug,
-            summary,
-            storyline,
-            first_release_date,
-            rating,
-            rating_count,
-            total_rating,
-            total_rating_count,
-            url,
-            cover.image_id,
-            cover.url,
-            screenshots.image_id,
-            screenshots.url,
-            genres.name,
-            genres.slug,
-            platforms.name,
-            platforms.slug,
-            themes.name,
-            themes.slug,
-            game_modes.name,
-            game_modes.slug,
-            age_ratings.rating,
-            age_ratings.category,
-            franchises.name,
-            franchises.slug,
-            similar_games.name,
-            similar_games.slug,
-            keywords.name,
-            keywords.slug,
-            player_perspectives.name,
-            player_perspectives.slug,
-            game_engines.name,
-            game_engines.slug,
-            involved_companies.company.name,
-            involved_companies.developer,
-            involved_companies.publisher;
-        where id = {game_id};
-        """
-
-        results = self._make_request("games", query)
+        query = build_game_by_id_query(game_id, self.fields)
+        results = self.batcher.query("games", query)
         return results[0] if results else None
 
+    def get_games_by_ids(
+        self, game_ids: Iterable[int], refresh: bool = False
+    ) -> BulkLookupResult:
+        """
+        Look up many games by IGDB ID
+
+        IDs are deduplicated and queried 500 at a time, with up to 10 of those
+        queries packed into each /multiquery request.
+
+        Args:
+            game_ids: IGDB game IDs, in any number
+            refresh: Skip cached responses but still store the new ones
+
+        Returns:
+            Games found per ID, IDs IGDB does not know, and IDs whose request
+            failed after retries
+        """
+        ids = dedupe_ids(game_ids)
+        groups = chunked(chunked(ids, MAX_QUERY_LIMIT), MAX_MULTIQUERY_SIZE)
+        result = BulkLookupResult()
+
+        for group in groups:
+            queries = [
+                ("games", build_games_by_ids_query(chunk, self.fields))
+                for chunk in group
+            ]
+            try:
+                responses = self.multiquery(queries, refresh)
+            except Exception as e:
+                for chunk in group:
+                    result.record_failure(chunk, describe_error(e))
+                continue
+            for chunk, games in zip(group, responses):
+                result.record_chunk(chunk, games)
+
+        logger.info(f"IGDB lookup of {len(ids)} IDs: {result.summary()}")
+        return result
+
     def search_games(self, search_term: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Search for games by name
 
+        Searches from concurrent threads are batched into /multiquery requests.
+
         Args:
             search_term: Search query
             limit: Maximum results to return
@@ -223,26 +547,237 @@ class IGDBClient:
         Returns:
             List of matching games
         """
-        escaped_term = search_term.replace('"', '\\"')
+        return self.batcher.query("games", build_search_query(search_term, limit))
 
-        query = f"""
-        search "{escaped_term}";        fields
-            name,
-            slug,
-            summary,
-            first_release_date,
-            rating,
-            rating_count,
-            cover.image_id,
-            cover.url,
-            genres.name,
-            platforms.name;
-        limit {limit};
+    def multiquery(
+        self, queries: List[Tuple[str, str]], refresh: bool = False
+    ) -> List[List[Dict[str, Any]]]:
         """
+        Run several queries in as few requests as possible
 
-        return self._make_request("games", query)
+        Queries are sent through /multiquery in groups of up to 10, each group
+        costing a single rate limit slot. A lone query goes to its own endpoint.
+
+        Args:
+          queries: (endpoint, query) pairs
+          refresh: Skip cached responses but still store the new ones
+
+        Returns:
+          One result list per query, in the same order
+        """
+        results: List[List[Dict[str, Any]]] = []
+        for start in range(0, len(queries), MAX_MULTIQUERY_SIZE):
+            group = queries[start : start + MAX_MULTIQUERY_SIZE]
+            if len(group) == 1:
+                results.append(self._make_request(*group[0], refresh))
+                continue
+            response = self._make_request(
+                "multiquery", build_multiquery(group), refresh
+            )
+            results.extend(unpack_multiquery(response, len(group)))
+        return results
 
     def close(self) -> None:
         """Close the HTTP client"""
         self.client.close()
         logger.debug("IGDB client closed")
+
+
+class AsyncIGDBClient:
+    """Asyncio client for interacting with IGDB API"""
+
+    def __init__(
+        self,
+        client_id: str,
+        access_token: str,
+        rate_limit: float = 0.25,
+        burst: int = 4,
+        max_in_flight: int = 8,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        credentials: Optional[CredentialPool] = None,
+        token_provider: Optional[TokenProvider] = None,
+        field_profile: str = DEFAULT_FIELD_PROFILE,
+        payload_stats: Optional[PayloadStats] = None,
+        base_url: str = BASE_API_URL,
+        batch_wait: float = DEFAULT_BATCH_WAIT,
+    ) -> None:
+        """
+        Initialize the async client
+
+        Shares the credential pool and its limiters with IGDBClient, so several
+        requests can be in flight at once while each key's rate is respected.
+
+        Args:
+          client_id: Twitch Client ID
+          access_token: Twitch Access Token
+          rate_limit: Average seconds between requests
+          burst: Requests allowed back to back after an idle period
+          max_in_flight: Requests allowed to be open at once
+          retry_policy: Retry and circuit breaker settings
+          cache: Cache for query responses (optional)
+          credentials: Client ID and token pairs to rotate requests across;
+            defaults to a pool holding only ``client_id``/``access_token``
+          token_provider: Supplies and renews the token for its client ID,
+            replacing the static ``access_token`` for that client
+          field_profile: Named field list for game queries (see FIELD_PROFILES)
+          payload_stats: Shared response size and parse time counters
+          base_url: API root, overridable for proxies and mock servers
+          batch_wait: Seconds a single-game lookup or search waits for
+            concurrent ones to share its /multiquery request
+        """
+        if not credentials and not (client_id and (access_token or token_provider)):
+            raise ValueError("Client ID and Access Token must be provided")
+
+        self.base_url = base_url.rstrip("/")
+        self.client_id = client_id
+        self.access_token = access_token
+        self.rate_limit = rate_limit
+        self.cache = cache
+        self.fields = profile_fields(field_profile)
+        self.payload = payload_stats or PayloadStats(field_profile)
+        self.token_provider = token_provider
+        self.transport = ApiTransport(
+            "igdb",
+            self.base_url,
+            credentials
+            or get_credential_pool(
+                "igdb",
+                [build_auth_headers(client_id, access_token)],
+                rate_limit,
+                burst,
+                max_in_flight,
+            ),
+            retry_policy,
+            cache,
+            token_provider,
+            credentials_in="headers",
+        )
+
+        self.client = httpx.AsyncClient(timeout=30.0)
+        self.batcher = AsyncIGDBQueryBatcher(
+            self.multiquery, MAX_MULTIQUERY_SIZE, batch_wait
+        )
+
+        logger.info(f"Initialized async IGDB client with rate limit: {rate_limit}s")
+
+    async def __aenter__(self) -> "AsyncIGDBClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _make_request(
+        self, endpoint: str, query: str, refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Make a request to the API
+
+        Args:
+          endpoint: API endpoint to call
+          query: IGDB query string
+          refresh: Skip a cached response but still store the new one
+
+        Returns:
+          List of JSON response data
+
+        Raises:
+          httpx.HTTPError: If the request failed after retries
+          CircuitOpenError: If IGDB's circuit breaker is open
+        """
+        request = self.transport.build("POST", endpoint, content=query, cacheable=True)
+        body, from_cache = await self.transport.send_async(
+            self.client, request, refresh
+        )
+        return self.payload.parse(body, from_cache=from_cache)
+
+    async def get_top_games(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        min_rating: int = 70,
+        updated_since: Optional[int] = None,
+        refresh: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Get top-rated games with comprehensive data."""
+        query = build_top_games_query(
+            limit, offset, min_rating, updated_since, self.fields
+        )
+        return await self._make_request("games", query, refresh)
+
+    async def get_game_by_id(self, game_id: int) -> Optional[Dict[str, Any]]:
+        """Get detailed game information by IGDB ID, batched across tasks."""
+        query = build_game_by_id_query(game_id, self.fields)
+        results = await self.batcher.query("games", query)
+        return results[0] if results else None
+
+    async def get_games_by_ids(
+        self, game_ids: Iterable[int], refresh: bool = False
+    ) -> BulkLookupResult:
+        """Look up many games by IGDB ID with concurrent /multiquery requests."""
+        ids = dedupe_ids(game_ids)
+        groups = chunked(chunked(ids, MAX_QUERY_LIMIT), MAX_MULTIQUERY_SIZE)
+        result = BulkLookupResult()
+
+        responses = await asyncio.gather(
+            *(
+                self.multiquery(
+                    [
+                        ("games", build_games_by_ids_query(chunk, self.fields))
+                        for chunk in group
+                    ],
+                    refresh,
+                )
+                for group in groups
+            ),
+            return_exceptions=True,
+        )
+        for group, response in zip(groups, responses):
+            if isinstance(response, BaseException):
+                for chunk in group:
+                    result.record_failure(chunk, describe_error(response))
+                continue
+            for chunk, games in zip(group, response):
+                result.record_chunk(chunk, games)
+
+        logger.info(f"IGDB lookup of {len(ids)} IDs: {result.summary()}")
+        return result
+
+    async def search_games(
+        self, search_term: str, limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Search for games by name, batched across tasks."""
+        return await self.batcher.query("games", build_search_query(search_term, limit))
+
+    async def multiquery(
+        self, queries: List[Tuple[str, str]], refresh: bool = False
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several queries in as few requests as possible, concurrently."""
+        groups = [
+            queries[start : start + MAX_MULTIQUERY_SIZE]
+            for start in range(0, len(queries), MAX_MULTIQUERY_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *(
+                (
+                    self._make_request(*group[0], refresh)
+                    if len(group) == 1
+                    else self._make_request(
+                        "multiquery", build_multiquery(group), refresh
+                    )
+                )
+                for group in groups
+            )
+        )
+        results: List[List[Dict[str, Any]]] = []
+        for group, response in zip(groups, responses):
+            if len(group) == 1:
+                results.append(response)
+            else:
+                results.extend(unpack_multiquery(response, len(group)))
+        return results
+
+    async def close(self) -> None:
+        """Close the HTTP client"""
+        await self.client.aclose()
+        logger.debug("Async IGDB client closed")
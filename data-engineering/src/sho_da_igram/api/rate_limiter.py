@@ -0,0 +1,236 @@
+"""Shared rate limiting for API clients"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+from ..utils.metrics import get_metrics
+
+DEFAULT_THROTTLE_BACKOFF = 5.0
+MIN_RATE_FRACTION = 0.1
+RECOVERY_FRACTION = 0.05
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """Token bucket with an in-flight cap and adaptive backoff on 429s"""
+
+    def __init__(
+        self,
+        name: str,
+        rate_limit: float,
+        burst: int = 1,
+        max_in_flight: int = 1,
+    ) -> None:
+        """
+        Initialize the limiter
+
+        Args:
+          name: Identifier used in logs, usually the API host
+          rate_limit: Average seconds between requests (1 / requests per second)
+          burst: Requests that may start back to back after an idle period
+          max_in_flight: Requests allowed to be open at the same time
+        """
+        if burst < 1 or max_in_flight < 1:
+            raise ValueError("Burst and max in-flight must be at least 1")
+
+        self.name = name
+        self.base_rate = 1.0 / rate_limit if rate_limit > 0 else float("inf")
+        self.rate = self.base_rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._async_in_flight: Optional[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        ] = None
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait to use it."""
+        with self._lock:
+            now = time.monotonic()
+            if self.rate == float("inf"):
+                return max(0.0, self._blocked_until - now)
+
+            elapsed = now - self._updated_at
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+            # Tokens may go negative: each caller reserves the next free slot
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def reserve(self) -> float:
+        """
+        Take one token now, to be spent later by ``acquire``
+
+        Returns:
+            Monotonic time at which the reserved request may start
+        """
+        return time.monotonic() + self._reserve()
+
+    def wait_time(self) -> float:
+        """Seconds the next request would wait, without reserving a token."""
+        with self._lock:
+            now = time.monotonic()
+            blocked = max(0.0, self._blocked_until - now)
+            if self.rate == float("inf"):
+                return blocked
+            tokens = min(
+                float(self.burst), self._tokens + (now - self._updated_at) * self.rate
+            )
+            wait = (1.0 - tokens) / self.rate if tokens < 1.0 else 0.0
+            return max(wait, blocked)
+
+    def _async_semaphore(self) -> asyncio.Semaphore:
+        """Get the in-flight semaphore bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_in_flight is None or self._async_in_flight[0] is not loop:
+            self._async_in_flight = (loop, asyncio.Semaphore(self.max_in_flight))
+        return self._async_in_flight[1]
+
+    def _record_wait(self, wait: float) -> None:
+        metrics = get_metrics()
+        metrics.inc("rate_limit_waits_total", limiter=self.name)
+        metrics.inc("rate_limit_wait_seconds_total", wait, limiter=self.name)
+
+    def _wait_for(self, ready_at: Optional[float]) -> float:
+        """Wait for a token reserved earlier, or reserve one now."""
+        if ready_at is None:
+            return self._reserve()
+        return max(0.0, ready_at - time.monotonic())
+
+    @contextmanager
+    def acquire(self, ready_at: Optional[float] = None) -> Iterator[None]:
+        """
+        Block until a request may start and hold an in-flight slot
+
+        Args:
+          ready_at: Time returned by ``reserve`` when the token was already
+            taken; by default a token is reserved here
+        """
+        with self._in_flight:
+            wait = self._wait_for(ready_at)
+            if wait > 0:
+                logger.debug(f"Rate limiting {self.name}: waiting {wait:.2f}s")
+                self._record_wait(wait)
+                time.sleep(wait)
+            yield
+
+    @asynccontextmanager
+    async def acquire_async(
+        self, ready_at: Optional[float] = None
+    ) -> AsyncIterator[None]:
+        """Async counterpart of ``acquire`` for use inside an event loop."""
+        async with self._async_semaphore():
+            wait = self._wait_for(ready_at)
+            if wait > 0:
+                logger.debug(f"Rate limiting {self.name}: waiting {wait:.2f}s")
+                self._record_wait(wait)
+                await asyncio.sleep(wait)
+            yield
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """
+        Back off after the server answered 429
+
+        Pauses every caller until Retry-After has passed and halves the
+        request rate; ``on_success`` restores it gradually.
+        """
+        delay = retry_after if retry_after is not None else DEFAULT_THROTTLE_BACKOFF
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+            if self.rate != float("inf"):
+                self.rate = max(self.base_rate * MIN_RATE_FRACTION, self.rate / 2)
+                self._tokens = min(self._tokens, 0.0)
+        logger.warning(
+            f"{self.name} throttled: pausing {delay:.2f}s, "
+            f"rate now {self.rate:.2f} req/s"
+        )
+
+    def on_success(self) -> None:
+        """Recover the request rate after a successful response."""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            self.rate = min(
+                self.base_rate, self.rate + self.base_rate * RECOVERY_FRACTION
+            )
+
+    def observe(self, response: httpx.Response) -> bool:
+        """
+        Feed a response back into the limiter
+
+        Args:
+          response: Completed HTTP response
+
+        Returns:
+          True if the response was a 429 and the request should be re-sent
+        """
+        if response.status_code == 429:
+            self.on_throttled(parse_retry_after(response.headers.get("Retry-After")))
+            return True
+        if response.is_success:
+            self.on_success()
+        return False
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str, rate_limit: float, burst: int = 1, max_in_flight: int = 1
+) -> RateLimiter:
+    """
+    Get the process-wide limiter for ``name``, creating it on first use
+
+    Clients talking to the same host share one bucket, so sync and async
+    clients created side by side still respect a single rate.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = RateLimiter(name, rate_limit, burst, max_in_flight)
+            _limiters[name] = limiter
+            logger.debug(
+                f"Created rate limiter for {name}: {limiter.base_rate:.2f} req/s, "
+                f"burst {burst}, max in flight {max_in_flight}"
+            )
+        return limiter
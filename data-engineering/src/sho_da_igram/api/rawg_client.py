@@ -1,45 +1,88 @@
 """RAWG API Client for fetching video game data"""
 
-import time
 from typing import Any, Dict, Optional
 
 import httpx
 from loguru import logger
 
+from ..utils import codec
+from .cache import ResponseCache
+from .credentials import CredentialPool, get_credential_pool
+from .retry import RetryPolicy
+from .transport import ApiTransport
+
 BASE_API_URL = "https://api.rawg.io/api"
+MAX_PAGE_SIZE = 40
+
+
+def build_games_page_params(
+    page: int, page_size: int, filters: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build query parameters for one page of the games list."""
+    return {
+        "page": page,
+        "page_size": min(page_size, MAX_PAGE_SIZE),
+        **filters,
+    }
 
 
 class RAWGClient:
     """Client for interacting with API"""
 
-    def __init__(self, api_key: Optional[str] = None, rate_limit: float = 1.0):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        rate_limit: float = 1.0,
+        burst: int = 1,
+        max_in_flight: int = 8,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        credentials: Optional[CredentialPool] = None,
+        base_url: str = BASE_API_URL,
+    ):
         """
         Initialize the RAWG API client.
 
         Args:
             api_key (Optional[str]): API key for authentication.
-            rate_limit (float): Seconds to wait between requests.
+            rate_limit (float): Average seconds between requests.
+            burst (int): Requests allowed back to back after an idle period.
+            max_in_flight (int): Requests allowed to be open at once.
+            retry_policy (Optional[RetryPolicy]): Retry and circuit settings.
+            cache (Optional[ResponseCache]): Cache for game detail responses.
+            credentials (Optional[CredentialPool]): Keys to rotate requests
+                across; defaults to a pool holding only ``api_key``.
+            base_url (str): API root, overridable for proxies and mock servers.
         """
 
-        self.base_url = BASE_API_URL
+        self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.rate_limit = rate_limit
         self.client = httpx.Client(timeout=30.0)
-        self._last_request_time = 0.0
+        self.cache = cache
+        self.transport = ApiTransport(
+            "rawg",
+            self.base_url,
+            credentials
+            or get_credential_pool(
+                "rawg",
+                [{"key": api_key} if api_key else {}],
+                rate_limit,
+                burst,
+                max_in_flight,
+            ),
+            retry_policy,
+            cache,
+        )
 
         logger.info(f"Initialized RAWG client with rate limit: {rate_limit}s")
 
-    def _wait_for_rate_limit(self) -> None:
-        """Ensure we respect the rate limit"""
-        time_since_last = time.time() - self._last_request_time
-        if time_since_last < self.rate_limit:
-            wait_time = self.rate_limit - time_since_last
-            logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
-            time.sleep(wait_time)
-        self._last_request_time = time.time()
-
     def _make_request(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cacheable: bool = False,
+        refresh: bool = False,
     ) -> Dict[str, Any]:
         """
         Make a request to the API
@@ -47,41 +90,130 @@ class RAWGClient:
         Args:
             endpoint (str): API endpoint to call.
             params (Dict[str, Any]): Query parameters for the request.
+            cacheable (bool): Serve and store the response via the cache.
+            refresh (bool): Skip a cached response but still store the new one.
 
         Returns:
           JSON response data
         """
-        self._wait_for_rate_limit()
-
-        params = params or {}
-        if self.api_key:
-            params["key"] = self.api_key
-
-        url = f"{self.base_url}/{endpoint}"
-
-        try:
-            response = self.client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Request failed for {endpoint}: {e}")
-            raise
+        request = self.transport.build("GET", endpoint, params, cacheable=cacheable)
+        body, _ = self.transport.send(self.client, request, refresh)
+        return codec.loads(body)
 
     def get_games_page(
         self, page: int = 1, page_size: int = 40, **filters: Any
     ) -> Dict[str, Any]:
         """Get one page of games with optional filters."""
-        params: Dict[str, Any] = {
-            "page": page,
-            "page_size": min(page_size, 40),
-            **filters,
-        }
+        params = build_games_page_params(page, page_size, filters)
         return self._make_request("games", params)
 
-    def get_game_details(self, game_id: int) -> Dict[str, Any]:
-        """Get detailed game info."""
-        return self._make_request(f"games/{game_id}")
+    def get_game_details(self, game_id: int, refresh: bool = False) -> Dict[str, Any]:
+        """Get detailed game info, bypassing a cached copy if ``refresh``."""
+        return self._make_request(f"games/{game_id}", cacheable=True, refresh=refresh)
 
     def close(self):
         """Close the client."""
         self.client.close()
+
+
+class AsyncRAWGClient:
+    """Asyncio client for interacting with API"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        rate_limit: float = 1.0,
+        burst: int = 1,
+        max_in_flight: int = 8,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        credentials: Optional[CredentialPool] = None,
+        base_url: str = BASE_API_URL,
+    ):
+        """
+        Initialize the async RAWG API client.
+
+        Shares the credential pool and its limiters with RAWGClient, so several
+        requests can be in flight at once while each key's rate is respected.
+
+        Args:
+            api_key (Optional[str]): API key for authentication.
+            rate_limit (float): Average seconds between requests.
+            burst (int): Requests allowed back to back after an idle period.
+            max_in_flight (int): Requests allowed to be open at once.
+            retry_policy (Optional[RetryPolicy]): Retry and circuit settings.
+            cache (Optional[ResponseCache]): Cache for game detail responses.
+            credentials (Optional[CredentialPool]): Keys to rotate requests
+                across; defaults to a pool holding only ``api_key``.
+            base_url (str): API root, overridable for proxies and mock servers.
+        """
+
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.rate_limit = rate_limit
+        self.client = httpx.AsyncClient(timeout=30.0)
+        self.cache = cache
+        self.transport = ApiTransport(
+            "rawg",
+            self.base_url,
+            credentials
+            or get_credential_pool(
+                "rawg",
+                [{"key": api_key} if api_key else {}],
+                rate_limit,
+                burst,
+                max_in_flight,
+            ),
+            retry_policy,
+            cache,
+        )
+
+        logger.info(f"Initialized async RAWG client with rate limit: {rate_limit}s")
+
+    async def __aenter__(self) -> "AsyncRAWGClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cacheable: bool = False,
+        refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the API
+
+        Args:
+            endpoint (str): API endpoint to call.
+            params (Dict[str, Any]): Query parameters for the request.
+            cacheable (bool): Serve and store the response via the cache.
+            refresh (bool): Skip a cached response but still store the new one.
+
+        Returns:
+          JSON response data
+        """
+        request = self.transport.build("GET", endpoint, params, cacheable=cacheable)
+        body, _ = await self.transport.send_async(self.client, request, refresh)
+        return codec.loads(body)
+
+    async def get_games_page(
+        self, page: int = 1, page_size: int = 40, **filters: Any
+    ) -> Dict[str, Any]:
+        """Get one page of games with optional filters."""
+        params = build_games_page_params(page, page_size, filters)
+        return await self._make_request("games", params)
+
+    async def get_game_details(
+        self, game_id: int, refresh: bool = False
+    ) -> Dict[str, Any]:
+        """Get detailed game info, bypassing a cached copy if ``refresh``."""
+        return await self._make_request(
+            f"games/{game_id}", cacheable=True, refresh=refresh
+        )
+
+    async def close(self) -> None:
+        """Close the client."""
+        await self.client.aclose()
@@ -0,0 +1,273 @@
+"""Retry, backoff and circuit breaking for API requests"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+from loguru import logger
+
+from ..utils.metrics import endpoint_label, get_metrics
+from .rate_limiter import parse_retry_after
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised when a host's circuit breaker is rejecting requests"""
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Classify an error as transient (worth retrying) or fatal
+
+    Network failures, timeouts, throttling and 5xx responses are transient.
+    Other 4xx responses and malformed data are fatal: retrying them only
+    burns quota.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (httpx.TransportError, CircuitOpenError))
+
+
+def is_not_found(error: BaseException) -> bool:
+    """Whether an error is a 404 for a resource the API does not have."""
+    return (
+        isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 404
+    )
+
+
+def describe_error(error: BaseException) -> str:
+    """Describe an error without the request URL, which may carry API keys."""
+    if isinstance(error, httpx.HTTPStatusError):
+        response = error.response
+        return f"HTTP {response.status_code} {response.reason_phrase}"
+    return f"{type(error).__name__}: {error}"
+
+
+def counts_as_outage(error: BaseException) -> bool:
+    """Whether an error should count towards tripping the circuit breaker."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+class CircuitBreaker:
+    """Stops sending requests to a host after repeated failures"""
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0
+    ) -> None:
+        """
+        Initialize the breaker
+
+        Args:
+          name: Identifier used in logs, usually the API host
+          failure_threshold: Consecutive failures before the circuit opens
+          reset_timeout: Seconds to wait before letting a probe request through
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def remaining_open_time(self) -> float:
+        """Seconds until the circuit lets a probe through (0 if closed)."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def before_call(self) -> None:
+        """
+        Check the circuit before sending a request
+
+        Raises:
+          CircuitOpenError: If the circuit is open and not yet due for a probe
+        """
+        remaining = self.remaining_open_time()
+        if remaining > 0:
+            raise CircuitOpenError(
+                f"Circuit for {self.name} is open, retry in {remaining:.1f}s"
+            )
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"Circuit for {self.name} closed")
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit once the threshold is hit."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning(
+                        f"Circuit for {self.name} opened after "
+                        f"{self._failures} consecutive failures"
+                    )
+                # A failed probe re-opens the circuit for another full timeout
+                self._opened_at = time.monotonic()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    name: str, failure_threshold: int = 5, reset_timeout: float = 30.0
+) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for ``name``."""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, failure_threshold, reset_timeout)
+            _breakers[name] = breaker
+        return breaker
+
+
+class RetryPolicy:
+    """Retries transient failures with jittered exponential backoff"""
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize the policy
+
+        Args:
+          max_attempts: Total attempts per request, including the first
+          base_delay: Backoff ceiling for the first retry in seconds
+          max_delay: Upper bound for any single backoff
+          failure_threshold: Consecutive outages before a host's circuit opens
+          reset_timeout: Seconds an open circuit waits before probing
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+    def backoff(self, attempt: int, error: BaseException) -> float:
+        """
+        Compute the delay before retry number ``attempt`` (1-based)
+
+        Uses full jitter so concurrent workers do not retry in lockstep, and
+        never waits less than the server's Retry-After.
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = random.uniform(0, ceiling)
+
+        if isinstance(error, httpx.HTTPStatusError):
+            retry_after = parse_retry_after(error.response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def _should_retry(
+        self, attempt: int, error: BaseException, description: str
+    ) -> bool:
+        """
+        Decide whether to retry and log the outcome
+
+        An open circuit is transient for the fetch loops, but retrying it here
+        would only stall the caller until the circuit's timeout, so the call
+        fails fast instead.
+        """
+        if not is_retryable(error) or isinstance(error, CircuitOpenError):
+            return False
+        if attempt >= self.max_attempts:
+            logger.warning(f"Giving up on {description} after {attempt} attempts")
+            return False
+        logger.warning(
+            f"Attempt {attempt}/{self.max_attempts} for {description} failed: "
+            f"{describe_error(error)}"
+        )
+        get_metrics().inc("retries_total", target=endpoint_label(description))
+        return True
+
+    @staticmethod
+    def _record(breaker: Optional[CircuitBreaker], error: BaseException) -> None:
+        if breaker and counts_as_outage(error):
+            breaker.record_failure()
+
+    def call(
+        self,
+        send: Callable[[], T],
+        breaker: Optional[CircuitBreaker] = None,
+        description: str = "request",
+    ) -> T:
+        """
+        Run ``send`` until it succeeds or the error is fatal
+
+        Args:
+          send: Function performing a single request attempt
+          breaker: Circuit breaker guarding the target host
+          description: Label for log messages
+
+        Returns:
+          Result of the first successful attempt
+
+        Raises:
+          CircuitOpenError: If the breaker is open, without calling ``send``
+          Exception: The last error once retries are exhausted or it is fatal
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if breaker:
+                    breaker.before_call()
+                result = send()
+            except Exception as e:
+                self._record(breaker, e)
+                if not self._should_retry(attempt, e, description):
+                    raise
+                time.sleep(self.backoff(attempt, e))
+                continue
+
+            if breaker:
+                breaker.record_success()
+            return result
+
+    async def call_async(
+        self,
+        send: Callable[[], Awaitable[T]],
+        breaker: Optional[CircuitBreaker] = None,
+        description: str = "request",
+    ) -> T:
+        """Async counterpart of ``call``."""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if breaker:
+                    breaker.before_call()
+                result = await send()
+            except Exception as e:
+                self._record(breaker, e)
+                if not self._should_retry(attempt, e, description):
+                    raise
+                await asyncio.sleep(self.backoff(attempt, e))
+                continue
+
+            if breaker:
+                breaker.record_success()
+            return result
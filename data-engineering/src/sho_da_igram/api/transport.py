@@ -0,0 +1,237 @@
+"""Request plumbing shared by the sync and async API clients"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+from loguru import logger
+
+from ..utils.metrics import get_metrics
+from .cache import ResponseCache, make_cache_key
+from .credentials import Credential, CredentialPool
+from .igdb_auth import TokenProvider, credential_headers, renew_token
+from .retry import RetryPolicy, get_circuit_breaker
+
+
+@dataclass
+class ApiRequest:
+    """One API call, ready to be sent with any credential of the pool"""
+
+    method: str
+    endpoint: str
+    url: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    content: Optional[str] = None
+    cache_key: Optional[str] = None
+
+
+class ApiTransport:
+    """
+    Sends requests through a credential pool, retry policy and response cache
+
+    Holds everything a request needs apart from the HTTP client, so the sync
+    and async clients of an API only differ in whether they await the call.
+    Credentials go in the query string (``credentials_in="params"``, RAWG) or
+    in the headers (``"headers"``, IGDB, with an optional token provider).
+    """
+
+    def __init__(
+        self,
+        source: str,
+        base_url: str,
+        credentials: CredentialPool,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        token_provider: Optional[TokenProvider] = None,
+        credentials_in: str = "params",
+    ) -> None:
+        """
+        Set up the transport for one API
+
+        Args:
+          source: Data source name, used in metrics and log messages
+          base_url: API root
+          credentials: Keys to rotate requests across
+          retry_policy: Retry and circuit breaker settings
+          cache: Cache for responses of cacheable requests (optional)
+          token_provider: Supplies and renews the token for its client ID
+          credentials_in: Where credential values are sent, "params" or "headers"
+        """
+        if credentials_in not in ("params", "headers"):
+            raise ValueError(f"Unknown credential placement '{credentials_in}'")
+
+        self.source = source
+        self.base_url = base_url.rstrip("/")
+        self.credentials = credentials
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self.token_provider = token_provider
+        self.credentials_in = credentials_in
+        self.breaker = get_circuit_breaker(
+            urlparse(self.base_url).netloc,
+            self.retry_policy.failure_threshold,
+            self.retry_policy.reset_timeout,
+        )
+
+    def build(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[str] = None,
+        cacheable: bool = False,
+    ) -> ApiRequest:
+        """Describe a request, with a cache key if it may be cached."""
+        url = f"{self.base_url}/{endpoint}"
+        params = params or {}
+        cache_key = None
+        if cacheable and self.cache:
+            cache_key = make_cache_key(method, url, params, body=content)
+        return ApiRequest(method, endpoint, url, params, content, cache_key)
+
+    def cached(self, request: ApiRequest, refresh: bool = False) -> Optional[bytes]:
+        """Get a cached response body, unless ``refresh`` asks for a new one."""
+        if request.cache_key is None or refresh:
+            return None
+        body = self.cache.get(request.cache_key)
+        if body is not None:
+            get_metrics().inc("cache_hits_total", source=self.source)
+        return body
+
+    def request_kwargs(
+        self, request: ApiRequest, credential: Credential
+    ) -> Dict[str, Any]:
+        """httpx arguments for sending ``request`` with ``credential``."""
+        kwargs: Dict[str, Any] = {}
+        if self.credentials_in == "params":
+            kwargs["params"] = {**request.params, **credential.values}
+        else:
+            kwargs["headers"] = credential_headers(credential, self.token_provider)
+            if request.params:
+                kwargs["params"] = request.params
+        if request.content is not None:
+            kwargs["content"] = request.content
+        return kwargs
+
+    def should_renew(self, response: httpx.Response, kwargs: Dict[str, Any]) -> bool:
+        """Whether a 401 came from a managed token that was just dropped."""
+        return (
+            response.status_code == 401
+            and "headers" in kwargs
+            and renew_token(kwargs["headers"], self.token_provider)
+        )
+
+    def describe(self, request: ApiRequest) -> str:
+        """Name of the call for retry and circuit breaker messages."""
+        return f"{self.source.upper()} {request.endpoint}"
+
+    def store(self, request: ApiRequest, response: httpx.Response) -> bytes:
+        """Cache a fresh response body if the request is cacheable."""
+        if request.cache_key:
+            self.cache.set(request.cache_key, response.content)
+        return response.content
+
+    def log_failure(self, request: ApiRequest, error: BaseException) -> None:
+        logger.error(
+            f"{self.source.upper()} request failed for {request.endpoint}: {error}"
+        )
+        if request.content is not None:
+            logger.error(f"Query was: {request.content}")
+
+    def send(
+        self, client: httpx.Client, request: ApiRequest, refresh: bool = False
+    ) -> Tuple[bytes, bool]:
+        """
+        Send a request, serving it from the cache when possible
+
+        Args:
+          client: HTTP client to send with
+          request: Request built with ``build``
+          refresh: Skip a cached response but still store the new one
+
+        Returns:
+          The response body, and whether it came from the cache
+
+        Raises:
+          httpx.HTTPError: If the request failed after retries
+          CircuitOpenError: If the host's circuit breaker is open
+        """
+        body = self.cached(request, refresh)
+        if body is not None:
+            return body, True
+        metrics = get_metrics()
+
+        def issue(
+            credential: Credential, ready_at: Optional[float] = None, renew: bool = True
+        ) -> httpx.Response:
+            kwargs = self.request_kwargs(request, credential)
+            with credential.limiter.acquire(ready_at):
+                with metrics.track_request(self.source, request.endpoint) as sample:
+                    response = client.request(request.method, request.url, **kwargs)
+                    sample.response = response
+            if renew and self.should_renew(response, kwargs):
+                # Re-send once with a fresh token before counting a refusal
+                return issue(credential, renew=False)
+            return response
+
+        def attempt() -> httpx.Response:
+            for _ in range(self.credentials.size):
+                credential, ready_at = self.credentials.pick()
+                response = issue(credential, ready_at)
+                if not self.credentials.observe(credential, response):
+                    break
+            response.raise_for_status()
+            return response
+
+        try:
+            response = self.retry_policy.call(
+                attempt, self.breaker, self.describe(request)
+            )
+        except Exception as e:
+            self.log_failure(request, e)
+            raise
+        return self.store(request, response), False
+
+    async def send_async(
+        self, client: httpx.AsyncClient, request: ApiRequest, refresh: bool = False
+    ) -> Tuple[bytes, bool]:
+        """Async version of ``send``."""
+        body = self.cached(request, refresh)
+        if body is not None:
+            return body, True
+        metrics = get_metrics()
+
+        async def issue(
+            credential: Credential, ready_at: Optional[float] = None, renew: bool = True
+        ) -> httpx.Response:
+            # A token refresh is a rare, short blocking call; it is not worth a
+            # separate async code path
+            kwargs = self.request_kwargs(request, credential)
+            async with credential.limiter.acquire_async(ready_at):
+                with metrics.track_request(self.source, request.endpoint) as sample:
+                    response = await client.request(
+                        request.method, request.url, **kwargs
+                    )
+                    sample.response = response
+            if renew and self.should_renew(response, kwargs):
+                return await issue(credential, renew=False)
+            return response
+
+        async def attempt() -> httpx.Response:
+            for _ in range(self.credentials.size):
+                credential, ready_at = self.credentials.pick()
+                response = await issue(credential, ready_at)
+                if not self.credentials.observe(credential, response):
+                    break
+            response.raise_for_status()
+            return response
+
+        try:
+            response = await self.retry_policy.call_async(
+                attempt, self.breaker, self.describe(request)
+            )
+        except Exception as e:
+            self.log_failure(request, e)
+            raise
+        return self.store(request, response), False
@@ -0,0 +1,163 @@
+"""Checkpoints for resumable fetch runs"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from ..utils import codec
+from .report import FetchFailure, FetchReport
+
+
+@dataclass
+class CheckpointState:
+    """
+    Where an interrupted run stopped and what it had collected
+
+    ``cursors`` holds the ID cursor of every IGDB release date partition in a
+    partitioned run, None once a partition is finished.
+    """
+
+    source: str
+    cursor: int
+    limit: int
+    output_filename: str
+    started_at: int = 0
+    skipped: int = 0
+    duplicates: int = 0
+    games: List[Dict[str, Any]] = field(default_factory=list)
+    failures: List[FetchFailure] = field(default_factory=list)
+    cursors: Dict[str, Optional[int]] = field(default_factory=dict)
+
+
+class FetchCheckpoint:
+    """
+    Persists fetch progress in ``data_dir`` after every page or offset window
+
+    Records are appended to ``<source>.checkpoint.jsonl`` and the cursor is
+    written atomically to ``<source>.checkpoint`` afterwards, so a crash between
+    the two writes leaves at most a few extra lines that are ignored on load.
+    """
+
+    def __init__(self, data_dir: Path, source: str) -> None:
+        self.source = source
+        self.state_path = Path(data_dir) / f"{source}.checkpoint"
+        self.records_path = Path(data_dir) / f"{source}.checkpoint.jsonl"
+        self._count = 0
+        self._skipped = 0
+        self._limit = 0
+        self._output_filename = ""
+        self._started_at = 0
+
+    def load(self) -> Optional[CheckpointState]:
+        """
+        Load the last checkpoint, if there is one
+
+        Returns:
+            Saved state, or None if no checkpoint exists
+        """
+        if not self.state_path.exists():
+            return None
+
+        with open(self.state_path, encoding="utf-8") as state_file:
+            state = json.load(state_file)
+
+        games: List[Dict[str, Any]] = []
+        if self.records_path.exists():
+            committed_bytes = 0
+            with open(self.records_path, "rb") as records_file:
+                for line in records_file:
+                    if len(games) >= state["count"]:
+                        break
+                    games.append(codec.loads(line))
+                    committed_bytes += len(line)
+            # Drop records written after the last state save
+            os.truncate(self.records_path, committed_bytes)
+
+        self._count = len(games)
+        self._skipped = state.get("skipped", 0)
+        self._limit = state["limit"]
+        self._output_filename = state["output_filename"]
+        self._started_at = state.get("started_at", 0)
+
+        logger.info(
+            f"Loaded {self.source} checkpoint: cursor={state['cursor']}, "
+            f"{len(games)} games"
+        )
+        return CheckpointState(
+            source=self.source,
+            cursor=state["cursor"],
+            limit=state["limit"],
+            output_filename=state["output_filename"],
+            started_at=self._started_at,
+            skipped=self._skipped,
+            duplicates=state.get("duplicates", 0),
+            games=games,
+            failures=[FetchFailure(**failure) for failure in state["failures"]],
+            cursors=state.get("cursors", {}),
+        )
+
+    def start(self, limit: int, output_filename: str) -> None:
+        """Begin a fresh run, discarding any previous checkpoint."""
+        self.clear()
+        self._limit = limit
+        self._output_filename = output_filename
+        self._started_at = int(time.time())
+
+    def save(
+        self,
+        cursor: int,
+        new_games: List[Dict[str, Any]],
+        report: FetchReport,
+        skipped: int = 0,
+        cursors: Optional[Dict[str, Optional[int]]] = None,
+    ) -> None:
+        """
+        Record a completed page or window
+
+        Args:
+            cursor: Next page or offset to request when resuming, or the
+                round number of a partitioned run
+            new_games: Games collected since the previous save
+            report: Run report holding failures and duplicates so far
+            skipped: Unchanged games left out of a delta since the previous save
+            cursors: ID cursor per partition of a partitioned run
+        """
+        self._skipped += skipped
+        if new_games:
+            with open(self.records_path, "a", encoding="utf-8") as records_file:
+                for game in new_games:
+                    records_file.write(codec.dumps_line(game) + "\n")
+                records_file.flush()
+                os.fsync(records_file.fileno())
+            self._count += len(new_games)
+
+        state = {
+            "source": self.source,
+            "cursor": cursor,
+            "limit": self._limit,
+            "count": self._count,
+            "skipped": self._skipped,
+            "duplicates": report.duplicates,
+            "started_at": self._started_at,
+            "output_filename": self._output_filename,
+            "failures": report.to_dict()["failures"],
+            "cursors": cursors or {},
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        tmp_path = self.state_path.with_name(f"{self.state_path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as state_file:
+            json.dump(state, state_file)
+        os.replace(tmp_path, self.state_path)
+
+    def clear(self) -> None:
+        """Remove the checkpoint once a run has completed."""
+        self.state_path.unlink(missing_ok=True)
+        self.records_path.unlink(missing_ok=True)
+        self._count = 0
+        self._skipped = 0
@@ -1,14 +1,467 @@
 """Data fetcher that saves raw data to CSV."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from loguru import logger
 
-from ..api.igdb_client import IGDBClient
-from ..api.rawg_client import RAWGClient
+from ..api.bulk import BulkLookupResult, dedupe_ids
+from ..api.cache import ResponseCache
+from ..api.credentials import CredentialPool, get_credential_pool
+from ..api.igdb_auth import TokenProvider, get_token_provider
+from ..api.igdb_client import (
+    MAX_MULTIQUERY_SIZE,
+    MAX_QUERY_LIMIT,
+    AsyncIGDBClient,
+    IGDBClient,
+    PayloadStats,
+    ReleasePartition,
+    build_auth_headers,
+    build_partition_query,
+    build_top_games_query,
+    release_year_partitions,
+)
+from ..api.rawg_client import AsyncRAWGClient, RAWGClient
+from ..api.retry import RetryPolicy, describe_error, is_not_found, is_retryable
 from ..utils.config import Config
-from ..utils.utils import IGDBDataHandler, JsonUtils, RAWGDataHandler
+from ..utils.metrics import get_metrics
+from ..utils.records import GameRecord, record_from_dict
+from ..utils.utils import (
+    IGDBDataHandler,
+    JsonLinesWriter,
+    JsonUtils,
+    RAWGDataHandler,
+)
+from .checkpoint import CheckpointState, FetchCheckpoint
+from .manifest import FetchManifest
+from .report import FetchReport, IncompleteFetchError
+
+
+def build_retry_policy(config: Config) -> RetryPolicy:
+    """Build the retry policy shared by a fetcher's clients."""
+    return RetryPolicy(
+        max_attempts=config.retry_max_attempts,
+        base_delay=config.retry_base_delay,
+        failure_threshold=config.circuit_failure_threshold,
+        reset_timeout=config.circuit_reset_timeout,
+    )
+
+
+def build_response_cache(config: Config) -> Optional[ResponseCache]:
+    """Open the on-disk response cache, unless disabled."""
+    if not config.cache_enabled:
+        return None
+    return ResponseCache(
+        Path(config.cache_path),
+        ttl=config.cache_ttl,
+        max_bytes=config.cache_max_mb * 1024 * 1024,
+        bypass=config.cache_bypass,
+    )
+
+
+def build_rawg_credentials(config: Config) -> CredentialPool:
+    """Pool every configured RAWG key, each with its own limiter."""
+    return get_credential_pool(
+        "rawg",
+        [{"key": key} for key in config.rawg_keys()],
+        config.rawg_rate_limit,
+        config.rawg_burst,
+        config.rawg_max_in_flight,
+        config.credential_max_strikes,
+        config.credential_cooldown,
+    )
+
+
+def build_igdb_credentials(config: Config) -> CredentialPool:
+    """Pool every configured IGDB client ID and token pair."""
+    return get_credential_pool(
+        "igdb",
+        [
+            build_auth_headers(client_id, token)
+            for client_id, token in config.igdb_credential_pairs()
+        ],
+        config.igdb_rate_limit,
+        config.igdb_burst,
+        config.igdb_max_in_flight,
+        config.credential_max_strikes,
+        config.credential_cooldown,
+    )
+
+
+def build_token_provider(config: Config) -> Optional[TokenProvider]:
+    """Manage the main IGDB client's token when its secret is configured."""
+    if not config.igdb_client_id or not config.igdb_client_secret:
+        return None
+    return get_token_provider(
+        config.igdb_client_id,
+        config.igdb_client_secret,
+        Path(config.igdb_token_cache),
+        config.igdb_token_refresh_margin,
+    )
+
+
+def plan_windows(
+    offset: int, remaining: int, batch_size: int, max_windows: int
+) -> List[Tuple[int, int]]:
+    """Split the next ``remaining`` games into (offset, size) query windows."""
+    windows: List[Tuple[int, int]] = []
+    while remaining > 0 and len(windows) < max(1, max_windows):
+        size = min(batch_size, remaining)
+        windows.append((offset, size))
+        offset += size
+        remaining -= size
+    return windows
+
+
+def top_games_queries(
+    windows: List[Tuple[int, int]],
+    min_rating: int,
+    updated_since: Optional[int],
+    fields: str,
+) -> List[Tuple[str, str]]:
+    """Build the IGDB (endpoint, query) pairs for a list of offset windows."""
+    return [
+        (
+            "games",
+            build_top_games_query(size, offset, min_rating, updated_since, fields),
+        )
+        for offset, size in windows
+    ]
+
+
+class GameCollector:
+    """Receives processed games from the fetch loops, in order"""
+
+    def __init__(
+        self,
+        writer: Optional[JsonLinesWriter] = None,
+        manifest: Optional[FetchManifest] = None,
+    ) -> None:
+        """
+        Args:
+            writer: Stream games straight to this writer instead of keeping
+                them in memory (optional)
+            manifest: Manifest of a delta run to record collected games in
+        """
+        self.writer = writer
+        self.manifest = manifest
+        # Kept as compact records, which take a fraction of a dict's memory
+        self.games: List[GameRecord] = []
+        self.count = 0
+        self.skipped = 0
+
+    @property
+    def progress(self) -> int:
+        """Games collected plus unchanged games skipped by a delta run."""
+        return self.count + self.skipped
+
+    def add(self, games: List[Dict[str, Any]]) -> None:
+        """Add a page or window of processed games."""
+        if self.writer:
+            self.writer.write_many(games)
+        else:
+            self.games.extend(map(record_from_dict, games))
+        if self.manifest:
+            for game in games:
+                self.manifest.record(game)
+        self.count += len(games)
+
+    def skip(self, count: int) -> None:
+        """Count games left out of a delta because they are unchanged."""
+        self.skipped += count
+
+
+def restore_progress(
+    report: FetchReport,
+    resume_state: Optional[CheckpointState],
+    start_cursor: int,
+    collector: GameCollector,
+) -> int:
+    """Pick up games, failures and cursor from a checkpoint, if resuming."""
+    if resume_state is None:
+        return start_cursor
+    report.failures.extend(resume_state.failures)
+    report.duplicates = resume_state.duplicates
+    collector.add(resume_state.games)
+    collector.skip(resume_state.skipped)
+    logger.info(
+        f"Resuming {report.source} fetch at cursor {resume_state.cursor} "
+        f"with {len(resume_state.games)} games"
+    )
+    return resume_state.cursor
+
+
+def seen_ids(resume_state: Optional[CheckpointState], id_field: str) -> Set[Any]:
+    """IDs of the games a resumed run has already collected."""
+    if resume_state is None:
+        return set()
+    return {game.get(id_field) for game in resume_state.games}
+
+
+def drop_seen(
+    games: List[Dict[str, Any]], seen: Set[Any], remaining: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Keep list entries not collected yet, up to the number still needed
+
+    Kept entries are added to ``seen`` so a game that shifts onto a later page
+    is not fetched twice.
+
+    Args:
+        games: Entries of one list page
+        seen: IDs collected so far in this run
+        remaining: Games still needed to reach the limit
+
+    Returns:
+        Entries to fetch and the number of duplicates dropped
+    """
+    fresh: List[Dict[str, Any]] = []
+    duplicates = 0
+    for game in games:
+        if len(fresh) >= remaining:
+            break
+        if game.get("id") in seen:
+            duplicates += 1
+            continue
+        seen.add(game.get("id"))
+        fresh.append(game)
+    return fresh, duplicates
+
+
+def select_changed(
+    games: List[Dict[str, Any]], manifest: Optional[FetchManifest]
+) -> List[Dict[str, Any]]:
+    """Keep the RAWG list entries that are new or updated since the last run."""
+    if manifest is None:
+        return games
+    return [
+        game
+        for game in games
+        if manifest.is_changed(game.get("id"), game.get("updated"))
+    ]
+
+
+class RAWGPageRun:
+    """
+    One walk down the RAWG games list, shared by the sync and async fetch loops
+
+    Page numbering, failure handling, duplicate and delta filtering and
+    checkpoints live here, so the loops only differ in how they send requests.
+    """
+
+    def __init__(
+        self,
+        fetcher: "RAWGDataFetcher",
+        limit: int,
+        collector: GameCollector,
+        checkpoint: Optional[FetchCheckpoint] = None,
+        resume_state: Optional[CheckpointState] = None,
+    ) -> None:
+        self.report = fetcher.report
+        self.max_failures = fetcher.config.max_consecutive_failures
+        # Keep the page size fixed so page numbers map to stable offsets; the
+        # last page is trimmed by ``select`` instead
+        self.list_params = {
+            "page_size": fetcher.DEFAULT_PAGE_SIZE,
+            "ordering": fetcher.DEFAULT_ORDERING,
+        }
+        self.limit = limit
+        self.collector = collector
+        self.checkpoint = checkpoint
+        self.page = restore_progress(self.report, resume_state, 1, collector)
+        self.seen = seen_ids(resume_state, "rawg_id")
+        self.consecutive_failures = 0
+        # A changed game's cached details predate the change
+        self.refresh = collector.manifest is not None
+        self.finished = False
+        self.unchanged = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether another page should be fetched."""
+        return not self.finished and self.collector.progress < self.limit
+
+    def page_params(self) -> Dict[str, Any]:
+        """Arguments for ``get_games_page`` for the current page."""
+        logger.info(f"Fetching page {self.page}...")
+        return {"page": self.page, **self.list_params}
+
+    def fail(self, error: BaseException) -> None:
+        """Record a page that could not be fetched, ending the run if needed."""
+        if is_not_found(error):
+            # RAWG answers 404 for pages past the end of the list
+            logger.info("No more games available")
+            self.finished = True
+            return
+        if not is_retryable(error):
+            self.report.stop(f"Failed to fetch page {self.page}: {error}")
+            self.finished = True
+            return
+        self.report.record_failure("page", self.page, error)
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.max_failures:
+            self.report.stop("Too many consecutive RAWG page failures")
+            self.finished = True
+            return
+        self.page += 1
+        if self.checkpoint:
+            self.checkpoint.save(self.page, [], self.report)
+
+    def select(self, response: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Pick the entries of a fetched page whose details are needed
+
+        Returns:
+            New or changed entries, or None past the end of the list
+        """
+        self.consecutive_failures = 0
+        games = response.get("results", [])
+        if not games:
+            logger.info("No more games available")
+            self.finished = True
+            return None
+
+        games, duplicates = drop_seen(
+            games, self.seen, self.limit - self.collector.progress
+        )
+        self.report.duplicates += duplicates
+        changed = select_changed(games, self.collector.manifest)
+        self.unchanged = len(games) - len(changed)
+        return changed
+
+    def add(self, details: Iterable[Optional[Dict[str, Any]]]) -> None:
+        """Collect the processed games of the page and move to the next one."""
+        processed = [game for game in details if game is not None]
+        self.collector.add(processed)
+        self.collector.skip(self.unchanged)
+
+        self.page += 1
+        if self.checkpoint:
+            self.checkpoint.save(self.page, processed, self.report, self.unchanged)
+
+    def finish(self) -> List[GameRecord]:
+        """Log the outcome and return the collected records."""
+        logger.info(f"Successfully fetched {self.collector.count} games from RAWG")
+        if self.collector.skipped:
+            logger.info(f"Skipped {self.collector.skipped} unchanged RAWG games")
+        return self.collector.games
+
+
+def rank_by_rating_count(games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Order processed IGDB games as the offset queries do, most rated first
+
+    Ties are broken by ID so runs over the same catalog agree.
+    """
+    return sorted(
+        games,
+        key=lambda game: (-(game.get("total_rating_count") or 0), game["igdb_id"]),
+    )
+
+
+def open_output(
+    output_path: Path, config: Config, manifest: Optional[FetchManifest] = None
+) -> Tuple[GameCollector, Optional[JsonLinesWriter]]:
+    """Create the collector for a run, streaming to disk in ndjson mode."""
+    if config.output_format != "ndjson":
+        return GameCollector(manifest=manifest), None
+    writer = JsonLinesWriter(output_path, config.output_compression)
+    return GameCollector(writer, manifest), writer
+
+
+def ensure_complete(report: FetchReport, output_path: Path) -> None:
+    """
+    Fail a run that stopped early, before its output or manifest is written
+
+    The checkpoint is left in place so ``--resume`` continues the run. Raise
+    inside the writer's context so a streamed file is discarded.
+
+    Raises:
+        IncompleteFetchError: If the run stopped before collecting everything
+    """
+    if report.stopped is None:
+        return
+    save_failures(report, output_path)
+    raise IncompleteFetchError(
+        f"{report.source.upper()} fetch stopped early ({report.stopped}); "
+        f"run again with --resume to continue"
+    )
+
+
+def finish_output(
+    report: FetchReport,
+    output_path: Path,
+    collector: GameCollector,
+    checkpoint: Optional[FetchCheckpoint] = None,
+) -> None:
+    """
+    Save a completed run's output, failures and manifest, then drop its checkpoint
+
+    Raises:
+        ValueError: If a full (non-delta) JSON run collected no games
+        IOError: If a file cannot be written
+    """
+    report.fetched = collector.count
+    report.skipped = collector.skipped
+    if report.duplicates:
+        logger.info(
+            f"Dropped {report.duplicates} duplicate {report.source.upper()} games"
+        )
+    save_failures(report, output_path)
+    if collector.count == 0:
+        logger.warning(f"No games fetched from {report.source.upper()}")
+
+    if collector.writer is None:
+        if collector.games or collector.manifest is None:
+            JsonUtils.save_to_json(collector.games, output_path)
+        else:
+            # Nothing changed since the last run: an empty delta is still valid
+            output_path.write_text("[]\n", encoding=JsonUtils.DEFAULT_ENCODING)
+
+    if collector.manifest:
+        collector.manifest.save(complete=not report.failures)
+    if checkpoint:
+        checkpoint.clear()
+
+
+def save_failures(report: FetchReport, output_path: Path) -> None:
+    """Write a run's failed cursors next to its output file."""
+    if not report.failures:
+        return
+    base_name = output_path.name.split(".", 1)[0]
+    failures_path = output_path.with_name(f"{base_name}_failures.json")
+    JsonUtils.save_to_json(report.to_dict()["failures"], failures_path)
+    logger.warning(
+        f"{len(report.failures)} {report.source} requests failed, "
+        f"see {failures_path}"
+    )
+
+
+def save_lookup_misses(result: BulkLookupResult, output_path: Path) -> None:
+    """Write the IDs a bulk lookup could not return next to its output file."""
+    misses = [{"id": game_id, "reason": "not_found"} for game_id in result.missing]
+    misses.extend(
+        {"id": game_id, "reason": error} for game_id, error in result.failed.items()
+    )
+    if not misses:
+        return
+    base_name = output_path.name.split(".", 1)[0]
+    misses_path = output_path.with_name(f"{base_name}_missing.json")
+    JsonUtils.save_to_json(misses, misses_path)
+    logger.warning(f"{len(misses)} IDs could not be fetched, see {misses_path}")
+
+
+def save_lookup_output(
+    result: BulkLookupResult, game_ids: List[int], output_path: Path
+) -> None:
+    """Save the games a bulk lookup found, in requested order, plus its misses."""
+    games = [result.found[game_id] for game_id in game_ids if game_id in result.found]
+    save_lookup_misses(result, output_path)
+    JsonUtils.save_to_json(games, output_path)
 
 
 class RAWGDataFetcher:
@@ -18,25 +471,49 @@ class RAWGDataFetcher:
     DEFAULT_ORDERING = "-added"
 
     def __init__(self, config: Config):
-        if not config.rawg_api_key:
+        if not config.rawg_keys():
             raise ValueError("RAWG API key is required")
 
         self.config = config
-        self.client = RAWGClient(
-            api_key=config.rawg_api_key, rate_limit=config.rawg_rate_limit
-        )
+        self.retry_policy = build_retry_policy(config)
+        self.cache = build_response_cache(config)
+        self.credentials = build_rawg_credentials(config)
+        self.client = RAWGClient(**self._client_options())
+        self.report = FetchReport("rawg")
         self.output_dir = Path(config.data_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def _fetch_games_batch(self, limit: int) -> List[Dict[str, Any]]:
+    def _client_options(self) -> Dict[str, Any]:
+        """Arguments shared by the sync and async RAWG clients."""
+        return {
+            "api_key": self.config.rawg_api_key,
+            "rate_limit": self.config.rawg_rate_limit,
+            "burst": self.config.rawg_burst,
+            "max_in_flight": self.config.rawg_max_in_flight,
+            "retry_policy": self.retry_policy,
+            "cache": self.cache,
+            "credentials": self.credentials,
+            "base_url": self.config.rawg_base_url,
+        }
+
+    def _fetch_games_batch(
+        self,
+        limit: int,
+        checkpoint: Optional[FetchCheckpoint] = None,
+        resume_state: Optional[CheckpointState] = None,
+        collector: Optional[GameCollector] = None,
+    ) -> List[GameRecord]:
         """
         Fetch games in batches from the API.
 
         Args:
             limit: Maximum number of games to fetch
+            checkpoint: Checkpoint updated after every page (optional)
+            resume_state: Progress of an interrupted run to continue from
+            collector: Destination for processed games (defaults to a list)
 
         Returns:
-            List of processed game data
+            Processed game records (empty when the collector streams)
 
         Raises:
             ValueError: If limit is not positive
@@ -44,92 +521,315 @@ class RAWGDataFetcher:
         if limit <= 0:
             raise ValueError("Limit must be positive")
 
-        all_games: List[Dict[str, Any]] = []
-        page = 1
-        fetched = 0
+        self.report = FetchReport("rawg")
+        collector = collector or GameCollector()
 
-        while fetched < limit:
-            logger.info(f"Fetching page {page}...")
+        if self.config.async_mode:
+            return asyncio.run(
+                self._fetch_games_batch_async(
+                    limit, checkpoint, resume_state, collector
+                )
+            )
 
-            page_size = min(self.DEFAULT_PAGE_SIZE, limit - fetched)
+        run = RAWGPageRun(self, limit, collector, checkpoint, resume_state)
 
-            try:
-                response = self.client.get_games_page(
-                    page=page, page_size=page_size, ordering=self.DEFAULT_ORDERING
+        with ThreadPoolExecutor(
+            max_workers=self.config.rawg_detail_workers,
+            thread_name_prefix="rawg-details",
+        ) as executor:
+            while run.active:
+                try:
+                    response = self.client.get_games_page(**run.page_params())
+                except Exception as e:
+                    run.fail(e)
+                    continue
+                changed = run.select(response)
+                if changed is None:
+                    break
+                # executor.map yields results in page order
+                run.add(
+                    executor.map(self._fetch_game_details, changed, repeat(run.refresh))
                 )
+
+        return run.finish()
+
+    def _fetch_game_details(
+        self, game: Dict[str, Any], refresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch and process detailed info for one list entry."""
+        # Fetch detailed game info to get description_raw
+        game_id = game.get("id")
+        if game_id:
+            logger.debug(f"Fetching detailed info for game {game_id}")
+            try:
+                game = self.client.get_game_details(game_id, refresh)
             except Exception as e:
-                logger.error(f"Failed to fetch page {page}: {e}")
-                break
+                self.report.record_failure("game_id", game_id, e)
+                return None
+        return self._process_game(game)
+
+    @staticmethod
+    def _process_game(game: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Process one RAWG game, skipping it if the data is invalid."""
+        try:
+            with get_metrics().time_stage("process", RAWGDataHandler.SOURCE, 1):
+                return RAWGDataHandler.process_game_data(game)
+        except Exception as e:
+            logger.warning(f"Failed to process game {game.get('id', 'unknown')}: {e}")
+            return None
+
+    async def _fetch_games_batch_async(
+        self,
+        limit: int,
+        checkpoint: Optional[FetchCheckpoint] = None,
+        resume_state: Optional[CheckpointState] = None,
+        collector: Optional[GameCollector] = None,
+    ) -> List[GameRecord]:
+        """
+        Fetch games with up to ``rawg_detail_workers`` detail requests at once.
 
-            games = response.get("results", [])
-            if not games:
-                logger.info("No more games available")
-                break
+        Args:
+            limit: Maximum number of games to fetch
+            checkpoint: Checkpoint updated after every page (optional)
+            resume_state: Progress of an interrupted run to continue from
+            collector: Destination for processed games (defaults to a list)
 
-            for game in games:
-                try:
-                    # Fetch detailed game info to get description_raw
-                    game_id = game.get("id")
-                    if game_id:
-                        logger.debug(f"Fetching detailed info for game {game_id}")
-                        detailed_game = self.client.get_game_details(game_id)
-                        processed = RAWGDataHandler.process_game_data(detailed_game)
-                    else:
-                        processed = RAWGDataHandler.process_game_data(game)
+        Returns:
+            Processed game records, in list page order
+        """
+        collector = collector or GameCollector()
+        run = RAWGPageRun(self, limit, collector, checkpoint, resume_state)
+        semaphore = asyncio.Semaphore(self.config.rawg_detail_workers)
 
-                    all_games.append(processed)
-                    fetched += 1
-                    if fetched >= limit:
-                        break
+        async with AsyncRAWGClient(**self._client_options()) as client:
+            while run.active:
+                try:
+                    response = await client.get_games_page(**run.page_params())
                 except Exception as e:
-                    logger.warning(
-                        f"Failed to process game {game.get('id', 'unknown')}: {e}"
+                    run.fail(e)
+                    continue
+                changed = run.select(response)
+                if changed is None:
+                    break
+                run.add(
+                    await asyncio.gather(
+                        *(
+                            self._fetch_game_details_async(
+                                client, semaphore, game, run.refresh
+                            )
+                            for game in changed
+                        )
+                    )
+                )
+
+        return run.finish()
+
+    def fetch_page_range(self, start_page: int, end_page: int) -> List[Dict[str, Any]]:
+        """
+        Fetch and process every game on list pages ``start_page`` to ``end_page - 1``
+
+        Used by sharded runs, where each work unit is a page range. Pages that
+        still fail after retries are recorded in the report and skipped.
+
+        Args:
+            start_page: First list page
+            end_page: Page after the last one to fetch
+
+        Returns:
+            Processed games, in list order
+
+        Raises:
+            Exception: The first non-retryable page error
+        """
+        games: List[Dict[str, Any]] = []
+
+        with ThreadPoolExecutor(
+            max_workers=self.config.rawg_detail_workers,
+            thread_name_prefix="rawg-details",
+        ) as executor:
+            for page in range(start_page, end_page):
+                logger.info(f"Fetching page {page}...")
+                try:
+                    response = self.client.get_games_page(
+                        page=page,
+                        page_size=self.DEFAULT_PAGE_SIZE,
+                        ordering=self.DEFAULT_ORDERING,
                     )
+                except Exception as e:
+                    if is_not_found(e):
+                        # RAWG answers 404 for pages past the end of the list
+                        break
+                    if not is_retryable(e):
+                        raise
+                    self.report.record_failure("page", page, e)
                     continue
 
-            page += 1
+                entries = response.get("results", [])
+                if not entries:
+                    break
+                games.extend(
+                    game
+                    for game in executor.map(self._fetch_game_details, entries)
+                    if game is not None
+                )
 
-        logger.info(f"Successfully fetched {len(all_games)} games from RAWG")
-        return all_games
+        return games
+
+    async def _fetch_game_details_async(
+        self,
+        client: AsyncRAWGClient,
+        semaphore: asyncio.Semaphore,
+        game: Dict[str, Any],
+        refresh: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch and process detailed info for one list entry."""
+        # Fetch detailed game info to get description_raw
+        game_id = game.get("id")
+        if game_id:
+            logger.debug(f"Fetching detailed info for game {game_id}")
+            async with semaphore:
+                try:
+                    game = await client.get_game_details(game_id, refresh)
+                except Exception as e:
+                    self.report.record_failure("game_id", game_id, e)
+                    return None
+        return self._process_game(game)
 
-    def fetch_games_to_json(self, limit: int = 100, output_filename: str = "") -> Path:
+    def fetch_games_to_json(
+        self,
+        limit: int = 100,
+        output_filename: str = "",
+        resume: bool = False,
+        delta: bool = False,
+    ) -> Path:
         """
         Fetch games and save directly to JSON.
 
         Args:
             limit: Max number of games to fetch (must be positive)
             output_filename: Custom filename (optional)
+            resume: Continue from the last checkpoint instead of starting over
+            delta: Only write games that are new or updated since the last
+                delta run, skipping detail requests for unchanged games
 
         Returns:
             Path to saved JSON file
 
         Raises:
             ValueError: If limit is not positive
+            IncompleteFetchError: If the run stopped early; resume it later
             IOError: If file cannot be written
         """
+        checkpoint = FetchCheckpoint(self.output_dir, "rawg")
+        resume_state = checkpoint.load() if resume else None
+        if resume_state and not output_filename:
+            output_filename = resume_state.output_filename
+
+        extension = JsonUtils.output_extension(
+            self.config.output_format, self.config.output_compression
+        )
         filename = JsonUtils.generate_timestamped_filename(
-            "rawg_games", output_filename
+            "rawg_games_delta" if delta else "rawg_games", output_filename, extension
         )
         output_path = self.output_dir / filename
+        if resume_state is None:
+            checkpoint.start(limit, filename)
 
         logger.info(f"Fetching {limit} games to {output_path}")
 
-        games = self._fetch_games_batch(limit)
+        manifest = None
+        if delta:
+            manifest = FetchManifest(self.output_dir, "rawg", "rawg_id", "updated")
+            if resume_state and resume_state.started_at:
+                manifest.run_started = resume_state.started_at
 
-        if not games:
-            logger.warning("No games fetched from RAWG")
-            JsonUtils.save_to_json([], output_path)
-            return output_path
+        collector, writer = open_output(output_path, self.config, manifest)
+        # With a writer, games stream to disk as pages arrive instead of piling
+        # up in memory
+        with writer or nullcontext():
+            self._fetch_games_batch(limit, checkpoint, resume_state, collector)
+            ensure_complete(self.report, output_path)
 
-        JsonUtils.save_to_json(games, output_path)
+        finish_output(self.report, output_path, collector, checkpoint)
         return output_path
 
+    def fetch_games_by_ids(self, game_ids: Iterable[int]) -> BulkLookupResult:
+        """
+        Fetch and process detailed data for many RAWG IDs concurrently
+
+        IDs are deduplicated and fetched with ``rawg_detail_workers`` detail
+        requests at a time, within the shared rate limit.
+
+        Args:
+            game_ids: RAWG game IDs, in any number
+
+        Returns:
+            Processed games per ID, IDs RAWG does not know (404), and IDs whose
+            request failed after retries
+        """
+        self.report = FetchReport("rawg")
+        ids = dedupe_ids(game_ids)
+        logger.info(f"Fetching detailed data for {len(ids)} RAWG games")
+
+        if self.config.async_mode:
+            outcomes = asyncio.run(self._lookup_games_async(ids))
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self.config.rawg_detail_workers,
+                thread_name_prefix="rawg-details",
+            ) as executor:
+                outcomes = list(executor.map(self._lookup_game, ids))
+
+        result = BulkLookupResult()
+        for game_id, outcome in zip(ids, outcomes):
+            if isinstance(outcome, BaseException):
+                if is_not_found(outcome):
+                    result.missing.append(game_id)
+                else:
+                    self.report.record_failure("game_id", game_id, outcome)
+                    result.record_failure([game_id], describe_error(outcome))
+                continue
+            processed = self._process_game(outcome)
+            if processed is None:
+                result.record_failure([game_id], "Invalid game data")
+            else:
+                result.found[game_id] = processed
+
+        logger.info(f"RAWG lookup of {len(ids)} IDs: {result.summary()}")
+        return result
+
+    def _lookup_game(self, game_id: int) -> Union[Dict[str, Any], Exception]:
+        """Fetch one game's details, returning the error instead of raising."""
+        try:
+            return self.client.get_game_details(game_id)
+        except Exception as e:
+            return e
+
+    async def _lookup_games_async(
+        self, game_ids: List[int]
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Fetch details for ``game_ids`` with the async client."""
+        semaphore = asyncio.Semaphore(self.config.rawg_detail_workers)
+
+        async with AsyncRAWGClient(**self._client_options()) as client:
+
+            async def lookup(game_id: int) -> Dict[str, Any]:
+                async with semaphore:
+                    return await client.get_game_details(game_id)
+
+            return await asyncio.gather(
+                *(lookup(game_id) for game_id in game_ids), return_exceptions=True
+            )
+
     def fetch_detailed_games_to_json(
         self, game_ids: List[int], output_filename: str = ""
     ) -> Path:
         """
         Fetch detailed game info for specific IDs.
 
+        Games are saved in the order requested. IDs that were not found or
+        failed are listed in a ``*_missing.json`` file next to the output.
+
         Args:
             game_ids: List of RAWG game IDs (must not be empty)
             output_filename: Custom filename (optional)
@@ -149,26 +849,16 @@ class RAWGDataFetcher:
         )
         output_path = self.output_dir / filename
 
-        logger.info(f"Fetching detailed data for {len(game_ids)} games")
-
-        detailed_games: List[Dict[str, Any]] = []
-
-        for game_id in game_ids:
-            try:
-                logger.debug(f"Fetching details for game {game_id}")
-                game_data = self.client.get_game_details(game_id)
-                processed = RAWGDataHandler.process_game_data(game_data)
-                detailed_games.append(processed)
-            except Exception as e:
-                logger.error(f"Failed to fetch game {game_id}: {e}")
-                continue
-
-        JsonUtils.save_to_json(detailed_games, output_path)
+        result = self.fetch_games_by_ids(game_ids)
+        save_lookup_output(result, dedupe_ids(game_ids), output_path)
         return output_path
 
     def close(self) -> None:
-        """Close the client."""
+        """Close the client and response cache, logging per-key usage."""
         self.client.close()
+        self.credentials.log_usage()
+        if self.cache:
+            self.cache.close()
 
 
 class IGDBDataFetcher:
@@ -184,30 +874,62 @@ class IGDBDataFetcher:
         Raises:
             ValueError: If credentials are missing
         """
-        if not config.igdb_client_id or not config.igdb_access_token:
-            raise ValueError("IGDB client ID and access token are required")
+        if not config.igdb_credential_pairs():
+            raise ValueError(
+                "IGDB client ID and access token (or client secret) are required"
+            )
 
         self.config = config
-        self.client = IGDBClient(
-            client_id=config.igdb_client_id,
-            access_token=config.igdb_access_token,
-            rate_limit=config.igdb_rate_limit,
-        )
+        self.retry_policy = build_retry_policy(config)
+        self.cache = build_response_cache(config)
+        self.credentials = build_igdb_credentials(config)
+        self.token_provider = build_token_provider(config)
+        self.payload_stats = PayloadStats(config.igdb_field_profile)
+        self.client = IGDBClient(**self._client_options())
+        self.report = FetchReport("igdb")
         self.output_dir = Path(config.data_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+    def _client_options(self) -> Dict[str, Any]:
+        """Arguments shared by the sync and async IGDB clients."""
+        return {
+            "client_id": self.config.igdb_client_id or "",
+            "access_token": self.config.igdb_access_token or "",
+            "rate_limit": self.config.igdb_rate_limit,
+            "burst": self.config.igdb_burst,
+            "max_in_flight": self.config.igdb_max_in_flight,
+            "retry_policy": self.retry_policy,
+            "cache": self.cache,
+            "credentials": self.credentials,
+            "token_provider": self.token_provider,
+            "field_profile": self.config.igdb_field_profile,
+            "payload_stats": self.payload_stats,
+            "base_url": self.config.igdb_base_url,
+        }
+
     def _fetch_games_batch(
-        self, limit: int, min_rating: int = 70
-    ) -> List[Dict[str, Any]]:
+        self,
+        limit: int,
+        min_rating: int = 70,
+        checkpoint: Optional[FetchCheckpoint] = None,
+        resume_state: Optional[CheckpointState] = None,
+        collector: Optional[GameCollector] = None,
+    ) -> List[GameRecord]:
         """
         Fetch games in batches
 
         Args:
             limit: Maximum number of games to fetch
             min_rating: Minimum rating threshold
+            checkpoint: Checkpoint updated after every offset window (optional)
+            resume_state: Progress of an interrupted run to continue from
+            collector: Destination for processed games (defaults to a list)
+
+        Offset windows are requested ``igdb_multiquery_size`` at a time through
+        IGDB's /multiquery endpoint.
 
         Returns:
-            List of processed game data
+            Processed game records (empty when the collector streams)
 
         Raises:
             ValueError: If limit is not positive
@@ -215,55 +937,403 @@ class IGDBDataFetcher:
         if limit <= 0:
             raise ValueError("Limit must be positive")
 
-        all_games: List[Dict[str, Any]] = []
-        offset = 0
-        fetched = 0
-        batch_size = min(500, limit)
-        while fetched < limit:
-            remaining = limit - fetched
-            current_batch_size = min(batch_size, remaining)
+        self.report = FetchReport("igdb")
+        collector = collector or GameCollector()
+
+        if self.config.igdb_pagination == "partitioned":
+            if self.config.async_mode:
+                logger.info("Partitioned IGDB fetches run on threads, not async")
+            # Partitions page by ID, so the top games by rating count are only
+            # known once the whole catalog has been fetched
+            catalog = GameCollector()
+            self._fetch_games_partitioned(
+                min_rating,
+                catalog,
+                collector.manifest.last_run if collector.manifest else None,
+                checkpoint,
+                resume_state,
+            )
+            collector.add(
+                rank_by_rating_count([game.to_dict() for game in catalog.games])[:limit]
+            )
+            return collector.games
+        if self.config.igdb_pagination != "offset":
+            raise ValueError(
+                f"Unknown IGDB pagination mode: {self.config.igdb_pagination}"
+            )
+
+        if self.config.async_mode:
+            return asyncio.run(
+                self._fetch_games_batch_async(
+                    limit, min_rating, checkpoint, resume_state, collector
+                )
+            )
+
+        offset = restore_progress(self.report, resume_state, 0, collector)
+        updated_since = collector.manifest.last_run if collector.manifest else None
+        consecutive_failures = 0
+        batch_size = min(MAX_QUERY_LIMIT, limit)
+        while collector.count < limit:
+            windows = plan_windows(
+                offset,
+                limit - collector.count,
+                batch_size,
+                self.config.igdb_multiquery_size,
+            )
+            offset = windows[-1][0] + windows[-1][1]
 
             logger.info(
-                f"Fetching IGDB batch: offset={offset}, limit={current_batch_size}"
+                f"Fetching {len(windows)} IGDB batches from offset {windows[0][0]}"
             )
 
+            queries = top_games_queries(
+                windows, min_rating, updated_since, self.client.fields
+            )
             try:
-                response = self.client.get_top_games(
-                    limit=current_batch_size, offset=offset, min_rating=min_rating
-                )
+                responses: List[Any] = self.client.multiquery(queries)
             except Exception as e:
-                logger.error(f"Failed to fetch IGDB batch at offset {offset}: {e}")
-                break
+                responses = [e] * len(windows)
 
-            if not response:
-                logger.info("No more games available from IGDB")
+            exhausted, consecutive_failures = self._collect_windows(
+                windows, responses, collector, limit, checkpoint, consecutive_failures
+            )
+            if exhausted:
                 break
 
-            for game in response:
-                try:
-                    processed = IGDBDataHandler.process_game_data(game)
-                    all_games.append(processed)
-                    fetched += 1
-                    if fetched >= limit:
-                        break
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to process IGDB game {game.get('id', 'unknown')}: {e}"
+        logger.info(f"Successfully fetched {collector.count} games from IGDB")
+        return collector.games
+
+    async def _fetch_games_batch_async(
+        self,
+        limit: int,
+        min_rating: int = 70,
+        checkpoint: Optional[FetchCheckpoint] = None,
+        resume_state: Optional[CheckpointState] = None,
+        collector: Optional[GameCollector] = None,
+    ) -> List[GameRecord]:
+        """
+        Fetch games with up to ``igdb_max_in_flight`` multiquery requests at once.
+
+        Args:
+            limit: Maximum number of games to fetch
+            min_rating: Minimum rating threshold
+            checkpoint: Checkpoint updated after every offset window (optional)
+            resume_state: Progress of an interrupted run to continue from
+            collector: Destination for processed games (defaults to a list)
+
+        Returns:
+            Processed game records, in offset order
+        """
+        collector = collector or GameCollector()
+        offset = restore_progress(self.report, resume_state, 0, collector)
+        updated_since = collector.manifest.last_run if collector.manifest else None
+        consecutive_failures = 0
+        batch_size = min(MAX_QUERY_LIMIT, limit)
+
+        async with AsyncIGDBClient(**self._client_options()) as client:
+            while collector.count < limit:
+                group_size = self.config.igdb_multiquery_size
+                windows = plan_windows(
+                    offset,
+                    limit - collector.count,
+                    batch_size,
+                    group_size * self.config.igdb_max_in_flight,
+                )
+                offset = windows[-1][0] + windows[-1][1]
+                groups = [
+                    windows[i : i + group_size]
+                    for i in range(0, len(windows), group_size)
+                ]
+
+                logger.info(
+                    f"Fetching {len(windows)} IGDB batches in {len(groups)} "
+                    f"requests from offset {windows[0][0]}"
+                )
+
+                group_responses = await asyncio.gather(
+                    *(
+                        client.multiquery(
+                            top_games_queries(
+                                group, min_rating, updated_since, client.fields
+                            )
+                        )
+                        for group in groups
+                    ),
+                    return_exceptions=True,
+                )
+                responses: List[Any] = []
+                for group, response in zip(groups, group_responses):
+                    if isinstance(response, BaseException):
+                        responses.extend([response] * len(group))
+                    else:
+                        responses.extend(response)
+
+                exhausted, consecutive_failures = self._collect_windows(
+                    windows,
+                    responses,
+                    collector,
+                    limit,
+                    checkpoint,
+                    consecutive_failures,
+                )
+                if exhausted:
+                    break
+
+        logger.info(f"Successfully fetched {collector.count} games from IGDB")
+        return collector.games
+
+    def _fetch_games_partitioned(
+        self,
+        min_rating: int,
+        collector: GameCollector,
+        updated_since: Optional[int] = None,
+        checkpoint: Optional[FetchCheckpoint] = None,
+        resume_state: Optional[CheckpointState] = None,
+    ) -> None:
+        """
+        Fetch the whole catalog by release date partition and ID cursor
+
+        Every partition pages independently by ``id``, so there is no offset
+        ceiling and rating changes mid-run cannot shift games between pages.
+        Each round requests the next page of every unfinished partition, 10
+        partitions per /multiquery request, with up to ``igdb_max_in_flight``
+        requests in parallel on threads (``async_mode`` does not apply). Pages
+        are processed and collected as they arrive, in partition order, until
+        every partition is exhausted; the checkpoint keeps every partition's
+        cursor.
+
+        Args:
+            min_rating: Minimum rating threshold
+            collector: Destination for processed games
+            updated_since: Only fetch games updated after this Unix time
+            checkpoint: Checkpoint updated after every partition page (optional)
+            resume_state: Progress of an interrupted run to continue from
+        """
+        partitions = release_year_partitions(self.config.igdb_partition_years)
+        # None marks a finished partition
+        cursors: Dict[str, Optional[int]] = {p.label: 0 for p in partitions}
+        if resume_state and resume_state.cursors:
+            cursors.update(resume_state.cursors)
+        elif resume_state:
+            logger.warning("Checkpoint has no IGDB partition cursors, starting over")
+            resume_state = None
+
+        round_number = restore_progress(self.report, resume_state, 0, collector)
+        seen = seen_ids(resume_state, "igdb_id")
+        failures: Dict[str, int] = {partition.label: 0 for partition in partitions}
+        active = [p for p in partitions if cursors[p.label] is not None]
+
+        with ThreadPoolExecutor(
+            max_workers=self.config.igdb_max_in_flight,
+            thread_name_prefix="igdb-partitions",
+        ) as executor:
+            while active and not self.report.stopped:
+                round_number += 1
+                logger.info(
+                    f"Fetching next page of {len(active)} IGDB partitions "
+                    f"({collector.count} games so far)"
+                )
+                groups = [
+                    active[i : i + MAX_MULTIQUERY_SIZE]
+                    for i in range(0, len(active), MAX_MULTIQUERY_SIZE)
+                ]
+                futures = [
+                    executor.submit(
+                        self.client.multiquery,
+                        [
+                            (
+                                "games",
+                                build_partition_query(
+                                    partition,
+                                    cursors[partition.label] or 0,
+                                    min_rating,
+                                    updated_since,
+                                    self.client.fields,
+                                ),
+                            )
+                            for partition in group
+                        ],
                     )
-                    continue
+                    for group in groups
+                ]
+
+                still_active: List[ReleasePartition] = []
+                for group, future in zip(groups, futures):
+                    try:
+                        responses: List[Any] = future.result()
+                    except Exception as e:
+                        responses = [e] * len(group)
+
+                    for partition, response in zip(group, responses):
+                        label = partition.label
+                        if isinstance(response, BaseException):
+                            failures[label] += 1
+                            if not is_retryable(response):
+                                self.report.stop(
+                                    f"Failed to fetch IGDB partition {label}: "
+                                    f"{response}"
+                                )
+                            elif failures[label] >= (
+                                self.config.max_consecutive_failures
+                            ):
+                                self.report.record_failure(
+                                    "partition", f"{label}@{cursors[label]}", response
+                                )
+                                self.report.stop(
+                                    f"Too many consecutive failures for IGDB "
+                                    f"partition {label}"
+                                )
+                            else:
+                                logger.warning(
+                                    f"Retrying IGDB partition {label} next round: "
+                                    f"{describe_error(response)}"
+                                )
+                                still_active.append(partition)
+                            continue
+
+                        failures[label] = 0
+                        games, duplicates = drop_seen(response, seen, len(response))
+                        self.report.duplicates += duplicates
+                        processed = self._process_games(games, len(games))
+                        collector.add(processed)
+
+                        if len(response) == MAX_QUERY_LIMIT:
+                            cursors[label] = max(game["id"] for game in response)
+                            still_active.append(partition)
+                        else:
+                            cursors[label] = None
+                        if checkpoint:
+                            checkpoint.save(
+                                round_number, processed, self.report, cursors=cursors
+                            )
+                active = still_active
+
+        logger.info(
+            f"Successfully fetched {collector.count} games from "
+            f"{len(partitions)} IGDB partitions"
+        )
+
+    def fetch_partition(
+        self, partition: ReleasePartition, min_rating: int = 70
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch and process every game in one release date partition
+
+        Used by sharded runs, where each work unit is a partition. Pages are
+        requested by ID cursor, so an error cannot be skipped past and is
+        raised for the whole partition to be retried.
+
+        Args:
+            partition: Release date range to fetch
+            min_rating: Minimum rating threshold
+
+        Returns:
+            Processed games, in ID order
+
+        Raises:
+            Exception: The first page error that survived retries
+        """
+        games: List[Dict[str, Any]] = []
+        cursor = 0
+        while True:
+            logger.info(f"Fetching IGDB partition {partition.label} after ID {cursor}")
+            query = build_partition_query(
+                partition, cursor, min_rating, None, self.client.fields
+            )
+            page = self.client.multiquery([("games", query)])[0]
+            games.extend(self._process_games(page, len(page)))
+            if len(page) < MAX_QUERY_LIMIT:
+                return games
+            cursor = max(game["id"] for game in page)
+
+    def _collect_windows(
+        self,
+        windows: List[Tuple[int, int]],
+        responses: List[Any],
+        collector: GameCollector,
+        limit: int,
+        checkpoint: Optional[FetchCheckpoint],
+        consecutive_failures: int,
+    ) -> Tuple[bool, int]:
+        """
+        Process the responses for a run of offset windows, in offset order
 
-            offset += current_batch_size
+        Args:
+            windows: (offset, size) pairs that were requested
+            responses: Games or the raised error for each window
+            collector: Destination for processed games
+            limit: Maximum number of games to fetch
+            checkpoint: Checkpoint updated after every window (optional)
+            consecutive_failures: Failed windows in a row before this call
+
+        Returns:
+            Whether the run should stop, and the updated failure streak
+        """
+        previous_error: Optional[BaseException] = None
+        for (window_offset, size), response in zip(windows, responses):
+            if isinstance(response, BaseException):
+                if not is_retryable(response):
+                    self.report.stop(
+                        f"Failed to fetch IGDB batch at offset "
+                        f"{window_offset}: {response}"
+                    )
+                    return True, consecutive_failures
+                self.report.record_failure("offset", window_offset, response)
+                # Windows of one failed multiquery share its error: count it once
+                if response is not previous_error:
+                    consecutive_failures += 1
+                previous_error = response
+                if consecutive_failures >= self.config.max_consecutive_failures:
+                    self.report.stop("Too many consecutive IGDB batch failures")
+                    return True, consecutive_failures
+                if checkpoint:
+                    checkpoint.save(window_offset + size, [], self.report)
+                continue
+
+            consecutive_failures = 0
+
+            if not response:
+                logger.info("No more games available from IGDB")
+                return True, consecutive_failures
+
+            processed = self._process_games(response, limit - collector.count)
+            collector.add(processed)
+            if checkpoint:
+                checkpoint.save(window_offset + size, processed, self.report)
 
             # If we got fewer results than requested, we've reached the end
-            if len(response) < current_batch_size:
+            if len(response) < size:
                 logger.info("Reached end of IGDB results")
-                break
+                return True, consecutive_failures
+
+        return False, consecutive_failures
 
-        logger.info(f"Successfully fetched {len(all_games)} games from IGDB")
-        return all_games
+    def _process_games(
+        self, games: List[Dict[str, Any]], limit: int
+    ) -> List[Dict[str, Any]]:
+        """Process raw IGDB games, keeping at most ``limit`` of them."""
+        processed: List[Dict[str, Any]] = []
+        start = 0
+        # Invalid games are rare, so batch exactly the games still needed and
+        # top up from the rest only when some were skipped
+        while len(processed) < limit and start < len(games):
+            end = start + limit - len(processed)
+            batch = IGDBDataHandler.process_batch(
+                games[start:end], self.config.process_workers
+            )
+            for game_id, error in batch.failures:
+                logger.warning(f"Failed to process IGDB game {game_id}: {error}")
+            processed.extend(batch.records)
+            start = end
+        return processed
 
     def fetch_games_to_json(
-        self, limit: int = 100, output_filename: str = "", min_rating: int = 70
+        self,
+        limit: int = 100,
+        output_filename: str = "",
+        min_rating: int = 70,
+        resume: bool = False,
+        delta: bool = False,
     ) -> Path:
         """
         Fetch games from IGDB and save to JSON.
@@ -272,31 +1342,119 @@ class IGDBDataFetcher:
             limit: Max number of games to fetch (must be positive)
             output_filename: Custom filename (optional)
             min_rating: Minimum game rating threshold
+            resume: Continue from the last checkpoint instead of starting over
+            delta: Only request games updated since the last delta run
 
         Returns:
             Path to saved JSON file
 
         Raises:
             ValueError: If limit is not positive
+            IncompleteFetchError: If the run stopped early; resume it later
             IOError: If file cannot be written
         """
+        checkpoint = FetchCheckpoint(self.output_dir, "igdb")
+        resume_state = checkpoint.load() if resume else None
+        if resume_state and not output_filename:
+            output_filename = resume_state.output_filename
+
+        extension = JsonUtils.output_extension(
+            self.config.output_format, self.config.output_compression
+        )
         filename = JsonUtils.generate_timestamped_filename(
-            "igdb_games", output_filename
+            "igdb_games_delta" if delta else "igdb_games", output_filename, extension
         )
         output_path = self.output_dir / filename
+        if resume_state is None:
+            checkpoint.start(limit, filename)
 
         logger.info(f"Fetching {limit} games from IGDB to {output_path}")
 
-        games = self._fetch_games_batch(limit, min_rating)
+        manifest = None
+        if delta:
+            manifest = FetchManifest(self.output_dir, "igdb", "igdb_id", "updated_at")
+            if resume_state and resume_state.started_at:
+                manifest.run_started = resume_state.started_at
+
+        collector, writer = open_output(output_path, self.config, manifest)
+        # With a writer, games stream to disk as pages arrive instead of piling
+        # up in memory
+        with writer or nullcontext():
+            self._fetch_games_batch(
+                limit, min_rating, checkpoint, resume_state, collector
+            )
+            ensure_complete(self.report, output_path)
 
-        if not games:
-            logger.warning("No games fetched from IGDB")
-            JsonUtils.save_to_json([], output_path)
-            return output_path
+        finish_output(self.report, output_path, collector, checkpoint)
+        return output_path
+
+    def fetch_games_by_ids(self, game_ids: Iterable[int]) -> BulkLookupResult:
+        """
+        Fetch and process many IGDB games by ID
+
+        Args:
+            game_ids: IGDB game IDs, in any number
+
+        Returns:
+            Processed games per ID, IDs IGDB does not know, and IDs whose
+            request failed after retries
+        """
+        if self.config.async_mode:
+            result = asyncio.run(self._lookup_games_async(game_ids))
+        else:
+            result = self.client.get_games_by_ids(game_ids)
+
+        batch = IGDBDataHandler.process_batch(
+            list(result.found.values()), self.config.process_workers
+        )
+        result.found = {int(game["igdb_id"]): game for game in batch.records}
+        for game_id, error in batch.failures:
+            logger.warning(f"Failed to process IGDB game {game_id}: {error}")
+            result.record_failure([game_id], "Invalid game data")
+        return result
+
+    async def _lookup_games_async(self, game_ids: Iterable[int]) -> BulkLookupResult:
+        """Look up ``game_ids`` with the async client."""
+        async with AsyncIGDBClient(**self._client_options()) as client:
+            return await client.get_games_by_ids(game_ids)
+
+    def fetch_detailed_games_to_json(
+        self, game_ids: List[int], output_filename: str = ""
+    ) -> Path:
+        """
+        Fetch detailed game info for specific IGDB IDs
+
+        Games are saved in the order requested. IDs that were not found or
+        failed are listed in a ``*_missing.json`` file next to the output.
+
+        Args:
+            game_ids: List of IGDB game IDs (must not be empty)
+            output_filename: Custom filename (optional)
+
+        Returns:
+            Path to saved JSON file
+
+        Raises:
+            ValueError: If game_ids is empty
+            IOError: If file cannot be written
+        """
+        if not game_ids:
+            raise ValueError("game_ids list cannot be empty")
+
+        filename = JsonUtils.generate_timestamped_filename(
+            "igdb_games_detailed", output_filename
+        )
+        output_path = self.output_dir / filename
 
-        JsonUtils.save_to_json(games, output_path)
+        result = self.fetch_games_by_ids(game_ids)
+        save_lookup_output(result, dedupe_ids(game_ids), output_path)
         return output_path
 
     def close(self) -> None:
-        """Close the IGDB client."""
+        """Close the IGDB client and response cache, logging usage and payload."""
         self.client.close()
+        self.credentials.log_usage()
+        if self.payload_stats.responses:
+            logger.info(self.payload_stats.summary())
+        if self.cache:
+            self.cache.close()
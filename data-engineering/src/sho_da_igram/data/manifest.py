@@ -0,0 +1,90 @@
+"""Manifest of previously fetched games for delta runs"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+
+class FetchManifest:
+    """
+    Remembers every game ID seen by a source with its last update timestamp
+
+    Stored as ``<source>.manifest.json`` in ``data_dir``. The manifest is only
+    written after a delta file has been saved, so an interrupted run never
+    marks games as known that never reached an output file.
+    """
+
+    def __init__(self, data_dir: Path, source: str, id_field: str, updated_field: str):
+        """
+        Load the manifest, if one exists
+
+        Args:
+            data_dir: Directory holding fetch outputs
+            source: Source name (rawg or igdb)
+            id_field: Processed game field holding the source ID
+            updated_field: Processed game field holding the update timestamp
+        """
+        self.source = source
+        self.path = Path(data_dir) / f"{source}.manifest.json"
+        self.id_field = id_field
+        self.updated_field = updated_field
+        self.last_run: Optional[int] = None
+        self.games: Dict[str, Any] = {}
+        self.run_started = int(time.time())
+        self.new = 0
+        self.changed = 0
+
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as manifest_file:
+                state = json.load(manifest_file)
+            self.last_run = state["last_run"]
+            self.games = state["games"]
+            logger.info(
+                f"Loaded {source} manifest: {len(self.games)} known games, "
+                f"last run at {self.last_run}"
+            )
+
+    def is_changed(self, game_id: Any, updated: Any) -> bool:
+        """Whether a game is new or was updated since it was last fetched."""
+        known = self.games.get(str(game_id))
+        return known is None or updated is None or known != updated
+
+    def record(self, game: Dict[str, Any]) -> None:
+        """Remember a processed game that is going into the delta file."""
+        game_id = str(game[self.id_field])
+        if game_id not in self.games:
+            self.new += 1
+        else:
+            self.changed += 1
+        self.games[game_id] = game.get(self.updated_field)
+
+    def save(self, complete: bool = True) -> None:
+        """
+        Write the manifest atomically, stamping this run as the last one
+
+        Args:
+            complete: Whether every request of the run succeeded. Otherwise
+                ``last_run`` keeps its previous value, so the next delta asks
+                again for the games the failed requests would have returned.
+        """
+        if not complete:
+            logger.warning(
+                f"{self.source} run had failures: keeping last run at {self.last_run}"
+            )
+        state = {
+            "source": self.source,
+            "last_run": self.run_started if complete else self.last_run,
+            "games": self.games,
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(state, manifest_file)
+        os.replace(tmp_path, self.path)
+        logger.info(
+            f"{self.source} delta: {self.new} new, {self.changed} updated, "
+            f"{len(self.games)} known games"
+        )
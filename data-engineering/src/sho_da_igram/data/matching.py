@@ -0,0 +1,394 @@
+"""Match RAWG games to their IGDB counterparts for the backend merge"""
+
+import json
+import os
+import re
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from ..utils.utils import JsonUtils
+
+# Same rules as the backend's GameMergeService (EtlConstants)
+MAX_NAME_DISTANCE = 2
+MIN_NAME_LENGTH = 3
+
+# Characters per name n-gram
+GRAM_SIZE = 3
+
+SLUG_MATCH = "slug"
+NAME_MATCH = "name"
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """
+    Normalize a name like the backend's ``StringUtils.normalize``
+
+    Lowercase, runs of spaces/underscores become one hyphen, anything else
+    that is not a letter, digit or hyphen is dropped.
+    """
+    normalized = re.sub(r"[\s_]+", "-", (name or "").lower().strip())
+    normalized = re.sub(r"[^a-z0-9-]", "", normalized)
+    return re.sub(r"-+", "-", normalized).strip("-")
+
+
+def name_grams(name: str) -> FrozenSet[str]:
+    """Distinct character n-grams of a normalized name, padded at both ends."""
+    padded = f"^{name}$"
+    return frozenset(
+        padded[i : i + GRAM_SIZE] for i in range(len(padded) - GRAM_SIZE + 1)
+    )
+
+
+def deletion_keys(name: str, max_deletions: int) -> Set[str]:
+    """Every string left after deleting up to ``max_deletions`` characters."""
+    keys = {name}
+    frontier = {name}
+    for _ in range(max_deletions):
+        frontier = {
+            word[:i] + word[i + 1 :] for word in frontier for i in range(len(word))
+        }
+        keys |= frontier
+    return keys
+
+
+def release_year(date: Optional[str]) -> Optional[int]:
+    """Year of an ISO release date, or None if it is missing or malformed."""
+    try:
+        return int(date[:4]) if date else None
+    except ValueError:
+        return None
+
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> Optional[int]:
+    """
+    Edit distance between two strings, if it is at most ``max_distance``
+
+    Only the diagonal band of ``max_distance`` cells either side is computed,
+    as any path leaving it costs more than the bound.
+
+    Returns:
+        The distance, or None as soon as it is known to exceed the bound
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if a == b:
+        return 0
+
+    over = max_distance + 1
+    previous = [j if j <= max_distance else over for j in range(len(b) + 1)]
+    for i, char_a in enumerate(a, start=1):
+        low = max(1, i - max_distance)
+        high = min(len(b), i + max_distance)
+        current = [over] * (len(b) + 1)
+        if i <= max_distance:
+            current[0] = i
+        for j in range(low, high + 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != b[j - 1]),
+                over,
+            )
+        if min(current[low - 1 : high + 1]) > max_distance:
+            return None
+        previous = current
+
+    distance = previous[-1]
+    return distance if distance <= max_distance else None
+
+
+@dataclass
+class GameMatch:
+    """A RAWG game and the IGDB game it duplicates"""
+
+    rawg_id: int
+    igdb_id: int
+    score: float
+    method: str
+
+
+@dataclass
+class MatchReport:
+    """
+    Counts from one matching run
+
+    ``candidates`` is the number of pairs compared after blocking.
+    """
+
+    rawg_games: int = 0
+    igdb_games: int = 0
+    candidates: int = 0
+    matches: Dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def matched(self) -> int:
+        """Total number of matches."""
+        return sum(self.matches.values())
+
+    def summary(self) -> str:
+        """One-line description for logs."""
+        methods = ", ".join(f"{n} by {m}" for m, n in sorted(self.matches.items()))
+        return (
+            f"{self.matched} matches ({methods or 'none'}) between "
+            f"{self.rawg_games} RAWG and {self.igdb_games} IGDB games; "
+            f"{self.candidates} candidate pairs scored in {self.seconds:.2f}s"
+        )
+
+
+@dataclass
+class _IndexedGame:
+    game_id: int
+    name: str
+    slug: str
+    year: Optional[int]
+
+
+class MatchIndex:
+    """
+    Blocking index over IGDB games
+
+    Games are indexed by lowercase slug, and by name within their release
+    year, because a name-only match must also share the year. A RAWG game is
+    only compared to IGDB games with the same slug from its release year or
+    without one, as the backend only considers those, or to same-year games
+    that could be within ``max_distance`` edits of its name:
+
+    - A name longer than ``short_length`` keeps an unedited run of
+      ``GRAM_SIZE`` characters (counting the padding) after that many edits,
+      and each edit changes at most ``GRAM_SIZE`` of its n-grams, so only
+      names sharing enough n-grams are compared. Candidates are found through
+      the rarest of the name's n-grams only: a name sharing ``required`` of
+      them must share one of the rarest ``len(grams) - required + 1``.
+    - Shorter names are looked up by deletion neighbourhood: two names within
+      ``max_distance`` edits have a common string left after deleting at most
+      that many characters from each.
+
+    No pair the backend rules would match is missed.
+    """
+
+    def __init__(
+        self,
+        igdb_games: List[Dict[str, Any]],
+        max_distance: int = MAX_NAME_DISTANCE,
+        min_name_length: int = MIN_NAME_LENGTH,
+    ) -> None:
+        """
+        Index processed IGDB games
+
+        Args:
+            igdb_games: Games as written by the IGDB pipeline
+            max_distance: Largest name edit distance counted as a match
+            min_name_length: Shortest normalized name matched by name
+        """
+        self.max_distance = max_distance
+        self.min_name_length = min_name_length
+        self.short_length = (GRAM_SIZE - 1) * (max_distance + 1) + max_distance - 2
+        self.compared = 0
+        self.games: List[_IndexedGame] = []
+        self.grams: List[FrozenSet[str]] = []
+        self.by_slug: Dict[str, List[int]] = defaultdict(list)
+        self.by_gram: Dict[Tuple[Optional[int], str], List[int]] = defaultdict(list)
+        self.by_deletion: Dict[Tuple[Optional[int], str], List[int]] = defaultdict(list)
+
+        for game in igdb_games:
+            indexed = _IndexedGame(
+                game_id=game["igdb_id"],
+                name=normalize_name(game.get("name")),
+                slug=(game.get("slug") or "").lower(),
+                year=release_year(game.get("first_release_date")),
+            )
+            position = len(self.games)
+            self.games.append(indexed)
+            self.grams.append(name_grams(indexed.name))
+            if indexed.slug:
+                self.by_slug[indexed.slug].append(position)
+            if len(indexed.name) < min_name_length:
+                continue
+            for gram in self.grams[position]:
+                self.by_gram[(indexed.year, gram)].append(position)
+            if len(indexed.name) <= self.short_length + max_distance:
+                for key in deletion_keys(indexed.name, max_distance):
+                    self.by_deletion[(indexed.year, key)].append(position)
+
+    def _name_candidates(self, name: str, year: Optional[int]) -> Set[int]:
+        """Positions of the same-year games that may be close to ``name``."""
+        if len(name) <= self.short_length:
+            return {
+                position
+                for key in deletion_keys(name, self.max_distance)
+                for position in self.by_deletion.get((year, key), [])
+            }
+
+        grams = name_grams(name)
+        required = max(1, len(grams) - GRAM_SIZE * self.max_distance)
+        postings = sorted(
+            (self.by_gram.get((year, gram), []) for gram in grams), key=len
+        )
+        return {
+            position
+            for posting in postings[: len(grams) - required + 1]
+            for position in posting
+            if len(grams & self.grams[position]) >= required
+        }
+
+    def candidates(self, game: Dict[str, Any]) -> List[Tuple[int, float, str]]:
+        """
+        Score the IGDB games a processed RAWG game may duplicate
+
+        Returns:
+            (igdb_id, score, method) for every shortlisted game that matches
+        """
+        rawg = _IndexedGame(
+            game_id=game["rawg_id"],
+            name=normalize_name(game.get("name")),
+            slug=(game.get("slug") or "").lower(),
+            year=release_year(game.get("released")),
+        )
+        scored: Dict[int, Tuple[float, str]] = {}
+        for position in self.by_slug.get(rawg.slug, []) if rawg.slug else []:
+            if self.games[position].year in (rawg.year, None):
+                scored[position] = (1.0, SLUG_MATCH)
+        self.compared += len(scored)
+
+        if len(rawg.name) >= self.min_name_length:
+            for position in self._name_candidates(rawg.name, rawg.year):
+                name = self.games[position].name
+                if (
+                    position in scored
+                    or abs(len(name) - len(rawg.name)) > self.max_distance
+                ):
+                    continue
+                self.compared += 1
+                distance = bounded_levenshtein(rawg.name, name, self.max_distance)
+                if distance is not None:
+                    score = 1.0 - distance / max(len(rawg.name), len(name))
+                    scored[position] = (round(score, 4), NAME_MATCH)
+
+        return [
+            (self.games[position].game_id, score, method)
+            for position, (score, method) in scored.items()
+        ]
+
+
+def match_games(
+    rawg_games: List[Dict[str, Any]],
+    igdb_games: List[Dict[str, Any]],
+    max_distance: int = MAX_NAME_DISTANCE,
+    min_name_length: int = MIN_NAME_LENGTH,
+) -> Tuple[List[GameMatch], MatchReport]:
+    """
+    Pair RAWG games with the IGDB games they duplicate
+
+    A pair matches when the slugs are equal (ignoring case) and the IGDB game
+    was released the same year or has no release date, or when the normalized
+    names are within ``max_distance`` edits and the release years agree. Each
+    game is used at most once, best scores first.
+
+    Args:
+        rawg_games: Games as written by the RAWG pipeline
+        igdb_games: Games as written by the IGDB pipeline
+        max_distance: Largest name edit distance counted as a match
+        min_name_length: Shortest normalized name matched by name
+
+    Returns:
+        Matches sorted by RAWG ID, and the run report
+    """
+    started = time.perf_counter()
+    index = MatchIndex(igdb_games, max_distance, min_name_length)
+    report = MatchReport(rawg_games=len(rawg_games), igdb_games=len(igdb_games))
+
+    pairs: List[GameMatch] = []
+    for game in rawg_games:
+        for igdb_id, score, method in index.candidates(game):
+            pairs.append(GameMatch(game["rawg_id"], igdb_id, score, method))
+    report.candidates = index.compared
+
+    pairs.sort(key=lambda pair: (-pair.score, pair.rawg_id, pair.igdb_id))
+    used_rawg: set = set()
+    used_igdb: set = set()
+    matches: List[GameMatch] = []
+    for pair in pairs:
+        if pair.rawg_id in used_rawg or pair.igdb_id in used_igdb:
+            continue
+        used_rawg.add(pair.rawg_id)
+        used_igdb.add(pair.igdb_id)
+        matches.append(pair)
+        report.matches[pair.method] = report.matches.get(pair.method, 0) + 1
+
+    matches.sort(key=lambda match: match.rawg_id)
+    report.seconds = time.perf_counter() - started
+    logger.info(f"Game matching: {report.summary()}")
+    return matches, report
+
+
+def latest_output(data_dir: Path, source: str) -> Path:
+    """
+    Newest full (not delta or detail) output file of a source in ``data_dir``
+
+    Raises:
+        FileNotFoundError: If the source has no output yet
+    """
+    pattern = re.compile(rf"{source}_games_\d{{8}}_\d{{6}}\.(json|jsonl(\.gz|\.zst)?)")
+    outputs = [
+        path
+        for path in Path(data_dir).glob(f"{source}_games_*")
+        if pattern.fullmatch(path.name)
+    ]
+    if not outputs:
+        raise FileNotFoundError(f"No {source} output in {data_dir}")
+    return max(outputs, key=lambda path: path.stat().st_mtime)
+
+
+def latest_matches(data_dir: Path) -> Optional[Path]:
+    """Newest RAWG to IGDB match file in ``data_dir``, if any."""
+    matches = list(Path(data_dir).glob("game_matches_*.json"))
+    return max(matches, key=lambda path: path.stat().st_mtime) if matches else None
+
+
+def write_matches(matches: List[GameMatch], output_path: Path) -> None:
+    """Write matches as a JSON array, atomically."""
+    tmp_path = output_path.with_name(f"{output_path.name}.part")
+    with open(tmp_path, "w", encoding=JsonUtils.DEFAULT_ENCODING) as match_file:
+        json.dump([asdict(match) for match in matches], match_file, indent=2)
+    os.replace(tmp_path, output_path)
+    logger.info(f"Saved {len(matches)} matches to {output_path}")
+
+
+def match_outputs(
+    data_dir: Path,
+    rawg_path: Optional[Path] = None,
+    igdb_path: Optional[Path] = None,
+) -> Tuple[Path, MatchReport]:
+    """
+    Match two pipeline outputs and write ``game_matches_<timestamp>.json``
+
+    Args:
+        data_dir: Directory holding fetch outputs, and the match file
+        rawg_path: RAWG output to read (defaults to the newest one)
+        igdb_path: IGDB output to read (defaults to the newest one)
+
+    Returns:
+        Path to the match file and the run report
+
+    Raises:
+        FileNotFoundError: If an output is missing
+        IOError: If a file cannot be read or written
+    """
+    rawg_path = Path(rawg_path or latest_output(data_dir, "rawg"))
+    igdb_path = Path(igdb_path or latest_output(data_dir, "igdb"))
+    logger.info(f"Matching {rawg_path} against {igdb_path}")
+
+    matches, report = match_games(
+        JsonUtils.load_records(rawg_path), JsonUtils.load_records(igdb_path)
+    )
+    output_path = Path(data_dir) / JsonUtils.generate_timestamped_filename(
+        "game_matches"
+    )
+    write_matches(matches, output_path)
+    return output_path, report
@@ -0,0 +1,85 @@
+"""Run reports for data fetchers"""
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Union
+
+from loguru import logger
+
+from ..api.retry import describe_error, is_retryable
+
+
+class IncompleteFetchError(RuntimeError):
+    """A fetch stopped early; its checkpoint is kept so it can be resumed"""
+
+
+@dataclass
+class FetchFailure:
+    """A request that still failed after retries"""
+
+    cursor_type: str
+    cursor: Union[int, str]
+    error: str
+    retryable: bool
+    failed_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    )
+
+
+@dataclass
+class FetchReport:
+    """
+    Summary of a fetch run, including every failed page, offset or game
+
+    ``duplicates`` counts list entries dropped because they were already
+    collected earlier in the run, and ``skipped`` counts unchanged games left
+    out of a delta. ``stopped`` holds the reason when the run gave up before
+    reaching its limit or the end of the catalog.
+    """
+
+    source: str
+    fetched: int = 0
+    duplicates: int = 0
+    skipped: int = 0
+    failures: List[FetchFailure] = field(default_factory=list)
+    stopped: Optional[str] = None
+
+    def record_failure(
+        self, cursor_type: str, cursor: Union[int, str], error: BaseException
+    ) -> FetchFailure:
+        """
+        Record a failed request so the run can carry on past it
+
+        Args:
+            cursor_type: What the cursor identifies (page, offset, game_id)
+            cursor: Page number, offset or ID that failed
+            error: Final error raised for the request
+
+        Returns:
+            The recorded failure
+        """
+        failure = FetchFailure(
+            cursor_type=cursor_type,
+            cursor=cursor,
+            error=describe_error(error),
+            retryable=is_retryable(error),
+        )
+        self.failures.append(failure)
+        logger.warning(
+            f"{self.source} {cursor_type} {cursor} failed and was skipped: "
+            f"{failure.error}"
+        )
+        return failure
+
+    def stop(self, reason: str) -> None:
+        """Mark the run as stopped early, before it collected everything."""
+        self.stopped = reason
+        logger.error(f"{self.source} fetch stopped early: {reason}")
+
+    def failed_cursors(self, cursor_type: str) -> List[Union[int, str]]:
+        """List the cursors of a given type that failed."""
+        return [f.cursor for f in self.failures if f.cursor_type == cursor_type]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to a JSON-serializable dictionary."""
+        return asdict(self)
@@ -0,0 +1,329 @@
+"""Sharded fetch runs: plan work units, work them from many processes, merge"""
+
+import math
+import os
+import shutil
+import socket
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+from loguru import logger
+
+from ..api.igdb_client import ReleasePartition, release_year_partitions
+from ..api.retry import describe_error
+from ..utils import codec
+from ..utils.config import Config
+from ..utils.utils import JsonLinesWriter, JsonUtils
+from .fetcher import (
+    IGDBDataFetcher,
+    RAWGDataFetcher,
+    finish_output,
+    open_output,
+    rank_by_rating_count,
+)
+from .report import FetchFailure, FetchReport
+from .work_queue import DONE, FAILED, LEASED, PENDING, WorkQueue, WorkUnit
+
+Fetcher = Union[RAWGDataFetcher, IGDBDataFetcher]
+
+# Processed game field holding each source's ID
+ID_FIELDS = {"rawg": "rawg_id", "igdb": "igdb_id"}
+
+
+def shard_dir(config: Config, source: str) -> Path:
+    """Directory holding a source's queue and per-unit results."""
+    return Path(config.data_dir) / "shards" / source
+
+
+def open_queue(config: Config, source: str) -> WorkQueue:
+    """Open the work queue of a source's sharded run."""
+    return WorkQueue(
+        shard_dir(config, source) / "queue.sqlite3",
+        lease_seconds=config.shard_lease_seconds,
+        max_attempts=config.shard_max_attempts,
+    )
+
+
+def worker_name() -> str:
+    """ID of this worker process, unique across hosts sharing a volume."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def plan_rawg_units(limit: int, pages_per_unit: int) -> Dict[str, Dict[str, Any]]:
+    """Split the RAWG list pages covering ``limit`` games into page ranges."""
+    pages = math.ceil(limit / RAWGDataFetcher.DEFAULT_PAGE_SIZE)
+    units: Dict[str, Dict[str, Any]] = {}
+    for start in range(1, pages + 1, pages_per_unit):
+        end = min(start + pages_per_unit, pages + 1)
+        units[f"pages-{start:06d}-{end - 1:06d}"] = {
+            "start_page": start,
+            "end_page": end,
+        }
+    return units
+
+
+def plan_igdb_units(span_years: int) -> Dict[str, Dict[str, Any]]:
+    """
+    One IGDB work unit per release date partition
+
+    Partitions page by ID, so every unit fetches its partition in full and
+    the limit is applied by rating count when the shards are merged.
+    """
+    return {
+        f"partition-{partition.label}": asdict(partition)
+        for partition in release_year_partitions(span_years)
+    }
+
+
+def plan_shards(
+    source: str, config: Config, limit: int, min_rating: int = 70
+) -> Tuple[WorkQueue, bool]:
+    """
+    Create the work queue for a sharded run, unless one is already planned
+
+    Planning again over an existing queue puts its failed units back in it,
+    so a merge that kept the shard directory can be retried.
+
+    Args:
+        source: rawg or igdb
+        config: Application configuration
+        limit: Max number of games in the merged output
+        min_rating: Minimum IGDB rating threshold
+
+    Returns:
+        The queue, and whether this call planned it
+
+    Raises:
+        ValueError: If the source is unknown
+    """
+    if source == "rawg":
+        units = plan_rawg_units(limit, config.shard_pages_per_unit)
+    elif source == "igdb":
+        units = plan_igdb_units(config.igdb_partition_years)
+    else:
+        raise ValueError(f"Unknown source: {source}")
+
+    extension = JsonUtils.output_extension(
+        config.output_format, config.output_compression
+    )
+    meta = {
+        "source": source,
+        "limit": limit,
+        "min_rating": min_rating,
+        "output_filename": JsonUtils.generate_timestamped_filename(
+            f"{source}_games", "", extension
+        ),
+    }
+    queue = open_queue(config, source)
+    planned = queue.plan(units, meta)
+    if not planned:
+        retried = queue.retry_failed()
+        if retried:
+            logger.info(f"Re-queued {retried} failed {source} units")
+        logger.info(f"{source} shards already planned: {queue.counts()}")
+    return queue, planned
+
+
+class ShardWorker:
+    """
+    Claims work units from a source's queue until none are left
+
+    Each unit's games are written to ``<unit_id>.jsonl`` in the shard
+    directory. A background thread renews the unit's lease every third of
+    ``shard_lease_seconds`` while it is being fetched.
+    """
+
+    def __init__(self, source: str, config: Config) -> None:
+        """
+        Open the queue and the source's fetcher
+
+        Args:
+            source: rawg or igdb
+            config: Application configuration
+
+        Raises:
+            ValueError: If the source is unknown or credentials are missing
+        """
+        if source not in ID_FIELDS:
+            raise ValueError(f"Unknown source: {source}")
+
+        self.source = source
+        self.config = config
+        self.name = worker_name()
+        self.queue = open_queue(config, source)
+        self.meta = self.queue.meta()
+        self.fetcher: Fetcher = (
+            RAWGDataFetcher(config) if source == "rawg" else IGDBDataFetcher(config)
+        )
+        self.completed = 0
+        self.fetched = 0
+
+    def run(self) -> int:
+        """
+        Work until every unit is done or failed
+
+        Returns:
+            Number of units this worker completed
+        """
+        while True:
+            unit = self.queue.claim(self.name)
+            if unit is None:
+                if not self.queue.counts()[LEASED]:
+                    break
+                # Another worker holds the rest; its lease may still expire
+                time.sleep(min(self.config.shard_lease_seconds / 3, 5.0))
+                continue
+            self._work(unit)
+
+        logger.info(
+            f"Worker {self.name} finished: {self.completed} {self.source} units, "
+            f"{self.fetched} games"
+        )
+        return self.completed
+
+    def _work(self, unit: WorkUnit) -> None:
+        logger.info(
+            f"Worker {self.name} claimed {self.source} unit {unit.unit_id} "
+            f"(attempt {unit.attempts})"
+        )
+        stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(unit, stop),
+            name=f"{self.source}-heartbeat",
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            result = self._fetch_unit(unit)
+        except Exception as e:
+            logger.error(f"{self.source} unit {unit.unit_id} failed: {e}")
+            self.queue.fail(unit, self.name, describe_error(e))
+            return
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        if self.queue.complete(unit, self.name, result):
+            self.completed += 1
+            self.fetched += result["games"]
+        else:
+            logger.warning(f"Lease on {unit.unit_id} was lost before it completed")
+
+    def _heartbeat(self, unit: WorkUnit, stop: threading.Event) -> None:
+        while not stop.wait(self.config.shard_lease_seconds / 3):
+            if not self.queue.heartbeat(unit, self.name):
+                logger.warning(f"Lost the lease on {self.source} unit {unit.unit_id}")
+                return
+
+    def _fetch_unit(self, unit: WorkUnit) -> Dict[str, Any]:
+        """Fetch one unit's games to its result file."""
+        self.fetcher.report = FetchReport(self.source)
+        if isinstance(self.fetcher, RAWGDataFetcher):
+            games = self.fetcher.fetch_page_range(
+                unit.payload["start_page"], unit.payload["end_page"]
+            )
+        else:
+            games = self.fetcher.fetch_partition(
+                ReleasePartition(**unit.payload), self.meta.get("min_rating", 70)
+            )
+
+        result_path = shard_dir(self.config, self.source) / f"{unit.unit_id}.jsonl"
+        with JsonLinesWriter(result_path) as writer:
+            writer.write_many(games)
+        return {
+            "path": result_path.name,
+            "games": len(games),
+            "failures": self.fetcher.report.to_dict()["failures"],
+        }
+
+    def close(self) -> None:
+        """Close the queue and the fetcher."""
+        self.queue.close()
+        self.fetcher.close()
+
+
+def load_unit_games(path: Path) -> List[Dict[str, Any]]:
+    """Read the games of one completed unit."""
+    with open(path, encoding=JsonUtils.DEFAULT_ENCODING) as unit_file:
+        return [codec.loads(line) for line in unit_file if line.strip()]
+
+
+def merge_shards(source: str, config: Config) -> Tuple[Path, FetchReport]:
+    """
+    Combine the results of a finished sharded run into the usual output file
+
+    Games are deduplicated by ID and cut to the planned limit, in page order
+    for RAWG and by rating count for IGDB. Failed units are listed in the
+    failures file. The queue and unit files are removed after a clean merge;
+    if any unit failed they are kept, so planning again re-queues the failed
+    units for more workers and a later merge.
+
+    Args:
+        source: rawg or igdb
+        config: Application configuration
+
+    Returns:
+        Path to the output file and the merged run report
+
+    Raises:
+        RuntimeError: If units are still pending or leased
+        IOError: If a file cannot be written
+    """
+    queue = open_queue(config, source)
+    try:
+        counts = queue.counts()
+        if counts[PENDING] or counts[LEASED]:
+            raise RuntimeError(
+                f"{counts[PENDING] + counts[LEASED]} {source} work units are "
+                f"unfinished; run more workers before merging"
+            )
+        if not counts[DONE] and not counts[FAILED]:
+            raise RuntimeError(f"No {source} shards are planned")
+
+        meta = queue.meta()
+        report = FetchReport(source)
+        for unit_id, error in queue.errors().items():
+            report.failures.append(FetchFailure("unit", unit_id, error, True))
+
+        id_field = ID_FIELDS[source]
+        games_by_id: Dict[Any, Dict[str, Any]] = {}
+        for result in queue.results():
+            report.failures.extend(FetchFailure(**f) for f in result["failures"])
+            for game in load_unit_games(shard_dir(config, source) / result["path"]):
+                if game[id_field] in games_by_id:
+                    report.duplicates += 1
+                    continue
+                games_by_id[game[id_field]] = game
+    finally:
+        queue.close()
+
+    games = list(games_by_id.values())
+    if source == "igdb":
+        games = rank_by_rating_count(games)
+    games = games[: meta["limit"]]
+
+    output_path = Path(config.data_dir) / meta["output_filename"]
+    collector, writer = open_output(output_path, config)
+    if writer:
+        with writer:
+            collector.add(games)
+    else:
+        collector.add(games)
+    finish_output(report, output_path, collector)
+
+    if counts[FAILED]:
+        logger.warning(
+            f"Kept {shard_dir(config, source)}: plan the {source} shards again to "
+            f"retry {counts[FAILED]} failed units, then work and merge"
+        )
+    else:
+        shutil.rmtree(shard_dir(config, source))
+    logger.info(
+        f"Merged {counts[DONE]} {source} units into {output_path} "
+        f"({counts[FAILED]} failed units)"
+    )
+    return output_path, report
@@ -0,0 +1,375 @@
+"""Precompute TF-IDF similar games with sparse matrix products"""
+
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+
+from ..utils.utils import JsonLinesWriter, JsonUtils
+from .matching import latest_matches, latest_output
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError as e:
+    raise ImportError(
+        "The similarity stage requires numpy and scipy "
+        "(install the 'similarity' extra)"
+    ) from e
+
+# Same weighting as the backend's SimilarityConstants
+FIELD_WEIGHTS = {
+    "description": 2.0,
+    "genre": 5.0,
+    "theme": 4.0,
+    "keyword": 2.5,
+}
+SIMILARITY_POWER = 1.5
+SCORE_DECIMALS = 4
+
+# Cells of the dense score block each matrix product produces
+BLOCK_CELLS = 1 << 22
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# Processed game fields feeding each weighted field, per source
+SOURCE_FIELDS = {
+    "rawg": {
+        "id": "rawg_id",
+        "description": ("description_raw",),
+        "genre": "genres",
+        "theme": None,
+        "keyword": "tags",
+    },
+    "igdb": {
+        "id": "igdb_id",
+        "description": ("summary", "storyline"),
+        "genre": "genres",
+        "theme": "themes",
+        "keyword": "keywords",
+    },
+}
+
+
+@dataclass
+class GameDocument:
+    """Text of one game, split into the weighted fields"""
+
+    source: str
+    game_id: int
+    fields: Dict[str, str]
+
+
+@dataclass
+class SimilarityReport:
+    """
+    Counts and timings from one similarity run
+
+    ``merged`` counts RAWG games left out because they duplicate an IGDB game.
+    """
+
+    games: int = 0
+    merged: int = 0
+    terms: int = 0
+    pairs: int = 0
+    blocks: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        """One-line description for logs."""
+        steps = ", ".join(f"{step} {secs:.2f}s" for step, secs in self.timings.items())
+        return (
+            f"{self.pairs} similar pairs for {self.games} games over "
+            f"{self.terms} terms in {self.blocks} blocks ({steps})"
+        )
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, close to Lucene's StandardAnalyzer."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def build_document(game: Dict[str, Any], source: str) -> Optional[GameDocument]:
+    """
+    Collect a processed game's weighted fields
+
+    Returns:
+        The document, or None when the game has no description, as the
+        backend skips those
+    """
+    spec = SOURCE_FIELDS[source]
+    description = next(
+        (game[name] for name in spec["description"] if game.get(name)), None
+    )
+    if not description or not description.strip():
+        return None
+
+    fields = {"description": description}
+    for name in ("genre", "theme", "keyword"):
+        values = game.get(spec[name]) if spec[name] else None
+        if values:
+            fields[name] = " ".join(values)
+    return GameDocument(source, game[spec["id"]], fields)
+
+
+def build_tfidf_matrix(
+    documents: Sequence[GameDocument],
+) -> Tuple["sparse.csr_matrix", int]:
+    """
+    Build the row-normalized, field-weighted TF-IDF matrix of the documents
+
+    Each field gets its own document frequencies, like a Lucene field, and a
+    term's weights from all fields are summed into one column.
+
+    Returns:
+        The matrix (one row per document) and the number of distinct terms
+    """
+    vocabulary: Dict[str, int] = {}
+    total = len(documents)
+    weighted = None
+    for name, weight in FIELD_WEIGHTS.items():
+        rows: List[int] = []
+        columns: List[int] = []
+        for row, document in enumerate(documents):
+            text = document.fields.get(name)
+            if not text:
+                continue
+            tokens = [
+                vocabulary.setdefault(token, len(vocabulary))
+                for token in tokenize(text)
+            ]
+            rows.extend([row] * len(tokens))
+            columns.extend(tokens)
+
+        counts = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, columns)),
+            shape=(total, len(vocabulary)),
+        )
+        counts.sum_duplicates()
+        doc_freq = np.bincount(counts.indices, minlength=len(vocabulary))
+        idf = np.log(total / np.maximum(doc_freq, 1), dtype=np.float32)
+        counts.data *= idf[counts.indices] * np.float32(weight)
+
+        if weighted is None:
+            weighted = counts
+        else:
+            weighted.resize(counts.shape)
+            weighted = weighted + counts
+
+    norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1))).ravel()
+    norms[norms == 0] = 1.0
+    matrix = sparse.diags(1.0 / norms).dot(weighted).astype(np.float32).tocsr()
+    return matrix, len(vocabulary)
+
+
+_matrix: Optional["sparse.csr_matrix"] = None
+_matrix_t: Optional["sparse.csr_matrix"] = None
+
+
+def _init_worker(matrix: "sparse.csr_matrix") -> None:
+    """Give a worker process its copy of the matrix, once."""
+    global _matrix, _matrix_t
+    _matrix = matrix
+    _matrix_t = matrix.T.tocsr()
+
+
+def top_neighbors(
+    start: int, end: int, top_k: int, min_cosine: float
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Best-scoring neighbours of rows ``start`` to ``end`` of the worker matrix
+
+    Returns:
+        Row, neighbour and cosine arrays, best first within each row
+    """
+    block = (_matrix[start:end] @ _matrix_t).toarray()
+    size, total = block.shape
+    block[np.arange(size), np.arange(start, end)] = -1.0
+
+    k = min(top_k, total - 1)
+    if k <= 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float32)
+    columns = np.argpartition(-block, k - 1, axis=1)[:, :k]
+    scores = np.take_along_axis(block, columns, axis=1)
+    order = np.lexsort((columns, -scores), axis=1)
+    columns = np.take_along_axis(columns, order, axis=1)
+    scores = np.take_along_axis(scores, order, axis=1)
+
+    rows = np.repeat(np.arange(start, end), k).reshape(size, k)
+    keep = scores >= min_cosine
+    return rows[keep], columns[keep], scores[keep]
+
+
+def plan_blocks(total: int) -> List[Tuple[int, int]]:
+    """Row ranges whose score blocks stay within ``BLOCK_CELLS`` cells."""
+    rows = max(1, BLOCK_CELLS // max(total, 1))
+    return [(start, min(start + rows, total)) for start in range(0, total, rows)]
+
+
+def compute_similarities(
+    matrix: "sparse.csr_matrix",
+    top_k: int,
+    min_score: float,
+    workers: int,
+) -> Iterator[Tuple["np.ndarray", "np.ndarray", "np.ndarray"]]:
+    """
+    Yield (rows, neighbours, scores) per block, in row order
+
+    Blocks are spread over ``workers`` processes, each holding its own copy
+    of the matrix. Scores are cosines raised to ``SIMILARITY_POWER``, and only
+    those of at least ``min_score`` are kept.
+    """
+    min_cosine = min_score ** (1.0 / SIMILARITY_POWER)
+    blocks = plan_blocks(matrix.shape[0])
+
+    def finish(
+        result: Tuple["np.ndarray", "np.ndarray", "np.ndarray"],
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        rows, columns, cosines = result
+        return rows, columns, np.power(cosines, SIMILARITY_POWER)
+
+    if workers <= 1 or len(blocks) == 1:
+        _init_worker(matrix)
+        for start, end in blocks:
+            yield finish(top_neighbors(start, end, top_k, min_cosine))
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(matrix,)
+    ) as executor:
+        results = executor.map(
+            top_neighbors,
+            [start for start, _ in blocks],
+            [end for _, end in blocks],
+            [top_k] * len(blocks),
+            [min_cosine] * len(blocks),
+        )
+        for result in results:
+            yield finish(result)
+
+
+def load_documents(
+    data_dir: Path, paths: Sequence[Path], report: SimilarityReport
+) -> List[GameDocument]:
+    """
+    Load the games to compare from pipeline outputs
+
+    Without ``paths``, the newest full output of each source is used and RAWG
+    games matched to an IGDB game by the newest match file are left out, as
+    the backend merges them into that game.
+
+    Raises:
+        FileNotFoundError: If there is no output to read
+        ValueError: If a path's source is unknown
+    """
+    sources: List[Tuple[str, Path]] = []
+    for path in paths:
+        name = Path(path).name
+        source = next((s for s in SOURCE_FIELDS if name.startswith(f"{s}_")), None)
+        if source is None:
+            raise ValueError(f"Cannot tell the source of {path}")
+        sources.append((source, Path(path)))
+    if not paths:
+        for source in SOURCE_FIELDS:
+            try:
+                sources.append((source, latest_output(data_dir, source)))
+            except FileNotFoundError:
+                logger.warning(f"No {source} output in {data_dir}; skipping it")
+    if not sources:
+        raise FileNotFoundError(f"No game outputs in {data_dir}")
+
+    merged: Set[int] = set()
+    matches_path = latest_matches(data_dir)
+    if not paths and len(sources) == len(SOURCE_FIELDS) and matches_path:
+        merged = {match["rawg_id"] for match in JsonUtils.load_records(matches_path)}
+
+    documents: List[GameDocument] = []
+    for source, path in sources:
+        for game in JsonUtils.load_records(path):
+            if source == "rawg" and game.get("rawg_id") in merged:
+                report.merged += 1
+                continue
+            document = build_document(game, source)
+            if document:
+                documents.append(document)
+        logger.info(f"Loaded {source} games from {path}")
+    if report.merged:
+        logger.info(f"Left out {report.merged} RAWG games matched in {matches_path}")
+    return documents
+
+
+def compute_similar_games(
+    data_dir: Path,
+    paths: Sequence[Path] = (),
+    top_k: int = 20,
+    min_score: float = 0.25,
+    workers: int = 0,
+    compression: str = "none",
+) -> Tuple[Path, SimilarityReport]:
+    """
+    Write the top ``top_k`` similar games of every game with a description
+
+    The output is a JSON Lines file of ``source``, ``id``, ``similar_source``,
+    ``similar_id`` and ``score`` rows, best first for each game.
+
+    Args:
+        data_dir: Directory holding fetch outputs, and the similarity file
+        paths: Outputs to read (defaults to the newest of each source)
+        top_k: Similar games kept per game
+        min_score: Lowest score kept, after the backend's power adjustment
+        workers: Processes computing score blocks (0 for one per CPU)
+        compression: One of none, gzip or zstd
+
+    Returns:
+        Path to the similarity file and the run report
+
+    Raises:
+        FileNotFoundError: If there is no output to read
+        ValueError: If a path's source is unknown or no game has a description
+        IOError: If a file cannot be read or written
+    """
+    report = SimilarityReport()
+    started = time.perf_counter()
+    documents = load_documents(data_dir, paths, report)
+    report.games = len(documents)
+    report.timings["load"] = time.perf_counter() - started
+    if not documents:
+        raise ValueError("No games with a description to compare")
+
+    started = time.perf_counter()
+    matrix, report.terms = build_tfidf_matrix(documents)
+    report.timings["tf-idf"] = time.perf_counter() - started
+
+    output_path = Path(data_dir) / JsonUtils.generate_timestamped_filename(
+        "game_similarities", extension=JsonUtils.output_extension("ndjson", compression)
+    )
+    started = time.perf_counter()
+    with JsonLinesWriter(output_path, compression) as writer:
+        for rows, columns, scores in compute_similarities(
+            matrix, top_k, min_score, workers or os.cpu_count() or 1
+        ):
+            report.blocks += 1
+            report.pairs += len(rows)
+            for row, column, score in zip(
+                rows.tolist(), columns.tolist(), scores.tolist()
+            ):
+                game, similar = documents[row], documents[column]
+                writer.write(
+                    {
+                        "source": game.source,
+                        "id": game.game_id,
+                        "similar_source": similar.source,
+                        "similar_id": similar.game_id,
+                        "score": round(score, SCORE_DECIMALS),
+                    }
+                )
+    report.timings["similarity"] = time.perf_counter() - started
+
+    logger.info(f"TF-IDF similarity: {report.summary()}")
+    return output_path, report
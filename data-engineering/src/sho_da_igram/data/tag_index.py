@@ -0,0 +1,419 @@
+"""Approximate tag-overlap neighbours with MinHash signatures and LSH banding"""
+
+import bisect
+import hashlib
+import json
+import os
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+
+from ..utils.utils import JsonLinesWriter, JsonUtils
+from .matching import latest_matches, latest_output, normalize_name
+
+# Mersenne prime modulus of the MinHash permutations
+HASH_PRIME = (1 << 61) - 1
+
+SCORE_DECIMALS = 4
+
+# Processed game list fields feeding each tag category, per source. RAWG tags
+# are keywords, as in the backend import.
+TAG_FIELDS = {
+    "rawg": {
+        "id": "rawg_id",
+        "genre": "genres",
+        "keyword": "tags",
+    },
+    "igdb": {
+        "id": "igdb_id",
+        "genre": "genres",
+        "theme": "themes",
+        "keyword": "keywords",
+        "franchise": "franchises",
+    },
+}
+
+GameKey = Tuple[str, int]
+TagSet = FrozenSet[str]
+
+
+def tag_set(game: Dict[str, Any], source: str) -> TagSet:
+    """
+    Category-prefixed, normalized tags of a processed game
+
+    ``Action`` as a genre becomes ``genre:action``, so a genre and a theme
+    with the same name stay different tags.
+    """
+    spec = TAG_FIELDS[source]
+    tags = set()
+    for category, name in spec.items():
+        if category == "id":
+            continue
+        for value in game.get(name) or []:
+            normalized = normalize_name(value)
+            if normalized:
+                tags.add(f"{category}:{normalized}")
+    return frozenset(tags)
+
+
+class MinHasher:
+    """
+    MinHash signatures from ``permutations`` seeded universal hash functions
+
+    The chance that two sets share a signature position is their Jaccard
+    similarity. Tags are hashed with BLAKE2 rather than ``hash()``, which is
+    salted per process, so signatures are the same from one run to the next.
+    """
+
+    def __init__(self, permutations: int, seed: int = 1) -> None:
+        rng = random.Random(seed)
+        self.permutations = [
+            (rng.randrange(1, HASH_PRIME), rng.randrange(HASH_PRIME))
+            for _ in range(permutations)
+        ]
+        self._tag_hashes: Dict[str, Tuple[int, ...]] = {}
+
+    def tag_hashes(self, tag: str) -> Tuple[int, ...]:
+        """Permuted hashes of one tag, computed once per distinct tag."""
+        hashes = self._tag_hashes.get(tag)
+        if hashes is None:
+            digest = hashlib.blake2b(tag.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "big")
+            hashes = tuple((a * value + b) % HASH_PRIME for a, b in self.permutations)
+            self._tag_hashes[tag] = hashes
+        return hashes
+
+    def signature(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        """Smallest permuted hash of the tags, per permutation."""
+        return tuple(map(min, zip(*(self.tag_hashes(tag) for tag in tags))))
+
+
+@dataclass
+class TagIndexReport:
+    """
+    Counts from one tag index update
+
+    ``candidates`` is the number of distinct tag sets scored across queries.
+    """
+
+    games: int = 0
+    tag_sets: int = 0
+    inserted: int = 0
+    removed: int = 0
+    candidates: int = 0
+    pairs: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        """One-line description for logs."""
+        return (
+            f"{self.pairs} neighbour pairs for {self.games} games "
+            f"({self.tag_sets} distinct tag sets, {self.inserted} inserted, "
+            f"{self.removed} removed); {self.candidates} candidate sets scored "
+            f"in {self.seconds:.2f}s"
+        )
+
+
+class TagIndex:
+    """
+    LSH index of game tag sets for approximate Jaccard neighbours
+
+    Each distinct tag set gets a MinHash signature of ``bands * rows`` values,
+    split into ``bands`` bands. Sets are only compared when some band of their
+    signatures is identical, which happens with probability
+    ``1 - (1 - J**rows) ** bands`` for Jaccard similarity ``J``: close sets are
+    nearly always compared and distant ones rarely are. Candidates are then
+    ranked by their exact Jaccard similarity.
+
+    Games with identical tag sets share one entry, so a popular combination of
+    genres is scored once per query however many games carry it. Inserting a
+    game only touches its own buckets, so delta fetches update the index in
+    place.
+    """
+
+    def __init__(self, bands: int = 32, rows: int = 3, seed: int = 1) -> None:
+        """
+        Create an empty index
+
+        Args:
+            bands: Signature bands, each a chance for two sets to be compared
+            rows: Signature values per band; more rows need closer sets
+            seed: Seed of the MinHash permutations
+
+        Raises:
+            ValueError: If bands or rows is not positive
+        """
+        if bands < 1 or rows < 1:
+            raise ValueError("Tag index bands and rows must be positive")
+        self.bands = bands
+        self.rows = rows
+        self.hasher = MinHasher(bands * rows, seed)
+        self.compared = 0
+        self.tags: Dict[GameKey, TagSet] = {}
+        self.members: Dict[TagSet, List[GameKey]] = {}
+        self.signatures: Dict[TagSet, Tuple[int, ...]] = {}
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], Set[TagSet]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __contains__(self, key: GameKey) -> bool:
+        return key in self.tags
+
+    def _band_keys(
+        self, signature: Tuple[int, ...]
+    ) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [
+            (band, signature[band * self.rows : (band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    def insert(self, key: GameKey, tags: TagSet) -> bool:
+        """
+        Add a game, replacing its previous tags if it is already indexed
+
+        Returns:
+            Whether the game is indexed; games without tags are removed instead
+        """
+        if self.tags.get(key) == tags:
+            return True
+        self.remove(key)
+        if not tags:
+            return False
+
+        self.tags[key] = tags
+        members = self.members.get(tags)
+        if members is None:
+            members = self.members[tags] = []
+            signature = self.signatures[tags] = self.hasher.signature(tags)
+            for band_key in self._band_keys(signature):
+                self.buckets[band_key].add(tags)
+        bisect.insort(members, key)
+        return True
+
+    def remove(self, key: GameKey) -> bool:
+        """
+        Drop a game from the index
+
+        Returns:
+            Whether the game was indexed
+        """
+        tags = self.tags.pop(key, None)
+        if tags is None:
+            return False
+
+        members = self.members[tags]
+        del members[bisect.bisect_left(members, key)]
+        if not members:
+            del self.members[tags]
+            for band_key in self._band_keys(self.signatures.pop(tags)):
+                bucket = self.buckets[band_key]
+                bucket.discard(tags)
+                if not bucket:
+                    del self.buckets[band_key]
+        return True
+
+    def query(
+        self,
+        tags: TagSet,
+        top_k: int,
+        min_jaccard: float = 0.0,
+        exclude: Optional[GameKey] = None,
+    ) -> List[Tuple[GameKey, float]]:
+        """
+        Approximate nearest games to a tag set
+
+        Args:
+            tags: Tags to look up
+            top_k: Most games returned
+            min_jaccard: Lowest Jaccard similarity returned
+            exclude: Game left out of the results, usually the one queried
+
+        Returns:
+            (game key, Jaccard similarity) pairs, most similar first
+        """
+        if not tags or top_k <= 0:
+            return []
+        signature = self.signatures.get(tags) or self.hasher.signature(tags)
+        candidates: Set[TagSet] = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self.buckets.get(band_key, ()))
+        self.compared += len(candidates)
+
+        scored = []
+        for other in candidates:
+            shared = len(tags & other)
+            score = shared / (len(tags) + len(other) - shared)
+            if score >= min_jaccard:
+                scored.append((score, self.members[other]))
+        scored.sort(key=lambda item: (-item[0], item[1][0]))
+
+        neighbors: List[Tuple[GameKey, float]] = []
+        for score, members in scored:
+            for member in members:
+                if member == exclude:
+                    continue
+                neighbors.append((member, score))
+                if len(neighbors) == top_k:
+                    return neighbors
+        return neighbors
+
+    def neighbors(
+        self, key: GameKey, top_k: int, min_jaccard: float = 0.0
+    ) -> List[Tuple[GameKey, float]]:
+        """Approximate nearest games to an indexed game, most similar first."""
+        return self.query(self.tags[key], top_k, min_jaccard, exclude=key)
+
+    def save(self, path: Path) -> None:
+        """Write the indexed tag sets as JSON, atomically."""
+        games: Dict[str, Dict[str, List[str]]] = defaultdict(dict)
+        for (source, game_id), tags in sorted(self.tags.items()):
+            games[source][str(game_id)] = sorted(tags)
+        tmp_path = Path(path).with_name(f"{Path(path).name}.tmp")
+        with open(tmp_path, "w", encoding=JsonUtils.DEFAULT_ENCODING) as index_file:
+            json.dump({"games": games}, index_file)
+        os.replace(tmp_path, path)
+        logger.info(f"Saved tag index of {len(self.tags)} games to {path}")
+
+    @classmethod
+    def load(
+        cls, path: Path, bands: int = 32, rows: int = 3, seed: int = 1
+    ) -> "TagIndex":
+        """
+        Rebuild an index from saved tag sets
+
+        Only tag sets are stored, so the bands and rows may differ from the
+        run that saved them.
+
+        Raises:
+            IOError: If the file cannot be read
+        """
+        index = cls(bands, rows, seed)
+        with open(path, encoding=JsonUtils.DEFAULT_ENCODING) as index_file:
+            state = json.load(index_file)
+        for source, games in state["games"].items():
+            for game_id, tags in games.items():
+                index.insert((source, int(game_id)), frozenset(tags))
+        logger.info(f"Loaded tag index of {len(index)} games from {path}")
+        return index
+
+
+def index_path(data_dir: Path) -> Path:
+    """Where the tag index of ``data_dir`` is kept."""
+    return Path(data_dir) / "tag_index.json"
+
+
+def output_source(path: Path) -> str:
+    """
+    Source of a pipeline output, from its file name
+
+    Raises:
+        ValueError: If the name does not start with a known source
+    """
+    name = Path(path).name
+    source = next((s for s in TAG_FIELDS if name.startswith(f"{s}_")), None)
+    if source is None:
+        raise ValueError(f"Cannot tell the source of {path}")
+    return source
+
+
+def update_tag_index(
+    data_dir: Path,
+    paths: Sequence[Path] = (),
+    top_k: int = 10,
+    min_jaccard: float = 0.3,
+    bands: int = 32,
+    rows: int = 3,
+    compression: str = "none",
+) -> Tuple[Path, TagIndexReport]:
+    """
+    Update the tag index and write every game's tag-overlap neighbours
+
+    Without ``paths``, the index is rebuilt from the newest full output of
+    each source. With ``paths``, such as delta outputs, the saved index is
+    loaded and their games are inserted, replacing earlier versions. Either
+    way, RAWG games matched to an IGDB game by the newest match file are left
+    out, as the backend merges them into that game.
+
+    The neighbours are written to ``game_tag_neighbors_<timestamp>.jsonl`` as
+    ``source``, ``id``, ``similar_source``, ``similar_id`` and ``jaccard``
+    rows, most similar first for each game.
+
+    Args:
+        data_dir: Directory holding fetch outputs, the index and the output
+        paths: Outputs to insert (defaults to rebuilding from the newest ones)
+        top_k: Neighbours kept per game
+        min_jaccard: Lowest Jaccard similarity kept
+        bands: LSH bands of the index
+        rows: Signature values per band
+        compression: One of none, gzip or zstd
+
+    Returns:
+        Path to the neighbour file and the run report
+
+    Raises:
+        FileNotFoundError: If there is no output to read
+        ValueError: If a path's source is unknown
+        IOError: If a file cannot be read or written
+    """
+    started = time.perf_counter()
+    report = TagIndexReport()
+    saved_path = index_path(data_dir)
+
+    sources: List[Tuple[str, Path]] = [(output_source(p), Path(p)) for p in paths]
+    if paths and saved_path.exists():
+        index = TagIndex.load(saved_path, bands, rows)
+    else:
+        index = TagIndex(bands, rows)
+    if not paths:
+        for source in TAG_FIELDS:
+            try:
+                sources.append((source, latest_output(data_dir, source)))
+            except FileNotFoundError:
+                logger.warning(f"No {source} output in {data_dir}; skipping it")
+    if not sources:
+        raise FileNotFoundError(f"No game outputs in {data_dir}")
+
+    for source, path in sources:
+        id_field = TAG_FIELDS[source]["id"]
+        for game in JsonUtils.load_records(path):
+            key = (source, game[id_field])
+            if index.insert(key, tag_set(game, source)):
+                report.inserted += 1
+        logger.info(f"Indexed {source} games from {path}")
+
+    matches_path = latest_matches(data_dir)
+    if matches_path:
+        for match in JsonUtils.load_records(matches_path):
+            report.removed += index.remove(("rawg", match["rawg_id"]))
+    index.save(saved_path)
+
+    report.games = len(index)
+    report.tag_sets = len(index.members)
+    output_path = Path(data_dir) / JsonUtils.generate_timestamped_filename(
+        "game_tag_neighbors",
+        extension=JsonUtils.output_extension("ndjson", compression),
+    )
+    with JsonLinesWriter(output_path, compression) as writer:
+        for key in sorted(index.tags):
+            for (source, game_id), score in index.neighbors(key, top_k, min_jaccard):
+                writer.write(
+                    {
+                        "source": key[0],
+                        "id": key[1],
+                        "similar_source": source,
+                        "similar_id": game_id,
+                        "jaccard": round(score, SCORE_DECIMALS),
+                    }
+                )
+                report.pairs += 1
+
+    report.candidates = index.compared
+    report.seconds = time.perf_counter() - started
+    logger.info(f"Tag index: {report.summary()}")
+    return output_path, report
@@ -0,0 +1,251 @@
+"""SQLite-backed work queue for sharded fetch runs"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class WorkUnit:
+    """One claimed unit of work"""
+
+    unit_id: str
+    seq: int
+    payload: Dict[str, Any]
+    attempts: int = 0
+
+
+class WorkQueue:
+    """
+    Work units shared by worker processes through one SQLite file
+
+    A worker claims a unit by taking a lease on it, keeps the lease alive with
+    heartbeats while it works, then marks the unit done with its result. Units
+    whose lease expires (the worker crashed or lost its host) become claimable
+    again, and units that fail ``max_attempts`` times are marked failed.
+
+    The database uses SQLite's default rollback journal rather than WAL, so it
+    can live on a volume shared by several hosts as long as that filesystem
+    supports POSIX locks.
+    """
+
+    def __init__(
+        self, path: Path, lease_seconds: float = 300.0, max_attempts: int = 3
+    ) -> None:
+        """
+        Open (or create) the queue database
+
+        Args:
+          path: SQLite file holding the queue
+          lease_seconds: How long a claim stays valid without a heartbeat
+          max_attempts: Claims per unit before it is marked failed
+        """
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path, timeout=60.0, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS units (
+                unit_id TEXT PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                worker TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                result TEXT,
+                error TEXT,
+                updated_at REAL NOT NULL
+            )
+            """)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+
+    def plan(self, units: Dict[str, Dict[str, Any]], meta: Dict[str, Any]) -> bool:
+        """
+        Fill an empty queue with work units
+
+        Args:
+          units: Payload per unit ID, in merge order
+          meta: Run settings the merge step needs (limit, output file, ...)
+
+        Returns:
+          True if the units were added, False if the queue was already planned
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._conn.execute("SELECT COUNT(*) FROM units").fetchone()[0]:
+                    self._conn.execute("ROLLBACK")
+                    return False
+                self._conn.executemany(
+                    "INSERT INTO units (unit_id, seq, payload, status, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (unit_id, seq, json.dumps(payload), PENDING, now)
+                        for seq, (unit_id, payload) in enumerate(units.items())
+                    ],
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [(key, json.dumps(value)) for key, value in meta.items()],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        logger.info(f"Planned {len(units)} work units in {self.path}")
+        return True
+
+    def meta(self) -> Dict[str, Any]:
+        """Run settings stored when the queue was planned."""
+        with self._lock:
+            rows = self._conn.execute("SELECT key, value FROM meta").fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def claim(self, worker: str) -> Optional[WorkUnit]:
+        """
+        Lease the next pending or expired unit
+
+        Args:
+          worker: ID of the claiming worker
+
+        Returns:
+          The claimed unit, or None if nothing is claimable right now
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Workers that keep losing a unit count as failed attempts too
+                self._conn.execute(
+                    "UPDATE units SET status = ?, error = ?, updated_at = ? "
+                    "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                    (FAILED, "lease expired", now, LEASED, now, self.max_attempts),
+                )
+                row = self._conn.execute(
+                    "SELECT unit_id, seq, payload, attempts FROM units "
+                    "WHERE status = ? OR (status = ? AND lease_expires < ?) "
+                    "ORDER BY seq LIMIT 1",
+                    (PENDING, LEASED, now),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                unit_id, seq, payload, attempts = row
+                self._conn.execute(
+                    "UPDATE units SET status = ?, worker = ?, lease_expires = ?, "
+                    "attempts = attempts + 1, updated_at = ? WHERE unit_id = ?",
+                    (LEASED, worker, now + self.lease_seconds, now, unit_id),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return WorkUnit(unit_id, seq, json.loads(payload), attempts + 1)
+
+    def heartbeat(self, unit: WorkUnit, worker: str) -> bool:
+        """Extend a lease; False if the worker no longer holds it."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE units SET lease_expires = ?, updated_at = ? "
+                "WHERE unit_id = ? AND worker = ? AND status = ?",
+                (now + self.lease_seconds, now, unit.unit_id, worker, LEASED),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, unit: WorkUnit, worker: str, result: Dict[str, Any]) -> bool:
+        """
+        Mark a leased unit done
+
+        Returns:
+          False if the lease was lost to another worker in the meantime
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE units SET status = ?, result = ?, error = NULL, "
+                "lease_expires = NULL, updated_at = ? "
+                "WHERE unit_id = ? AND worker = ? AND status = ?",
+                (DONE, json.dumps(result), time.time(), unit.unit_id, worker, LEASED),
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, unit: WorkUnit, worker: str, error: str) -> None:
+        """Release a unit after an error, failing it for good past max_attempts."""
+        status = FAILED if unit.attempts >= self.max_attempts else PENDING
+        with self._lock:
+            self._conn.execute(
+                "UPDATE units SET status = ?, error = ?, lease_expires = NULL, "
+                "updated_at = ? WHERE unit_id = ? AND worker = ? AND status = ?",
+                (status, error, time.time(), unit.unit_id, worker, LEASED),
+            )
+        if status == FAILED:
+            logger.error(
+                f"Work unit {unit.unit_id} failed {unit.attempts} times: {error}"
+            )
+
+    def retry_failed(self) -> int:
+        """
+        Make failed units claimable again, with a fresh attempt count
+
+        Returns:
+          Number of units put back in the queue
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE units SET status = ?, worker = NULL, attempts = 0, "
+                "error = NULL, updated_at = ? WHERE status = ?",
+                (PENDING, time.time(), FAILED),
+            )
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Number of units per status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM units GROUP BY status"
+            ).fetchall()
+        counts = {status: 0 for status in (PENDING, LEASED, DONE, FAILED)}
+        counts.update(dict(rows))
+        return counts
+
+    def results(self) -> List[Dict[str, Any]]:
+        """Results of completed units, in plan order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT result FROM units WHERE status = ? ORDER BY seq", (DONE,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def errors(self) -> Dict[str, str]:
+        """Last error of every failed unit."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT unit_id, error FROM units WHERE status = ? ORDER BY seq",
+                (FAILED,),
+            ).fetchall()
+        return dict(rows)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
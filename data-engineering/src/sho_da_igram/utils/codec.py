@@ -0,0 +1,182 @@
+"""
+JSON encoding and decoding with the fastest installed backend
+
+orjson or msgspec (the ``fast-json`` extra) decode API responses and pipeline
+files, falling back to the standard library when they are missing or reject
+a document the standard library accepts, such as one holding ``NaN``.
+Decoded values are the same whichever backend is used, except integers
+beyond 64 bits, which orjson reads as floats; API IDs and counts are far
+smaller.
+
+Encoding differs in details: the fast backends write floats such as ``1e16``
+without the ``+`` and padding Python uses, and non-finite floats as
+``null``. In compatibility mode, the default, output files are therefore
+encoded by the standard library and stay byte-identical to older runs;
+without it the fast backend encodes them too.
+"""
+
+import json
+from typing import IO, Any, Optional, Sequence, Union
+
+from .records import GameRecord, to_json_value, write_json_array
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+BACKENDS = ("auto", "orjson", "msgspec", "stdlib")
+
+# Raised by the fast encoders for values they cannot write, such as integers
+# beyond 64 bits; the standard library encodes those instead
+ENCODE_ERRORS = (TypeError, ValueError, OverflowError) + (
+    (msgspec.EncodeError,) if msgspec else ()
+)
+
+
+class JsonCodec:
+    """Decodes and encodes JSON with one backend"""
+
+    def __init__(self, backend: str = "auto", compat: bool = True) -> None:
+        """
+        Args:
+            backend: One of auto, orjson, msgspec or stdlib; auto picks the
+                first one installed in that order
+            compat: Encode output files exactly as the standard library does
+
+        Raises:
+            ValueError: If the backend is unknown or not installed
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        if backend == "auto":
+            backend = "orjson" if orjson else "msgspec" if msgspec else "stdlib"
+        if (backend == "orjson" and orjson is None) or (
+            backend == "msgspec" and msgspec is None
+        ):
+            hint = " (install the 'fast-json' extra)" if backend == "orjson" else ""
+            raise ValueError(
+                f"The {backend} JSON backend requires the '{backend}' package{hint}"
+            )
+        self.backend = backend
+        self.compat = compat
+        if backend == "msgspec":
+            self._msgspec_encoder = msgspec.json.Encoder(enc_hook=to_json_value)
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.backend!r}, compat={self.compat})"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode one JSON document
+
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+        if self.backend == "orjson":
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        elif self.backend == "msgspec":
+            try:
+                return msgspec.json.decode(data)
+            except msgspec.DecodeError:
+                pass
+        return json.loads(data)
+
+    def dumps_line(self, value: Any) -> str:
+        """Encode a value compactly on one line, as JSON Lines files hold it."""
+        if not self.compat:
+            encoded = self._encode(value)
+            if encoded is not None:
+                return encoded.decode("utf-8")
+        return json.dumps(
+            value, ensure_ascii=False, default=to_json_value, separators=(",", ":")
+        )
+
+    def dump_document(self, data: Sequence[Any], stream: IO[str], indent: int) -> None:
+        """
+        Write a list of records or values as an indented JSON document
+
+        Game records are encoded straight from their slots in compatibility
+        mode, in ``json.dump``'s layout.
+        """
+        if not self.compat:
+            encoded = self._encode(data, indent)
+            if encoded is not None:
+                stream.write(encoded.decode("utf-8"))
+                return
+        if all(isinstance(item, GameRecord) for item in data):
+            write_json_array(data, stream, indent)
+        else:
+            json.dump(
+                data, stream, indent=indent, ensure_ascii=False, default=to_json_value
+            )
+
+    def _encode(self, value: Any, indent: Optional[int] = None) -> Optional[bytes]:
+        """
+        Encode with the fast backend
+
+        Returns:
+            The UTF-8 JSON, or None when the backend cannot write this
+            indentation or value, for the standard library to encode instead
+        """
+        try:
+            if self.backend == "orjson" and indent in (None, 2):
+                # Records are dataclasses; pass them to the hook for their dicts
+                option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+                if indent:
+                    option |= orjson.OPT_INDENT_2
+                return orjson.dumps(value, default=to_json_value, option=option)
+            if self.backend == "msgspec":
+                # msgspec always encodes dataclasses itself, so convert records
+                if isinstance(value, GameRecord):
+                    value = value.to_dict()
+                elif isinstance(value, (list, tuple)):
+                    value = [
+                        item.to_dict() if isinstance(item, GameRecord) else item
+                        for item in value
+                    ]
+                encoded = self._msgspec_encoder.encode(value)
+                return (
+                    msgspec.json.format(encoded, indent=indent) if indent else encoded
+                )
+        except ENCODE_ERRORS:
+            pass
+        return None
+
+
+_codec = JsonCodec()
+
+
+def get_codec() -> JsonCodec:
+    """The codec used by the pipeline."""
+    return _codec
+
+
+def configure_codec(backend: str = "auto", compat: bool = True) -> JsonCodec:
+    """
+    Select the pipeline's JSON backend
+
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    global _codec
+    _codec = JsonCodec(backend, compat)
+    return _codec
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode one JSON document with the pipeline's codec."""
+    return _codec.loads(data)
+
+
+def dumps_line(value: Any) -> str:
+    """Encode one JSON Lines line with the pipeline's codec."""
+    return _codec.dumps_line(value)
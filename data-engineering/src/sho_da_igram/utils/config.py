@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
@@ -10,39 +10,174 @@ from pydantic import BaseModel
 load_dotenv()
 
 
+def parse_list(value: Optional[str]) -> List[str]:
+    """Split a comma-separated environment value, dropping blanks."""
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def parse_credential_pairs(value: Optional[str]) -> List[Tuple[str, str]]:
+    """Parse ``client_id:token`` pairs from a comma-separated value."""
+    pairs = []
+    for item in parse_list(value):
+        client_id, _, token = item.partition(":")
+        if not client_id or not token:
+            raise ValueError("IGDB_CREDENTIALS entries must be client_id:token")
+        pairs.append((client_id, token))
+    return pairs
+
+
 class Config(BaseModel):
     """Simple config for data fetching."""
 
     rawg_api_key: Optional[str] = None
+    rawg_api_keys: List[str] = []  # Extra keys to rotate requests across
     rawg_rate_limit: float = 1.0
+    rawg_burst: int = 1
+    rawg_max_in_flight: int = 8
+    rawg_detail_workers: int = 8
+    rawg_base_url: str = "https://api.rawg.io/api"
 
     igdb_client_id: Optional[str] = None
     igdb_access_token: Optional[str] = None
+    igdb_client_secret: Optional[str] = None  # Enables managed, refreshed tokens
+    igdb_token_cache: str = ".cache/igdb_token.json"
+    igdb_token_refresh_margin: float = 600.0  # Seconds before expiry to refresh
+    igdb_credentials: List[Tuple[str, str]] = []  # Extra (client ID, token) pairs
     igdb_rate_limit: float = 0.25  # 4 requests per second
+    igdb_burst: int = 4
+    igdb_max_in_flight: int = 8  # IGDB allows 8 open requests
+    igdb_multiquery_size: int = 10  # Offset windows per /multiquery request
+    igdb_pagination: str = "offset"  # offset or partitioned
+    igdb_partition_years: int = 5
+    igdb_field_profile: str = "recommendation"  # minimal, recommendation or full
+    igdb_base_url: str = "https://api.igdb.com/v4"
 
     data_dir: str = "data"
     fetch_limit: int = 100
+    output_format: str = "json"  # json or ndjson
+    output_compression: str = "none"  # none, gzip or zstd (ndjson only)
+    json_backend: str = "auto"  # auto, orjson, msgspec or stdlib
+    json_compat: bool = True  # Encode outputs byte-identically to the stdlib
+
+    async_mode: bool = False
+    process_workers: int = 1  # Processes for large batches, 0 = one per CPU
+
+    similarity_top_k: int = 20  # Similar games kept per game
+    similarity_min_score: float = 0.25
+    similarity_workers: int = 0  # Processes for score blocks, 0 = one per CPU
+
+    tag_top_k: int = 10  # Tag-overlap neighbours kept per game
+    tag_min_jaccard: float = 0.3
+    tag_lsh_bands: int = 32
+    tag_lsh_rows: int = 3  # MinHash values per band
+
+    credential_max_strikes: int = 3  # 401/429s in a row before a key is dropped
+    credential_cooldown: float = 300.0  # Seconds a throttled key is set aside
+
+    shard_pages_per_unit: int = 25  # RAWG list pages per work unit
+    shard_lease_seconds: float = 300.0
+    shard_max_attempts: int = 3
+
+    cache_enabled: bool = True
+    cache_path: str = ".cache/responses.sqlite3"
+    cache_ttl: float = 86400.0  # 1 day
+    cache_max_mb: int = 512
+    cache_bypass: bool = False
+
+    retry_max_attempts: int = 4
+    retry_base_delay: float = 0.5
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 30.0
+    max_consecutive_failures: int = 5
 
     log_level: str = "INFO"
     log_to_file: bool = True
     log_file: str = "logs/pipeline.log"
 
+    metrics_textfile: str = "metrics/pipeline.prom"  # Empty to disable
+    metrics_summary: str = "metrics/run_summary.json"  # Empty to disable
+
     @classmethod
     def from_env(cls) -> "Config":
         """Load from environment."""
         return cls(
             rawg_api_key=os.getenv("RAWG_API_KEY"),
+            rawg_api_keys=parse_list(os.getenv("RAWG_API_KEYS")),
             rawg_rate_limit=float(os.getenv("RAWG_RATE_LIMIT", "1.0")),
+            rawg_burst=int(os.getenv("RAWG_BURST", "1")),
+            rawg_max_in_flight=int(os.getenv("RAWG_MAX_IN_FLIGHT", "8")),
+            rawg_detail_workers=int(os.getenv("RAWG_DETAIL_WORKERS", "8")),
+            rawg_base_url=os.getenv("RAWG_BASE_URL", "https://api.rawg.io/api"),
             igdb_client_id=os.getenv("IGDB_CLIENT_ID"),
             igdb_access_token=os.getenv("IGDB_ACCESS_TOKEN"),
+            igdb_client_secret=os.getenv("IGDB_CLIENT_SECRET"),
+            igdb_token_cache=os.getenv("IGDB_TOKEN_CACHE", ".cache/igdb_token.json"),
+            igdb_token_refresh_margin=float(
+                os.getenv("IGDB_TOKEN_REFRESH_MARGIN", "600")
+            ),
+            igdb_credentials=parse_credential_pairs(os.getenv("IGDB_CREDENTIALS")),
             igdb_rate_limit=float(os.getenv("IGDB_RATE_LIMIT", "0.25")),
+            igdb_burst=int(os.getenv("IGDB_BURST", "4")),
+            igdb_max_in_flight=int(os.getenv("IGDB_MAX_IN_FLIGHT", "8")),
+            igdb_multiquery_size=int(os.getenv("IGDB_MULTIQUERY_SIZE", "10")),
+            igdb_pagination=os.getenv("IGDB_PAGINATION", "offset"),
+            igdb_partition_years=int(os.getenv("IGDB_PARTITION_YEARS", "5")),
+            igdb_field_profile=os.getenv("IGDB_FIELD_PROFILE", "recommendation"),
+            igdb_base_url=os.getenv("IGDB_BASE_URL", "https://api.igdb.com/v4"),
             data_dir=os.getenv("DATA_DIR", "data"),
             fetch_limit=int(os.getenv("FETCH_LIMIT", "100")),
+            output_format=os.getenv("OUTPUT_FORMAT", "json"),
+            output_compression=os.getenv("OUTPUT_COMPRESSION", "none"),
+            json_backend=os.getenv("JSON_BACKEND", "auto"),
+            json_compat=os.getenv("JSON_COMPAT", "true").lower() == "true",
+            async_mode=os.getenv("ASYNC_MODE", "false").lower() == "true",
+            process_workers=int(os.getenv("PROCESS_WORKERS", "1")),
+            similarity_top_k=int(os.getenv("SIMILARITY_TOP_K", "20")),
+            similarity_min_score=float(os.getenv("SIMILARITY_MIN_SCORE", "0.25")),
+            similarity_workers=int(os.getenv("SIMILARITY_WORKERS", "0")),
+            tag_top_k=int(os.getenv("TAG_TOP_K", "10")),
+            tag_min_jaccard=float(os.getenv("TAG_MIN_JACCARD", "0.3")),
+            tag_lsh_bands=int(os.getenv("TAG_LSH_BANDS", "32")),
+            tag_lsh_rows=int(os.getenv("TAG_LSH_ROWS", "3")),
+            credential_max_strikes=int(os.getenv("CREDENTIAL_MAX_STRIKES", "3")),
+            credential_cooldown=float(os.getenv("CREDENTIAL_COOLDOWN", "300")),
+            shard_pages_per_unit=int(os.getenv("SHARD_PAGES_PER_UNIT", "25")),
+            shard_lease_seconds=float(os.getenv("SHARD_LEASE_SECONDS", "300")),
+            shard_max_attempts=int(os.getenv("SHARD_MAX_ATTEMPTS", "3")),
+            cache_enabled=os.getenv("CACHE_ENABLED", "true").lower() == "true",
+            cache_path=os.getenv("CACHE_PATH", ".cache/responses.sqlite3"),
+            cache_ttl=float(os.getenv("CACHE_TTL", "86400")),
+            cache_max_mb=int(os.getenv("CACHE_MAX_MB", "512")),
+            cache_bypass=os.getenv("CACHE_BYPASS", "false").lower() == "true",
+            retry_max_attempts=int(os.getenv("RETRY_MAX_ATTEMPTS", "4")),
+            retry_base_delay=float(os.getenv("RETRY_BASE_DELAY", "0.5")),
+            circuit_failure_threshold=int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")),
+            circuit_reset_timeout=float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30.0")),
+            max_consecutive_failures=int(os.getenv("MAX_CONSECUTIVE_FAILURES", "5")),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             log_to_file=os.getenv("LOG_TO_FILE", "true").lower() == "true",
             log_file=os.getenv("LOG_FILE", "logs/pipeline.log"),
+            metrics_textfile=os.getenv("METRICS_TEXTFILE", "metrics/pipeline.prom"),
+            metrics_summary=os.getenv("METRICS_SUMMARY", "metrics/run_summary.json"),
         )
 
+    def rawg_keys(self) -> List[str]:
+        """Every configured RAWG key, RAWG_API_KEY first, without duplicates."""
+        keys = [self.rawg_api_key] if self.rawg_api_key else []
+        return list(dict.fromkeys(keys + self.rawg_api_keys))
+
+    def igdb_credential_pairs(self) -> List[Tuple[str, str]]:
+        """
+        Every configured IGDB (client ID, token) pair, without duplicates
+
+        With a client secret the main pair's token is managed by a token
+        provider, so it may be empty here.
+        """
+        pairs = []
+        if self.igdb_client_id and (self.igdb_access_token or self.igdb_client_secret):
+            pairs.append((self.igdb_client_id, self.igdb_access_token or ""))
+        return list(dict.fromkeys(pairs + list(self.igdb_credentials)))
+
     def setup_logging(self) -> None:
         """Setup basic logging."""
         from loguru import logger
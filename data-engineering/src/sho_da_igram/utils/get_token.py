@@ -1,41 +1,38 @@
 """Get IGDB access token"""
 
 import os
+import time
+from pathlib import Path
 
 import httpx
 from dotenv import load_dotenv
 
+from ..api.igdb_auth import TokenProvider
+
 load_dotenv()
 
 # Your credentials from Twitch Developer Console
 CLIENT_ID = os.getenv("IGDB_CLIENT_ID", "")
 CLIENT_SECRET = os.getenv("IGDB_CLIENT_SECRET", "")
-URL = "https://id.twitch.tv/oauth2/token"
+TOKEN_CACHE = os.getenv("IGDB_TOKEN_CACHE", ".cache/igdb_token.json")
 
 
 def get_access_token():
-    data = {
-        "client_id": CLIENT_ID,
-        "client_secret": CLIENT_SECRET,
-        "grant_type": "client_credentials",
-    }
-
-    client = httpx.Client()
-    response = client.post(URL, data=data)
-
-    if response.status_code == 200:
-        token_data = response.json()
-        print("✅ Success!")
-        print(f"Access Token: {token_data['access_token']}")
-        expires_in = token_data["expires_in"]
-        print(f"Expires in: {expires_in} seconds ({expires_in // 3600} hours)")
-        client.close()
-        return token_data["access_token"]
-    else:
-        print(f"❌ Error {response.status_code}: {response.text}")
-        client.close()
+    """Fetch a new token and store it in the token cache the pipeline reads."""
+    try:
+        provider = TokenProvider(CLIENT_ID, CLIENT_SECRET, Path(TOKEN_CACHE))
+        token, expires_at = provider.refresh()
+    except (ValueError, httpx.HTTPError) as e:
+        print(f"❌ Error: {e}")
         return None
 
+    expires_in = int(expires_at - time.time())
+    print("✅ Success!")
+    print(f"Access Token: {token}")
+    print(f"Expires in: {expires_in} seconds ({expires_in // 3600} hours)")
+    print(f"Cached in {TOKEN_CACHE}")
+    return token
+
 
 if __name__ == "__main__":
     token = get_access_token()
@@ -0,0 +1,359 @@
+"""
+Run metrics: request, rate-limit, retry and stage counters per endpoint
+
+The clients, rate limiters, retry policy, data handlers and output writers
+record into one process-wide registry. At the end of a run ``main.py``
+writes it as a Prometheus textfile (for node_exporter's textfile collector)
+and as a JSON run summary. Every run starts from zero, so counters hold the
+totals of the last run.
+"""
+
+import bisect
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+NAMESPACE = "sho_da_igram"
+
+# Upper bounds in seconds; API requests take from tens of milliseconds to
+# several seconds for large IGDB windows
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Name: (type, help) of every metric, in export order
+METRICS: Dict[str, Tuple[str, str]] = {
+    "requests_total": ("counter", "HTTP requests sent, per endpoint and status"),
+    "request_duration_seconds": ("histogram", "HTTP request latency"),
+    "response_bytes_total": ("counter", "Response body bytes received"),
+    "cache_hits_total": ("counter", "Responses served from the response cache"),
+    "rate_limit_wait_seconds_total": (
+        "counter",
+        "Seconds requests slept in the rate limiter, summed over requests",
+    ),
+    "rate_limit_waits_total": ("counter", "Requests delayed by the rate limiter"),
+    "retries_total": ("counter", "Requests retried after a transient failure"),
+    "stage_records_total": ("counter", "Records handled by a pipeline stage"),
+    "stage_seconds_total": ("counter", "Seconds spent in a pipeline stage"),
+    "stage_records_per_second": ("gauge", "Records per second of a pipeline stage"),
+    "run_records": ("gauge", "Games written by the last run, per source"),
+    "run_failures": ("gauge", "Failed requests of the last run, per source"),
+    "run_duration_seconds": ("gauge", "Duration of the last run, per source"),
+    "run_success": ("gauge", "Whether the last run of a source succeeded"),
+    "last_run_timestamp_seconds": ("gauge", "Unix time the last run finished"),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def endpoint_label(endpoint: str) -> str:
+    """An endpoint with numeric path segments collapsed, e.g. ``games/{id}``."""
+    return re.sub(r"(^|/)\d+(?=/|$)", r"\1{id}", endpoint)
+
+
+def format_labels(labels: Labels) -> str:
+    """Prometheus label set text, escaped, e.g. ``{source="rawg"}``."""
+    if not labels:
+        return ""
+    pairs = (
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels
+    )
+    return "{" + ",".join(pairs) + "}"
+
+
+class Histogram:
+    """Cumulative bucket counts, sum and count of observed values"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add one value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(upper bound, values at or below it) per bucket, ending with +Inf."""
+        bounds = [repr(bound) for bound in self.buckets] + ["+Inf"]
+        total, result = 0, []
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Estimate a quantile as Prometheus' ``histogram_quantile`` does
+
+        Interpolates linearly within the bucket holding the quantile; values
+        in the last, unbounded bucket are reported as the highest bound.
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        total, lower = 0, 0.0
+        for bound, count in zip(self.buckets, self.counts):
+            if count and total + count >= rank:
+                return lower + (bound - lower) * (rank - total) / count
+            total += count
+            lower = bound
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    """Thread-safe counters, gauges and histograms keyed by name and labels"""
+
+    def __init__(self, namespace: str = NAMESPACE) -> None:
+        self.namespace = namespace
+        self.started_at = time.time()
+        self._values: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _labels(labels: Dict[str, Any]) -> Labels:
+        return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """Add ``value`` to a counter."""
+        key = self._labels(labels)
+        with self._lock:
+            series = self._values.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, **labels: Any) -> None:
+        """Set a gauge."""
+        key = self._labels(labels)
+        with self._lock:
+            self._values.setdefault(name, {})[key] = value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Add a value to a histogram."""
+        key = self._labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+
+    def record_request(
+        self,
+        source: str,
+        endpoint: str,
+        status: Any,
+        seconds: float,
+        size: int = 0,
+    ) -> None:
+        """
+        Record one HTTP request attempt
+
+        Args:
+            source: API name, rawg or igdb
+            endpoint: Endpoint path; numeric segments are collapsed
+            status: Response status code, or ``error`` if no response came
+            seconds: Time from sending the request to reading the response
+            size: Response body bytes
+        """
+        endpoint = endpoint_label(endpoint)
+        self.inc("requests_total", source=source, endpoint=endpoint, status=status)
+        self.observe(
+            "request_duration_seconds", seconds, source=source, endpoint=endpoint
+        )
+        if size:
+            self.inc("response_bytes_total", size, source=source, endpoint=endpoint)
+
+    @contextmanager
+    def track_request(self, source: str, endpoint: str) -> Iterator["RequestSample"]:
+        """
+        Time a request attempt; set the sample's response inside the block
+
+        A block left by an exception is recorded with status ``error``.
+        """
+        sample = RequestSample()
+        started = time.perf_counter()
+        try:
+            yield sample
+        finally:
+            response = sample.response
+            self.record_request(
+                source,
+                endpoint,
+                response.status_code if response is not None else "error",
+                time.perf_counter() - started,
+                len(response.content) if response is not None else 0,
+            )
+
+    def record_stage(
+        self, stage: str, source: str, records: int, seconds: float
+    ) -> None:
+        """Add records handled and time spent by a pipeline stage."""
+        self.inc("stage_records_total", records, stage=stage, source=source)
+        self.inc("stage_seconds_total", seconds, stage=stage, source=source)
+
+    @contextmanager
+    def time_stage(self, stage: str, source: str, records: int) -> Iterator[None]:
+        """Time a block handling ``records`` records in a pipeline stage."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(stage, source, records, time.perf_counter() - started)
+
+    def _stage_rates(self) -> Dict[Labels, float]:
+        """Records per second of each stage, from its record and time totals."""
+        records = self._values.get("stage_records_total", {})
+        seconds = self._values.get("stage_seconds_total", {})
+        return {
+            labels: count / seconds[labels]
+            for labels, count in records.items()
+            if seconds.get(labels)
+        }
+
+    def render_prometheus(self) -> str:
+        """The registry in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            values = {name: dict(series) for name, series in self._values.items()}
+            values["stage_records_per_second"] = self._stage_rates()
+            histograms = {
+                name: dict(series) for name, series in self._histograms.items()
+            }
+
+        for name, (kind, help_text) in METRICS.items():
+            series = histograms.get(name) if kind == "histogram" else values.get(name)
+            if not series:
+                continue
+            full_name = f"{self.namespace}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            for labels, value in sorted(series.items()):
+                if isinstance(value, Histogram):
+                    for bound, count in value.cumulative():
+                        bucket = format_labels(labels + (("le", bound),))
+                        lines.append(f"{full_name}_bucket{bucket} {count}")
+                    lines.append(
+                        f"{full_name}_sum{format_labels(labels)} {value.sum!r}"
+                    )
+                    lines.append(
+                        f"{full_name}_count{format_labels(labels)} {value.count}"
+                    )
+                else:
+                    lines.append(f"{full_name}{format_labels(labels)} {value!r}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        The registry as a JSON-friendly run summary
+
+        Requests are grouped per endpoint with their status counts, bytes and
+        latency estimates; stages carry their records per second.
+        """
+        with self._lock:
+            values = {name: dict(series) for name, series in self._values.items()}
+            latencies = dict(self._histograms.get("request_duration_seconds", {}))
+            rates = self._stage_rates()
+
+        def grouped(name: str, *keys: str) -> Dict[str, Dict[Labels, float]]:
+            groups: Dict[str, Dict[Labels, float]] = {}
+            for labels, value in values.get(name, {}).items():
+                named = dict(labels)
+                group = " ".join(named.pop(key, "") for key in keys)
+                groups.setdefault(group, {})[tuple(named.items())] = value
+            return groups
+
+        endpoints: Dict[str, Dict[str, Any]] = {}
+        for labels, histogram in sorted(latencies.items()):
+            named = dict(labels)
+            key = f"{named['source']} {named['endpoint']}"
+            endpoints[key] = {
+                "requests": histogram.count,
+                "statuses": {},
+                "bytes": 0,
+                "mean_ms": round(histogram.sum / histogram.count * 1000, 2),
+                "p50_ms": round(histogram.quantile(0.50) * 1000, 2),
+                "p99_ms": round(histogram.quantile(0.99) * 1000, 2),
+            }
+        for key, series in grouped("requests_total", "source", "endpoint").items():
+            for labels, count in series.items():
+                endpoints[key]["statuses"][dict(labels)["status"]] = int(count)
+        for key, series in grouped(
+            "response_bytes_total", "source", "endpoint"
+        ).items():
+            endpoints[key]["bytes"] = int(sum(series.values()))
+
+        stages: Dict[str, Dict[str, Any]] = {}
+        for labels, records in sorted(values.get("stage_records_total", {}).items()):
+            named = dict(labels)
+            stages[f"{named['source']} {named['stage']}"] = {
+                "records": int(records),
+                "seconds": round(values["stage_seconds_total"].get(labels, 0.0), 3),
+                "records_per_s": round(rates.get(labels, 0.0), 1),
+            }
+
+        def totals(name: str, key: str) -> Dict[str, float]:
+            return {
+                group: round(sum(series.values()), 3)
+                for group, series in sorted(grouped(name, key).items())
+            }
+
+        return {
+            "endpoints": endpoints,
+            "cache_hits": totals("cache_hits_total", "source"),
+            "rate_limit_wait_seconds": totals(
+                "rate_limit_wait_seconds_total", "limiter"
+            ),
+            "rate_limit_waits": totals("rate_limit_waits_total", "limiter"),
+            "retries": totals("retries_total", "target"),
+            "stages": stages,
+        }
+
+    def write_textfile(self, path: Path) -> None:
+        """
+        Write the Prometheus textfile atomically
+
+        The textfile collector may read the directory at any time, so the
+        file is written beside its final path and renamed into place.
+        """
+        write_atomic(Path(path), self.render_prometheus())
+
+
+class RequestSample:
+    """Response of a tracked request attempt, set once it arrives"""
+
+    __slots__ = ("response",)
+
+    def __init__(self) -> None:
+        self.response: Optional[Any] = None
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Write a text file through a temporary file and a rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.part")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def write_summary(path: Path, summary: Dict[str, Any]) -> None:
+    """Write a run summary as an indented JSON document."""
+    write_atomic(Path(path), json.dumps(summary, indent=2) + "\n")
+
+
+_metrics = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """The process-wide metrics registry."""
+    return _metrics
@@ -0,0 +1,278 @@
+"""Compact typed records for processed games"""
+
+import json
+import math
+import sys
+from dataclasses import dataclass, fields
+from json.encoder import encode_basestring
+from operator import attrgetter
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+Names = Tuple[Any, ...]
+
+
+def intern_names(values: Optional[Iterable[Any]]) -> Names:
+    """
+    Tuple of list values with strings interned
+
+    Genre, platform and company names repeat across thousands of games; once
+    interned, every record shares one copy of each name.
+    """
+    if not values:
+        return ()
+    return tuple(sys.intern(value) if type(value) is str else value for value in values)
+
+
+def encode_value(value: Any, indent: int, newline: str) -> str:
+    """
+    JSON text of one value, as ``json.dumps(value, indent=indent)`` writes it
+
+    Args:
+        value: Value to encode
+        indent: Spaces per nesting level
+        newline: Line break plus the indentation of the value's own level
+    """
+    kind = type(value)
+    if kind is str:
+        return encode_basestring(value)
+    if value is None:
+        return "null"
+    if kind is int:
+        return int.__repr__(value)
+    if kind is float and math.isfinite(value):
+        return float.__repr__(value)
+    # Booleans, NaN and nested containers take the standard encoder
+    return json.dumps(
+        value, indent=indent, ensure_ascii=False, default=to_json_value
+    ).replace("\n", newline)
+
+
+class GameRecord:
+    """
+    Base of the processed game records
+
+    A record holds the fields of one processed game dict in slots, in the
+    dict's key order. List fields are stored as tuples of interned strings
+    and mapping fields as tuples of pairs; ``data_source`` is implied by the
+    record type.
+    """
+
+    __slots__ = ()
+
+    DATA_SOURCE: ClassVar[str] = ""
+    # Fields holding lists of values, and dicts, in the JSON shape
+    LIST_FIELDS: ClassVar[Tuple[str, ...]] = ()
+    MAPPING_FIELDS: ClassVar[Tuple[str, ...]] = ()
+    # Set by ``record_type`` once the dataclass fields exist
+    KEYS: ClassVar[Tuple[str, ...]] = ()
+    _values: ClassVar[Callable[[Any], Tuple[Any, ...]]]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GameRecord":
+        """Build a record from a processed game dict."""
+        values = dict(zip(cls.KEYS, map(data.get, cls.KEYS)))
+        for name in cls.LIST_FIELDS:
+            values[name] = intern_names(values[name])
+        for name in cls.MAPPING_FIELDS:
+            mapping = values[name] or {}
+            values[name] = tuple(
+                (sys.intern(key), value) for key, value in mapping.items()
+            )
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The processed game dict, in the JSON output shape."""
+        data = dict(zip(self.KEYS, self._values(self)))
+        for name in self.LIST_FIELDS:
+            data[name] = list(data[name])
+        for name in self.MAPPING_FIELDS:
+            data[name] = dict(data[name])
+        data["data_source"] = self.DATA_SOURCE
+        return data
+
+    def to_json(self, indent: int = 2, level: int = 0) -> str:
+        """
+        The record's JSON text, as ``json.dump`` writes ``to_dict()``
+
+        Encodes the slots directly, without building the dict, and list
+        fields in one pass when they hold only strings.
+
+        Args:
+            indent: Spaces per nesting level
+            level: Nesting level of the record in the document
+        """
+        newline = "\n" + " " * (indent * (level + 1))
+        inner = "\n" + " " * (indent * (level + 2))
+        separator = "," + inner
+        parts = []
+        for key, value in zip(self.KEYS, self._values(self)):
+            if key in self.LIST_FIELDS:
+                if not value:
+                    text = "[]"
+                elif all(type(item) is str for item in value):
+                    text = f"[{inner}{separator.join(map(encode_basestring, value))}"
+                    text += f"{newline}]"
+                else:
+                    items = (encode_value(item, indent, inner) for item in value)
+                    text = f"[{inner}{separator.join(items)}{newline}]"
+            elif key in self.MAPPING_FIELDS:
+                items = (
+                    f"{encode_basestring(name)}: {encode_value(item, indent, inner)}"
+                    for name, item in value
+                )
+                text = f"{{{inner}{separator.join(items)}{newline}}}" if value else "{}"
+            else:
+                text = encode_value(value, indent, newline)
+            parts.append(f"{encode_basestring(key)}: {text}")
+        parts.append(f'"data_source": {encode_basestring(self.DATA_SOURCE)}')
+        closing = "\n" + " " * (indent * level)
+        return f"{{{newline}{f',{newline}'.join(parts)}{closing}}}"
+
+
+def record_type(cls: Type[GameRecord]) -> Type[GameRecord]:
+    """Record a slotted dataclass's field names and a getter for its values."""
+    cls.KEYS = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+    cls._values = attrgetter(*cls.KEYS)
+    return cls
+
+
+@record_type
+@dataclass(slots=True)
+class RAWGGame(GameRecord):
+    """One processed RAWG game"""
+
+    DATA_SOURCE: ClassVar[str] = "rawg"
+    LIST_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "genres",
+        "genre_ids",
+        "platforms",
+        "developers",
+        "publishers",
+        "tags",
+    )
+
+    rawg_id: int
+    name: Optional[str] = None
+    slug: Optional[str] = None
+    released: Optional[str] = None
+    rating: Optional[float] = None
+    rating_top: Optional[int] = None
+    ratings_count: Optional[int] = None
+    metacritic: Optional[int] = None
+    description_raw: Optional[str] = None
+    background_image: Optional[str] = None
+    website: Optional[str] = None
+    playtime: Optional[int] = None
+    achievements_count: Optional[int] = None
+    genres: Names = ()
+    genre_ids: Names = ()
+    platforms: Names = ()
+    developers: Names = ()
+    publishers: Names = ()
+    tags: Names = ()
+    creators_count: Optional[int] = None
+    additions_count: Optional[int] = None
+    game_series_count: Optional[int] = None
+    user_game: Any = None
+    updated: Optional[str] = None
+    fetched_at: Optional[str] = None
+
+
+@record_type
+@dataclass(slots=True)
+class IGDBGame(GameRecord):
+    """One processed IGDB game"""
+
+    DATA_SOURCE: ClassVar[str] = "igdb"
+    LIST_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "genres",
+        "platforms",
+        "themes",
+        "game_modes",
+        "franchises",
+        "keywords",
+        "player_perspectives",
+        "game_engines",
+        "similar_games",
+        "developers",
+        "publishers",
+        "collection",
+    )
+    MAPPING_FIELDS: ClassVar[Tuple[str, ...]] = ("age_ratings",)
+
+    igdb_id: int
+    name: Optional[str] = None
+    slug: Optional[str] = None
+    summary: Optional[str] = None
+    storyline: Optional[str] = None
+    url: Optional[str] = None
+    cover_url: Optional[str] = None
+    first_release_date: Optional[str] = None
+    rating: Optional[float] = None
+    rating_count: Optional[int] = None
+    total_rating: Optional[float] = None
+    total_rating_count: Optional[int] = None
+    updated_at: Optional[int] = None
+    genres: Names = ()
+    platforms: Names = ()
+    themes: Names = ()
+    game_modes: Names = ()
+    franchises: Names = ()
+    keywords: Names = ()
+    player_perspectives: Names = ()
+    game_engines: Names = ()
+    similar_games: Names = ()
+    developers: Names = ()
+    publishers: Names = ()
+    age_ratings: Tuple[Tuple[str, int], ...] = ()
+    collection: Names = ()
+    fetched_at: Optional[str] = None
+
+
+RECORD_TYPES: Dict[str, Type[GameRecord]] = {
+    record.DATA_SOURCE: record for record in (RAWGGame, IGDBGame)
+}
+
+
+def record_from_dict(data: Dict[str, Any]) -> GameRecord:
+    """
+    Build the record type matching a processed game's ``data_source``
+
+    Raises:
+        ValueError: If the data source is unknown
+    """
+    record = RECORD_TYPES.get(data.get("data_source", ""))
+    if record is None:
+        raise ValueError(f"Unknown data source: {data.get('data_source')}")
+    return record.from_dict(data)
+
+
+def to_json_value(value: Any) -> Any:
+    """``default`` hook for ``json.dump``: records as dicts, the rest as text."""
+    if isinstance(value, GameRecord):
+        return value.to_dict()
+    return str(value)
+
+
+def write_json_array(
+    records: Sequence[GameRecord], stream: IO[str], indent: int = 2
+) -> None:
+    """Write records as ``json.dump(records, stream, indent=indent)`` would."""
+    newline = "\n" + " " * indent
+    stream.write("[")
+    for position, record in enumerate(records):
+        stream.write("," if position else "")
+        stream.write(newline)
+        stream.write(record.to_json(indent, 1))
+    stream.write("\n]" if records else "]")
@@ -1,12 +1,30 @@
 """CSV  and game data utilities"""
 
-import json
+import gc
+import gzip
+import os
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from loguru import logger
 
+from . import codec
+from .metrics import get_metrics
+
+COMPRESSION_EXTENSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+SOURCES = ("rawg", "igdb")
+
+
+def output_source(output_path: Path) -> str:
+    """Source an output file belongs to, from its name, for stage metrics."""
+    source = Path(output_path).name.split("_", 1)[0]
+    return source if source in SOURCES else "other"
+
 
 class JsonUtils:
     """Handles JSON file operations"""
@@ -15,17 +33,28 @@ class JsonUtils:
 
     @staticmethod
     def generate_timestamped_filename(
-        prefix: str, custom_name: Optional[str] = None
+        prefix: str, custom_name: Optional[str] = None, extension: str = ".json"
     ) -> str:
         """Generate a timestamped filename"""
         if custom_name:
             return custom_name
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        return f"{prefix}_{timestamp}.json"
+        return f"{prefix}_{timestamp}{extension}"
+
+    @staticmethod
+    def output_extension(output_format: str, compression: str = "none") -> str:
+        """Get the file extension for an output format and compression"""
+        if output_format == "json":
+            return ".json"
+        if output_format != "ndjson":
+            raise ValueError(f"Unknown output format: {output_format}")
+        if compression not in COMPRESSION_EXTENSIONS:
+            raise ValueError(f"Unknown output compression: {compression}")
+        return f".jsonl{COMPRESSION_EXTENSIONS[compression]}"
 
     @staticmethod
     def save_to_json(
-        data: List[Dict[str, Any]],
+        data: Sequence[Any],
         output_path: Path,
         encoding: str = DEFAULT_ENCODING,
         indent: int = 2,
@@ -33,8 +62,12 @@ class JsonUtils:
         """
         Save list of dictionaries to a JSON file.
 
+        Encoded by the pipeline's JSON codec, so game records are written
+        without building their dicts and the layout matches ``json.dump``
+        in compatibility mode.
+
         Args:
-            data: List of dictionaries to save
+            data: List of dictionaries or game records to save
             output_path: Path to the output JSON file
             encoding: File encoding
             indent: JSON indentation level
@@ -47,11 +80,11 @@ class JsonUtils:
             logger.warning("No data to save")
             raise ValueError("No data to save")
 
+        source = output_source(output_path)
         try:
-            with open(output_path, "w", encoding=encoding) as jsonfile:
-                json.dump(
-                    data, jsonfile, indent=indent, ensure_ascii=False, default=str
-                )
+            with get_metrics().time_stage("write", source, len(data)):
+                with open(output_path, "w", encoding=encoding) as jsonfile:
+                    codec.get_codec().dump_document(data, jsonfile, indent)
 
             logger.info(f"Saved {len(data)} records to {output_path}")
         except IOError as e:
@@ -61,10 +94,271 @@ class JsonUtils:
             logger.error(f"Unexpected error while saving to JSON: {e}")
             raise
 
+    @staticmethod
+    def load_records(
+        input_path: Path, encoding: str = DEFAULT_ENCODING
+    ) -> List[Dict[str, Any]]:
+        """
+        Load a pipeline output file in any supported format
+
+        Args:
+            input_path: JSON array, or JSON Lines optionally gzip/zstd compressed
+            encoding: File encoding
+
+        Returns:
+            List of records
+
+        Raises:
+            ValueError: If the file is zstd compressed and zstandard is missing
+            IOError: If file cannot be read
+        """
+        input_path = Path(input_path)
+        if input_path.suffix == ".json":
+            with open(input_path, encoding=encoding) as jsonfile:
+                return codec.loads(jsonfile.read())
+
+        if input_path.suffix == ".gz":
+            stream: IO[str] = gzip.open(input_path, "rt", encoding=encoding)
+        elif input_path.suffix == ".zst":
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ValueError(
+                    "Reading zstd files requires the 'zstandard' package "
+                    "(install the 'zstd' extra)"
+                ) from e
+            stream = zstandard.open(input_path, "rt", encoding=encoding)
+        else:
+            stream = open(input_path, encoding=encoding)
+        with stream:
+            return [codec.loads(line) for line in stream if line.strip()]
+
+
+class JsonLinesWriter:
+    """
+    Streams records to a JSON Lines file as they arrive
+
+    Records are written compactly, one per line, to ``<output>.part`` and the
+    file is atomically renamed into place when the writer is closed cleanly.
+    Used as a context manager, an exception discards the partial file.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        compression: str = "none",
+        encoding: str = JsonUtils.DEFAULT_ENCODING,
+    ) -> None:
+        """
+        Open the temporary output stream
+
+        Args:
+            output_path: Final path of the JSON Lines file
+            compression: One of none, gzip or zstd
+            encoding: File encoding
+
+        Raises:
+            ValueError: If the compression is unknown or unavailable
+        """
+        if compression not in COMPRESSION_EXTENSIONS:
+            raise ValueError(f"Unknown output compression: {compression}")
+
+        self.output_path = Path(output_path)
+        self.tmp_path = self.output_path.with_name(f"{self.output_path.name}.part")
+        self.count = 0
+        self.seconds = 0.0
+        self._stream = self._open(self.tmp_path, compression, encoding)
+
+    @staticmethod
+    def _open(path: Path, compression: str, encoding: str) -> IO[str]:
+        if compression == "gzip":
+            return gzip.open(path, "wt", encoding=encoding)
+        if compression == "zstd":
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ValueError(
+                    "zstd compression requires the 'zstandard' package "
+                    "(install the 'zstd' extra)"
+                ) from e
+            return zstandard.open(path, "wt", encoding=encoding)
+        return open(path, "w", encoding=encoding)
+
+    def __enter__(self) -> "JsonLinesWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Append one record."""
+        started = time.perf_counter()
+        self._stream.write(codec.dumps_line(record))
+        self._stream.write("\n")
+        self.seconds += time.perf_counter() - started
+        self.count += 1
+
+    def write_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append several records."""
+        for record in records:
+            self.write(record)
+
+    def close(self) -> None:
+        """Finish the stream and move it to its final path."""
+        started = time.perf_counter()
+        self._stream.close()
+        os.replace(self.tmp_path, self.output_path)
+        get_metrics().record_stage(
+            "write",
+            output_source(self.output_path),
+            self.count,
+            self.seconds + time.perf_counter() - started,
+        )
+        logger.info(f"Saved {self.count} records to {self.output_path}")
+
+    def abort(self) -> None:
+        """Discard the partial output."""
+        self._stream.close()
+        self.tmp_path.unlink(missing_ok=True)
+        logger.warning(f"Discarded partial output {self.tmp_path}")
+
+
+@dataclass
+class ProcessedBatch:
+    """Games processed from one batch, and those that were invalid"""
+
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    # (game ID, error message) per game that could not be processed
+    failures: List[Tuple[Any, str]] = field(default_factory=list)
+
+    def extend(self, other: "ProcessedBatch") -> None:
+        """Append another batch's records and failures."""
+        self.records.extend(other.records)
+        self.failures.extend(other.failures)
+
+
+_batch_handler: Optional[type] = None
+_batch_games: Sequence[Dict[str, Any]] = ()
+_batch_fetched_at = ""
+
+
+def _init_batch_worker(
+    handler: type, games: Sequence[Dict[str, Any]], fetched_at: str
+) -> None:
+    """Give a worker process the batch once, instead of pickling every chunk."""
+    global _batch_handler, _batch_games, _batch_fetched_at
+    _batch_handler, _batch_games, _batch_fetched_at = handler, games, fetched_at
+
+
+def _process_batch_range(start: int, end: int) -> ProcessedBatch:
+    """Process games ``start`` to ``end`` of the worker's batch."""
+    assert _batch_handler is not None
+    return _batch_handler.process_chunk(_batch_games[start:end], _batch_fetched_at)
+
 
-class RAWGDataHandler:
+class GameDataHandler(ABC):
+    """
+    Batch processing shared by the per-source handlers
+
+    Handlers are used through their class methods; a subclass must implement
+    ``process_game_data``.
+    """
+
+    # Label of the source in stage metrics
+    SOURCE = ""
+    # Smaller batches are processed inline, as starting worker processes and
+    # sending records back would cost more than the processing itself
+    PARALLEL_MIN_BATCH = 2000
+
+    @classmethod
+    @abstractmethod
+    def process_game_data(
+        cls, game: Dict[str, Any], fetched_at: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Process one game (implemented per source)."""
+
+    @classmethod
+    def process_chunk(
+        cls, games: Sequence[Dict[str, Any]], fetched_at: str
+    ) -> ProcessedBatch:
+        """
+        Process games in this process, collecting the invalid ones
+
+        The cyclic garbage collector is paused meanwhile: records hold no
+        reference cycles, yet each collection would re-scan all records built
+        so far.
+        """
+        batch = ProcessedBatch()
+        process = cls.process_game_data
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for game in games:
+                try:
+                    batch.records.append(process(game, fetched_at))
+                except Exception as e:
+                    game_id = game.get("id", "unknown") if game else "unknown"
+                    batch.failures.append((game_id, str(e)))
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return batch
+
+    @classmethod
+    def process_batch(
+        cls, games: Sequence[Dict[str, Any]], workers: int = 1
+    ) -> ProcessedBatch:
+        """
+        Process a page or response list of games
+
+        Every record of the batch gets the same ``fetched_at``. Batches of at
+        least ``PARALLEL_MIN_BATCH`` games are split into contiguous ranges
+        across ``workers`` processes; records keep the input order either way.
+
+        Args:
+            games: Raw games from the API
+            workers: Processes for large batches (1 for inline, 0 for one per CPU)
+
+        Returns:
+            Processed records, and the ID and error of each invalid game
+
+        Raises:
+            TypeError: If the handler does not implement ``process_game_data``
+        """
+        if cls.__abstractmethods__:
+            # Fail here rather than once per game inside the worker processes
+            raise TypeError(f"{cls.__name__} does not implement process_game_data")
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        workers = workers or os.cpu_count() or 1
+        with get_metrics().time_stage("process", cls.SOURCE, len(games)):
+            if workers <= 1 or len(games) < cls.PARALLEL_MIN_BATCH:
+                return cls.process_chunk(games, fetched_at)
+
+            size = -(-len(games) // workers)
+            starts = list(range(0, len(games), size))
+            batch = ProcessedBatch()
+            with ProcessPoolExecutor(
+                max_workers=len(starts),
+                initializer=_init_batch_worker,
+                initargs=(cls, games, fetched_at),
+            ) as executor:
+                for chunk in executor.map(
+                    _process_batch_range,
+                    starts,
+                    [min(start + size, len(games)) for start in starts],
+                ):
+                    batch.extend(chunk)
+            return batch
+
+
+class RAWGDataHandler(GameDataHandler):
     """Processes RAWG game data"""
 
+    SOURCE = "rawg"
+
     @staticmethod
     def extract_list_field_names(items: Optional[List[Dict[str, Any]]]) -> List[str]:
         """Extract names from a list of objects"""
@@ -100,12 +394,15 @@ class RAWGDataHandler:
         }
 
     @classmethod
-    def process_game_data(cls, game: Dict[str, Any]) -> Dict[str, Any]:
+    def process_game_data(
+        cls, game: Dict[str, Any], fetched_at: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Process and structure game data
 
         Args:
             game: Game data from API
+            fetched_at: Fetch time to record (defaults to now)
 
         Returns:
             Processed game data dictionary
@@ -116,57 +413,90 @@ class RAWGDataHandler:
         if not game or not game.get("id"):
             raise ValueError("Invalid game data: missing required fields")
 
+        get = game.get
         genre_info = cls.extract_genre_info(game)
+        names = cls.extract_list_field_names
 
-        processed: Dict[str, Any] = {
-            "rawg_id": game.get("id"),
-            "name": game.get("name"),
-            "slug": game.get("slug"),
-            "released": game.get("released"),
-            "rating": game.get("rating"),
-            "rating_top": game.get("rating_top"),
-            "ratings_count": game.get("ratings_count"),
-            "metacritic": game.get("metacritic"),
-            "description_raw": game.get("description_raw"),
-            "background_image": game.get("background_image"),
-            "website": game.get("website"),
-            "playtime": game.get("playtime"),
-            "achievements_count": game.get("achievements_count"),
+        return {
+            "rawg_id": get("id"),
+            "name": get("name"),
+            "slug": get("slug"),
+            "released": get("released"),
+            "rating": get("rating"),
+            "rating_top": get("rating_top"),
+            "ratings_count": get("ratings_count"),
+            "metacritic": get("metacritic"),
+            "description_raw": get("description_raw"),
+            "background_image": get("background_image"),
+            "website": get("website"),
+            "playtime": get("playtime"),
+            "achievements_count": get("achievements_count"),
+            # List-based fields
+            "genres": genre_info["names"],
+            "genre_ids": genre_info["ids"],
+            "platforms": cls.extract_platform_names(game),
+            "developers": names(get("developers")),
+            "publishers": names(get("publishers")),
+            "tags": names(get("tags")),
+            # Additional counts
+            "creators_count": get("creators_count"),
+            "additions_count": get("additions_count"),
+            "game_series_count": get("game_series_count"),
+            "user_game": get("user_game"),
+            "updated": get("updated"),
+            # Metadata
+            "fetched_at": fetched_at or datetime.now(timezone.utc).isoformat(),
+            "data_source": "rawg",
         }
 
-        # Extract list-based fields
-        processed.update(
-            {
-                "genres": genre_info["names"],
-                "genre_ids": genre_info["ids"],
-                "platforms": cls.extract_platform_names(game),
-                "developers": cls.extract_list_field_names(game.get("developers")),
-                "publishers": cls.extract_list_field_names(game.get("publishers")),
-                "tags": cls.extract_list_field_names(game.get("tags")),
-            }
-        )
-
-        # Add additional counts
-        processed.update(
-            {
-                "creators_count": game.get("creators_count"),
-                "additions_count": game.get("additions_count"),
-                "game_series_count": game.get("game_series_count"),
-                "user_game": game.get("user_game"),
-                "updated": game.get("updated"),
-            }
-        )
-
-        # Add metadata
-        processed["fetched_at"] = datetime.now(timezone.utc).isoformat()
-        processed["data_source"] = "rawg"
-
-        return processed
 
-
-class IGDBDataHandler:
+class IGDBDataHandler(GameDataHandler):
     """Processes IGDB game data"""
 
+    SOURCE = "igdb"
+
+    # Every raw field ``process_game_data`` reads; the IGDB "recommendation"
+    # field profile requests exactly these, so update both together
+    CONSUMED_FIELDS = (
+        "name",
+        "slug",
+        "summary",
+        "storyline",
+        "url",
+        "cover.image_id",
+        "first_release_date",
+        "rating",
+        "rating_count",
+        "total_rating",
+        "total_rating_count",
+        "updated_at",
+        "genres.name",
+        "platforms.name",
+        "themes.name",
+        "game_modes.name",
+        "franchises.name",
+        "keywords.name",
+        "player_perspectives.name",
+        "game_engines.name",
+        "similar_games.name",
+        "involved_companies.company.name",
+        "involved_companies.developer",
+        "involved_companies.publisher",
+        "age_ratings.rating",
+        "age_ratings.category",
+        "collection.name",
+    )
+
+    AGE_RATING_CATEGORIES = {
+        1: "ESRB",
+        2: "PEGI",
+        3: "CERO",
+        4: "USK",
+        5: "OFLC",
+    }
+
+    COVER_URL = "https://images.igdb.com/igdb/image/upload/t_cover_big/{}.jpg"
+
     @staticmethod
     def extract_names_from_list(items: Optional[List[Dict[str, Any]]]) -> List[str]:
         """Extract names from a list of objects"""
@@ -200,8 +530,10 @@ class IGDBDataHandler:
         except (ValueError, OSError):
             return None
 
-    @staticmethod
-    def extract_age_ratings(ratings: Optional[List[Dict[str, Any]]]) -> Dict[str, int]:
+    @classmethod
+    def extract_age_ratings(
+        cls, ratings: Optional[List[Dict[str, Any]]]
+    ) -> Dict[str, int]:
         """Extract and organize age ratings"""
         if not ratings:
             return {}
@@ -212,13 +544,9 @@ class IGDBDataHandler:
             rating_value = rating.get("rating")
 
             if isinstance(category, int):
-                category_name = {
-                    1: "ESRB",
-                    2: "PEGI",
-                    3: "CERO",
-                    4: "USK",
-                    5: "OFLC",
-                }.get(category, f"category_{category}")
+                category_name = cls.AGE_RATING_CATEGORIES.get(
+                    category, f"category_{category}"
+                )
 
                 if category_name and rating_value is not None:
                     organized_ratings[category_name] = rating_value
@@ -226,12 +554,15 @@ class IGDBDataHandler:
         return organized_ratings
 
     @classmethod
-    def process_game_data(cls, game: Dict[str, Any]) -> Dict[str, Any]:
+    def process_game_data(
+        cls, game: Dict[str, Any], fetched_at: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Process and clean IGDB game data
 
         Args:
             game: Raw game data from IGDB API
+            fetched_at: Fetch time to record (defaults to now)
 
         Returns:
             Processed game data dictionary
@@ -242,67 +573,48 @@ class IGDBDataHandler:
         if not game or not game.get("id"):
             raise ValueError("Invalid game data: missing required fields")
 
-        cover_url = None
-        cover = game.get("cover")
-        if cover and cover.get("image_id"):
-            image_id = cover.get("image_id")
-            cover_url = (
-                f"https://images.igdb.com/igdb/image/upload/t_cover_big/{image_id}.jpg"
-            )
-
-        # Extract basic fields
-        processed: Dict[str, Any] = {
-            "igdb_id": game.get("id"),
-            "name": game.get("name"),
-            "slug": game.get("slug"),
-            "summary": game.get("summary"),
-            "storyline": game.get("storyline"),
-            "url": game.get("url"),
-            "cover_url": cover_url,
-            "first_release_date": cls.format_release_date(
-                game.get("first_release_date")
+        get = game.get
+        names = cls.extract_names_from_list
+        cover = get("cover")
+        image_id = cover.get("image_id") if cover else None
+        companies = get("involved_companies", [])
+        collection = get("collection")
+
+        return {
+            "igdb_id": get("id"),
+            "name": get("name"),
+            "slug": get("slug"),
+            "summary": get("summary"),
+            "storyline": get("storyline"),
+            "url": get("url"),
+            "cover_url": cls.COVER_URL.format(image_id) if image_id else None,
+            "first_release_date": cls.format_release_date(get("first_release_date")),
+            "rating": get("rating"),
+            "rating_count": get("rating_count"),
+            "total_rating": get("total_rating"),
+            "total_rating_count": get("total_rating_count"),
+            "updated_at": get("updated_at"),
+            # List-based fields
+            "genres": names(get("genres")),
+            "platforms": names(get("platforms")),
+            "themes": names(get("themes")),
+            "game_modes": names(get("game_modes")),
+            "franchises": names(get("franchises")),
+            "keywords": names(get("keywords")),
+            "player_perspectives": names(get("player_perspectives")),
+            "game_engines": names(get("game_engines")),
+            "similar_games": names(get("similar_games")),
+            # Companies
+            "developers": cls.extract_companies_by_role(companies, "developer"),
+            "publishers": cls.extract_companies_by_role(companies, "publisher"),
+            "age_ratings": cls.extract_age_ratings(get("age_ratings")),
+            # Collection info
+            "collection": (
+                [collection.get("name")]
+                if collection and collection.get("name")
+                else []
             ),
-            "rating": game.get("rating"),
-            "rating_count": game.get("rating_count"),
-            "total_rating": game.get("total_rating"),
-            "total_rating_count": game.get("total_rating_count"),
+            # Metadata
+            "fetched_at": fetched_at or datetime.now(timezone.utc).isoformat(),
+            "data_source": "igdb",
         }
-
-        # Extract list-based fields
-        processed.update(
-            {
-                "genres": cls.extract_names_from_list(game.get("genres")),
-                "platforms": cls.extract_names_from_list(game.get("platforms")),
-                "themes": cls.extract_names_from_list(game.get("themes")),
-                "game_modes": cls.extract_names_from_list(game.get("game_modes")),
-                "franchises": cls.extract_names_from_list(game.get("franchises")),
-                "keywords": cls.extract_names_from_list(game.get("keywords")),
-                "player_perspectives": cls.extract_names_from_list(
-                    game.get("player_perspectives")
-                ),
-                "game_engines": cls.extract_names_from_list(game.get("game_engines")),
-                "similar_games": cls.extract_names_from_list(game.get("similar_games")),
-            }
-        )
-
-        # Extract companies
-        companies = game.get("involved_companies", [])
-        processed.update(
-            {
-                "developers": cls.extract_companies_by_role(companies, "developer"),
-                "publishers": cls.extract_companies_by_role(companies, "publisher"),
-            }
-        )
-
-        processed["age_ratings"] = cls.extract_age_ratings(game.get("age_ratings"))
-
-        # Add collection info
-        collection = game.get("collection")
-        processed["collection"] = (
-            [collection.get("name")] if collection and collection.get("name") else []
-        )
-        # Add metadata
-        processed["fetched_at"] = datetime.now(timezone.utc).isoformat()
-        processed["data_source"] = "igdb"
-
-        return processed
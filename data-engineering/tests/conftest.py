@@ -0,0 +1,37 @@
+import pytest
+
+from benchmarks.mock_server import MockServer, MockSettings
+from src.sho_da_igram.utils.config import Config
+
+MOCK_GAMES = 1200
+
+
+@pytest.fixture(scope="session")
+def mock_api():
+    """Local stand-in for the RAWG and IGDB APIs, shared by the session."""
+    with MockServer(MockSettings(games=MOCK_GAMES, latency=0, jitter=0)) as server:
+        yield server
+
+
+@pytest.fixture
+def config(mock_api, tmp_path):
+    """Config pointing both fetchers at the mock API, writing under tmp_path."""
+    mock_api.configure(MockSettings(games=MOCK_GAMES, latency=0, jitter=0))
+    return Config(
+        rawg_api_key="test-key",
+        rawg_rate_limit=0,
+        rawg_base_url=mock_api.rawg_base_url,
+        igdb_client_id="test-client",
+        igdb_access_token="test-token",
+        igdb_rate_limit=0,
+        igdb_base_url=mock_api.igdb_base_url,
+        data_dir=str(tmp_path / "data"),
+        cache_enabled=False,
+        cache_path=str(tmp_path / "responses.sqlite3"),
+        retry_max_attempts=1,
+        retry_base_delay=0.01,
+        # Breakers are shared by the process; keep injected failures from
+        # opening them for later tests
+        circuit_failure_threshold=10_000,
+        log_to_file=False,
+    )
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from src.sho_da_igram.api.cache import ResponseCache
+from src.sho_da_igram.api.igdb_client import AsyncIGDBClient, IGDBClient
+from src.sho_da_igram.api.rawg_client import AsyncRAWGClient, RAWGClient
+from src.sho_da_igram.data.fetcher import IGDBDataFetcher, RAWGDataFetcher
+from tests.test_fetcher import igdb_ids, rawg_ids
+
+
+def rawg_clients(config, cache=None):
+    options = {
+        "api_key": config.rawg_api_key,
+        "rate_limit": 0,
+        "cache": cache,
+        "base_url": config.rawg_base_url,
+    }
+    return RAWGClient(**options), AsyncRAWGClient(**options)
+
+
+def igdb_clients(config):
+    options = {
+        "client_id": config.igdb_client_id,
+        "access_token": config.igdb_access_token,
+        "rate_limit": 0,
+        "base_url": config.igdb_base_url,
+    }
+    return IGDBClient(**options), AsyncIGDBClient(**options)
+
+
+def test_async_rawg_client_matches_sync(config):
+    client, async_client = rawg_clients(config)
+
+    async def fetch():
+        async with async_client:
+            return (
+                await async_client.get_games_page(page=2, page_size=40),
+                await async_client.get_game_details(5),
+            )
+
+    page, details = asyncio.run(fetch())
+    assert page == client.get_games_page(page=2, page_size=40)
+    assert [game["id"] for game in page["results"]] == list(range(41, 81))
+    assert details == client.get_game_details(5)
+    client.close()
+
+
+def test_async_rawg_client_serves_details_from_the_cache(config, mock_api, tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+    client, async_client = rawg_clients(config, cache)
+
+    async def fetch():
+        async with async_client:
+            first = await async_client.get_game_details(7)
+            cached = await async_client.get_game_details(7)
+            refreshed = await async_client.get_game_details(7, refresh=True)
+            return first, cached, refreshed
+
+    first, cached, refreshed = asyncio.run(fetch())
+    assert first == cached == refreshed
+    assert mock_api.stats.endpoints["rawg games/{id}"] == 2
+    # The sync client shares the cache entry
+    assert client.get_game_details(7) == first
+    assert mock_api.stats.endpoints["rawg games/{id}"] == 2
+    client.close()
+    cache.close()
+
+
+def test_async_igdb_client_matches_sync(config, mock_api):
+    client, async_client = igdb_clients(config)
+
+    async def fetch():
+        async with async_client:
+            top = await async_client.get_top_games(limit=50, min_rating=0)
+            lookup = await async_client.get_games_by_ids([3, 1, 3, 5000])
+            singles = await asyncio.gather(
+                *(async_client.get_game_by_id(game_id) for game_id in (4, 2, 5000))
+            )
+            return top, lookup, singles
+
+    top, lookup, singles = asyncio.run(fetch())
+    assert top == client.get_top_games(limit=50, min_rating=0)
+    assert [game["id"] for game in top] == list(range(1, 51))
+    assert sorted(lookup.found) == [1, 3]
+    assert lookup.missing == [5000]
+    assert [game and game["id"] for game in singles] == [4, 2, None]
+    # Concurrent single lookups share one /multiquery request
+    assert mock_api.stats.endpoints["igdb multiquery"] == 1
+    client.close()
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson"])
+def test_async_rawg_run_matches_sync(config, output_format):
+    config.output_format = output_format
+    fetcher = RAWGDataFetcher(config)
+    expected = fetcher.fetch_games_to_json(100, f"sync.{output_format}")
+
+    config.async_mode = True
+    output = fetcher.fetch_games_to_json(100, f"async.{output_format}")
+    fetcher.close()
+    assert rawg_ids(output) == rawg_ids(expected) == list(range(1, 101))
+    assert fetcher.report.duplicates == 0
+
+
+def test_async_rawg_run_stops_at_the_end_of_the_list(config):
+    config.async_mode = True
+    fetcher = RAWGDataFetcher(config)
+    output = fetcher.fetch_games_to_json(5000, "all.json")
+    fetcher.close()
+    assert rawg_ids(output) == list(range(1, 1201))
+
+
+def test_async_igdb_run_matches_sync(config):
+    config.igdb_multiquery_size = 2
+    fetcher = IGDBDataFetcher(config)
+    expected = fetcher.fetch_games_to_json(limit=1100, output_filename="sync.json")
+
+    config.async_mode = True
+    output = fetcher.fetch_games_to_json(limit=1100, output_filename="async.json")
+    fetcher.close()
+    assert igdb_ids(output) == igdb_ids(expected) == list(range(1, 1101))
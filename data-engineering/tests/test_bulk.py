@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from src.sho_da_igram.api.bulk import BulkLookupResult, chunked, dedupe_ids
+from src.sho_da_igram.data.fetcher import IGDBDataFetcher, RAWGDataFetcher
+from src.sho_da_igram.utils.utils import JsonUtils
+
+
+def test_dedupe_ids_keeps_first_seen_order():
+    assert dedupe_ids([3, "1", 3, 2, 1]) == [3, 1, 2]
+
+
+def test_chunked():
+    assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    assert chunked([], 2) == []
+
+
+def test_lookup_result_sorts_ids():
+    result = BulkLookupResult()
+    result.record_chunk([1, 2, 3], [{"id": 1}, {"id": "3"}])
+    result.record_failure([4, 5], "HTTP 503")
+    assert sorted(result.found) == [1, 3]
+    assert result.missing == [2]
+    assert result.failed == {4: "HTTP 503", 5: "HTTP 503"}
+    assert result.summary() == "2 found, 1 missing, 2 failed"
+
+
+@pytest.mark.parametrize("async_mode", [False, True])
+def test_igdb_lookup_packs_chunks_of_500_into_one_multiquery(
+    config, mock_api, async_mode
+):
+    config.async_mode = async_mode
+    fetcher = IGDBDataFetcher(config)
+    ids = list(range(1, 1101)) + [1, 2, 5000, 5001]
+    result = fetcher.fetch_games_by_ids(ids)
+    fetcher.close()
+
+    assert sorted(result.found) == list(range(1, 1101))
+    assert result.found[7]["igdb_id"] == 7
+    assert result.missing == [5000, 5001]
+    assert not result.failed
+    assert mock_api.stats.endpoints == {"igdb multiquery": 1}
+
+
+@pytest.mark.parametrize("async_mode", [False, True])
+def test_rawg_lookup_reports_unknown_ids_as_missing(config, async_mode):
+    config.async_mode = async_mode
+    fetcher = RAWGDataFetcher(config)
+    result = fetcher.fetch_games_by_ids([3, 1, 3, 99_999])
+    fetcher.close()
+
+    assert sorted(result.found) == [1, 3]
+    assert result.found[3]["rawg_id"] == 3
+    assert result.missing == [99_999]
+    assert not fetcher.report.failures
+
+
+def test_detailed_output_keeps_requested_order_and_lists_misses(config):
+    fetcher = IGDBDataFetcher(config)
+    output = fetcher.fetch_detailed_games_to_json(
+        [30, 10, 99_999, 20], output_filename="detailed.json"
+    )
+    fetcher.close()
+
+    assert [game["igdb_id"] for game in JsonUtils.load_records(output)] == [
+        30,
+        10,
+        20,
+    ]
+    misses = json.loads(output.with_name("detailed_missing.json").read_text())
+    assert misses == [{"id": 99_999, "reason": "not_found"}]
@@ -0,0 +1,137 @@
+import time
+
+import pytest
+
+from src.sho_da_igram.api import cache as cache_module
+from src.sho_da_igram.api.cache import ResponseCache, make_cache_key
+from src.sho_da_igram.api.igdb_client import IGDBClient
+from src.sho_da_igram.api.rawg_client import RAWGClient
+
+
+class Clock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite3", ttl=60, max_bytes=30)
+    yield cache
+    cache.close()
+
+
+def test_cache_key_leaves_out_the_api_key():
+    url = "https://api.rawg.io/api/games/1"
+    key = make_cache_key("GET", url, {"key": "secret", "page": 2})
+    assert key == make_cache_key("get", url, {"page": "2", "key": "other"})
+    assert key != make_cache_key("GET", url, {"page": 3})
+    assert key != make_cache_key("GET", url)
+
+
+def test_cache_key_normalizes_query_whitespace():
+    url = "https://api.igdb.com/v4/games"
+    key = make_cache_key("POST", url, body="fields name;\n    limit 10;")
+    assert key == make_cache_key("POST", url, body="  fields name; limit 10;  ")
+    assert key != make_cache_key("POST", url, body="fields name; limit 11;")
+
+
+def test_entries_expire_after_the_ttl(cache, clock):
+    cache.set("a", b"body")
+    clock.now += 60
+    assert cache.get("a") == b"body"
+    clock.now += 1
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Storing again makes the entry fresh
+    cache.set("a", b"new body")
+    assert cache.get("a") == b"new body"
+
+
+def test_eviction_drops_the_least_recently_used(cache, clock):
+    for key in ("a", "b", "c"):
+        cache.set(key, key.encode() * 10)
+        clock.now += 1
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == b"a" * 10
+    clock.now += 1
+
+    cache.set("d", b"d" * 10)
+    assert cache.get("b") is None
+    assert [cache.get(key) is not None for key in ("a", "c", "d")] == [True] * 3
+    assert cache._size == 30
+
+
+def test_replacing_an_entry_keeps_the_size_right(tmp_path, cache):
+    cache.set("a", b"x" * 20)
+    cache.set("a", b"x" * 5)
+    cache.set("b", b"y" * 20)
+    assert cache.get("a") == b"x" * 5
+    cache.close()
+
+    reopened = ResponseCache(tmp_path / "responses.sqlite3", max_bytes=30)
+    assert reopened._size == 25
+    reopened.close()
+
+
+def test_bypass_skips_lookups_but_stores_responses(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    bypassed = ResponseCache(path, bypass=True)
+    bypassed.set("a", b"fresh")
+    assert bypassed.get("a") is None
+    assert (bypassed.hits, bypassed.misses) == (0, 1)
+    bypassed.close()
+
+    cache = ResponseCache(path)
+    assert cache.get("a") == b"fresh"
+    cache.clear()
+    assert cache.get("a") is None
+    cache.close()
+
+
+def test_rawg_refresh_skips_the_cached_details(config, mock_api, cache):
+    cache.max_bytes = 1 << 20
+    client = RAWGClient(rate_limit=0, cache=cache, base_url=config.rawg_base_url)
+    first = client.get_game_details(3)
+    assert client.get_game_details(3) == first
+    assert mock_api.stats.endpoints["rawg games/{id}"] == 1
+    assert client.get_game_details(3, refresh=True) == first
+    assert mock_api.stats.endpoints["rawg games/{id}"] == 2
+    # Pages are never cached
+    client.get_games_page(page=1)
+    client.get_games_page(page=1)
+    assert mock_api.stats.endpoints["rawg games"] == 2
+    client.close()
+
+
+def test_igdb_refresh_skips_the_cached_query(config, mock_api, cache):
+    cache.max_bytes = 1 << 20
+    client = IGDBClient(
+        client_id=config.igdb_client_id,
+        access_token=config.igdb_access_token,
+        rate_limit=0,
+        cache=cache,
+        base_url=config.igdb_base_url,
+    )
+    first = client.get_top_games(limit=20, min_rating=0)
+    assert client.get_top_games(limit=20, min_rating=0) == first
+    assert mock_api.stats.endpoints["igdb games"] == 1
+    assert client.payload.cached == 1
+
+    assert client.get_top_games(limit=20, min_rating=0, refresh=True) == first
+    assert client.multiquery([("games", "fields name; limit 5;")] * 2, refresh=True)
+    assert client.multiquery([("games", "fields name; limit 5;")] * 2)
+    assert mock_api.stats.endpoints["igdb games"] == 2
+    assert mock_api.stats.endpoints["igdb multiquery"] == 1
+    assert client.payload.cached == 2
+    client.close()
@@ -0,0 +1,63 @@
+from src.sho_da_igram.api.retry import describe_error
+from src.sho_da_igram.data.checkpoint import FetchCheckpoint
+from src.sho_da_igram.data.report import FetchReport
+
+
+def games(*ids):
+    return [{"rawg_id": game_id, "name": f"Game {game_id}"} for game_id in ids]
+
+
+def test_load_without_checkpoint(tmp_path):
+    assert FetchCheckpoint(tmp_path, "rawg").load() is None
+
+
+def test_save_and_load(tmp_path):
+    checkpoint = FetchCheckpoint(tmp_path, "rawg")
+    checkpoint.start(100, "rawg_games.json")
+    report = FetchReport("rawg", duplicates=2)
+    checkpoint.save(2, games(1, 2), report)
+    report.record_failure("page", 2, ValueError("bad page"))
+    checkpoint.save(4, games(3), report, skipped=5)
+
+    state = FetchCheckpoint(tmp_path, "rawg").load()
+    assert state.cursor == 4
+    assert state.limit == 100
+    assert state.output_filename == "rawg_games.json"
+    assert state.started_at > 0
+    assert state.skipped == 5
+    assert state.duplicates == 2
+    assert state.games == games(1, 2, 3)
+    assert [failure.cursor for failure in state.failures] == [2]
+    assert state.failures[0].error == describe_error(ValueError("bad page"))
+
+
+def test_load_drops_records_written_after_the_last_state(tmp_path):
+    checkpoint = FetchCheckpoint(tmp_path, "rawg")
+    checkpoint.start(100, "out.json")
+    checkpoint.save(2, games(1, 2), FetchReport("rawg"))
+    committed = checkpoint.records_path.stat().st_size
+    # A crash after appending records but before writing the state
+    with open(checkpoint.records_path, "a", encoding="utf-8") as records_file:
+        records_file.write('{"rawg_id": 3}\n{"rawg_id": 4, "na')
+
+    resumed = FetchCheckpoint(tmp_path, "rawg")
+    state = resumed.load()
+    assert state.games == games(1, 2)
+    assert checkpoint.records_path.stat().st_size == committed
+
+    # Saving again continues the count from the committed records
+    resumed.save(3, games(5), FetchReport("rawg"))
+    assert FetchCheckpoint(tmp_path, "rawg").load().games == games(1, 2, 5)
+
+
+def test_start_and_clear_discard_the_previous_run(tmp_path):
+    checkpoint = FetchCheckpoint(tmp_path, "igdb")
+    checkpoint.start(10, "a.json")
+    checkpoint.save(500, games(1), FetchReport("igdb"))
+    checkpoint.start(10, "b.json")
+    assert checkpoint.load() is None
+
+    checkpoint.save(500, games(2), FetchReport("igdb"))
+    checkpoint.clear()
+    assert not checkpoint.state_path.exists()
+    assert not checkpoint.records_path.exists()
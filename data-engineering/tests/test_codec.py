@@ -0,0 +1,110 @@
+import io
+import json
+
+import pytest
+
+from src.sho_da_igram.utils import codec
+from src.sho_da_igram.utils.codec import JsonCodec, configure_codec
+from src.sho_da_igram.utils.records import record_from_dict
+from src.sho_da_igram.utils.utils import JsonLinesWriter, JsonUtils
+from tests.test_records import GAMES
+
+FAST_BACKENDS = [
+    pytest.param(
+        backend,
+        marks=pytest.mark.skipif(
+            getattr(codec, backend) is None, reason=f"{backend} is not installed"
+        ),
+    )
+    for backend in ("orjson", "msgspec")
+]
+BACKENDS = ["stdlib"] + FAST_BACKENDS
+
+
+@pytest.fixture(autouse=True)
+def restore_codec():
+    yield
+    configure_codec()
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        JsonCodec("simdjson")
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec"])
+def test_missing_backend(backend, monkeypatch):
+    monkeypatch.setattr(codec, backend, None)
+    with pytest.raises(ValueError, match=backend):
+        JsonCodec(backend)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_loads_matches_stdlib(backend):
+    document = json.dumps(GAMES)
+    json_codec = JsonCodec(backend)
+    assert json.dumps(json_codec.loads(document)) == json.dumps(json.loads(document))
+    assert json_codec.loads(document.encode("utf-8"))[0] == GAMES[0]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_loads_invalid_json(backend):
+    with pytest.raises(ValueError):
+        JsonCodec(backend).loads('{"id": ')
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("records", [False, True])
+def test_compat_documents_match_json_dump(backend, records):
+    data = [record_from_dict(game) for game in GAMES] if records else GAMES
+    stream = io.StringIO()
+    JsonCodec(backend).dump_document(data, stream, 2)
+    assert stream.getvalue() == json.dumps(GAMES, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_compat_lines_match_json_dumps(backend):
+    json_codec = JsonCodec(backend)
+    for game in GAMES:
+        expected = json.dumps(game, ensure_ascii=False, separators=(",", ":"))
+        assert json_codec.dumps_line(game) == expected
+        assert json_codec.dumps_line(record_from_dict(game)) == expected
+
+
+@pytest.mark.parametrize("backend", FAST_BACKENDS)
+@pytest.mark.parametrize("records", [False, True])
+def test_fast_encoding_decodes_to_the_same_data(backend, records):
+    finite = [game for game in GAMES if game.get("rating") == game.get("rating")]
+    data = [record_from_dict(game) for game in finite] if records else finite
+    json_codec = JsonCodec(backend, compat=False)
+    stream = io.StringIO()
+    json_codec.dump_document(data, stream, 2)
+    assert json.loads(stream.getvalue()) == finite
+    assert [json.loads(json_codec.dumps_line(item)) for item in data] == finite
+
+
+@pytest.mark.parametrize("backend", FAST_BACKENDS)
+def test_fast_encoding_falls_back_for_unsupported_values(backend):
+    json_codec = JsonCodec(backend, compat=False)
+    assert json_codec.dumps_line({"id": 2**70}) == '{"id":1180591620717411303424}'
+    stream = io.StringIO()
+    json_codec.dump_document([{"id": 1}], stream, 3)
+    assert stream.getvalue() == json.dumps([{"id": 1}], indent=3)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_output_files_are_byte_identical(backend, tmp_path):
+    configure_codec(backend)
+    records = [record_from_dict(game) for game in GAMES]
+    JsonUtils.save_to_json(records, tmp_path / f"{backend}.json")
+    with JsonLinesWriter(tmp_path / f"{backend}.jsonl") as writer:
+        writer.write_many(records)
+
+    configure_codec("stdlib")
+    JsonUtils.save_to_json(GAMES, tmp_path / "stdlib.json")
+    with JsonLinesWriter(tmp_path / "stdlib.jsonl") as writer:
+        writer.write_many(GAMES)
+
+    for extension in ("json", "jsonl"):
+        expected = (tmp_path / f"stdlib.{extension}").read_bytes()
+        assert (tmp_path / f"{backend}.{extension}").read_bytes() == expected
@@ -0,0 +1,75 @@
+import threading
+import uuid
+from collections import Counter
+
+import httpx
+import pytest
+
+from src.sho_da_igram.api.credentials import CredentialPool, NoCredentialsError
+
+
+def make_pool(keys=3, **kwargs):
+    # Limiters are shared by process, so every test gets its own keys
+    run = uuid.uuid4().hex
+    credentials = [{"key": f"{run}-{index}"} for index in range(keys)]
+    return CredentialPool("test", credentials, rate_limit=1.0, **kwargs)
+
+
+def test_concurrent_picks_spread_over_idle_keys():
+    pool = make_pool(keys=4)
+    barrier = threading.Barrier(4)
+    picked = []
+
+    def pick():
+        barrier.wait()
+        credential, _ = pool.pick()
+        picked.append(credential.label)
+
+    threads = [threading.Thread(target=pick) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(picked) == [f"test#{index}" for index in range(1, 5)]
+
+
+def test_picks_reserve_tokens_round_robin():
+    pool = make_pool(keys=2)
+    picks = [pool.pick() for _ in range(6)]
+
+    assert Counter(credential.label for credential, _ in picks) == {
+        "test#1": 3,
+        "test#2": 3,
+    }
+    # The third pick of a key waits two intervals behind its first
+    first, third = [ready_at for c, ready_at in picks if c.label == "test#1"][::2]
+    assert third - first == pytest.approx(2.0, abs=0.05)
+
+
+def test_refused_key_is_removed_for_good():
+    pool = make_pool(keys=2, max_strikes=2)
+    refused, _ = pool.pick()
+    assert pool.observe(refused, httpx.Response(401)) is True
+    pool.observe(refused, httpx.Response(401))
+
+    assert refused.removed_for_good
+    assert all(pool.pick()[0] is not refused for _ in range(3))
+
+
+def test_every_key_refused_raises():
+    pool = make_pool(keys=1, max_strikes=1)
+    credential, _ = pool.pick()
+    assert pool.observe(credential, httpx.Response(403)) is False
+    with pytest.raises(NoCredentialsError):
+        pool.pick()
+
+
+def test_throttled_key_is_set_aside_but_used_when_nothing_else_is_left():
+    pool = make_pool(keys=1, max_strikes=1, cooldown=60)
+    credential, _ = pool.pick()
+    pool.observe(credential, httpx.Response(429, headers={"Retry-After": "0"}))
+
+    assert not credential.removed_for_good
+    assert pool.pick()[0] is credential
+    assert pool.usage()["test#1"] == {"requests": 1, "throttled": 1, "rejected": 0}
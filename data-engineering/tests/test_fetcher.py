@@ -0,0 +1,163 @@
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.sho_da_igram.data.checkpoint import FetchCheckpoint
+from src.sho_da_igram.data.fetcher import IGDBDataFetcher, RAWGDataFetcher
+from src.sho_da_igram.data.report import IncompleteFetchError
+from src.sho_da_igram.utils.utils import JsonUtils
+
+
+def http_error(status):
+    request = httpx.Request("POST", "http://mock/multiquery")
+    return httpx.HTTPStatusError(
+        str(status), request=request, response=httpx.Response(status)
+    )
+
+
+def fail_call(monkeypatch, client, number, error, method="multiquery"):
+    """Make the ``number``th call of a client method raise ``error``."""
+    original = getattr(client, method)
+    calls = 0
+
+    def flaky(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == number:
+            raise error
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(client, method, flaky)
+    return original
+
+
+def igdb_ids(path):
+    return [game["igdb_id"] for game in JsonUtils.load_records(path)]
+
+
+def rawg_ids(path):
+    return [game["rawg_id"] for game in JsonUtils.load_records(path)]
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson"])
+def test_rawg_run_stopped_early_keeps_its_checkpoint_and_resumes(
+    config, monkeypatch, output_format
+):
+    config.output_format = output_format
+    data_dir = Path(config.data_dir)
+    fetcher = RAWGDataFetcher(config)
+
+    get_games_page = fail_call(
+        monkeypatch, fetcher.client, 3, http_error(400), "get_games_page"
+    )
+    with pytest.raises(IncompleteFetchError, match="--resume"):
+        fetcher.fetch_games_to_json(limit=200, output_filename=f"out.{output_format}")
+    assert json.loads((data_dir / "rawg.checkpoint").read_text())["cursor"] == 3
+    assert not (data_dir / f"out.{output_format}").exists()
+
+    monkeypatch.setattr(fetcher.client, "get_games_page", get_games_page)
+    output = fetcher.fetch_games_to_json(limit=200, resume=True)
+    fetcher.close()
+
+    assert output.name == f"out.{output_format}"
+    assert rawg_ids(output) == list(range(1, 201))
+    assert not (data_dir / "rawg.checkpoint").exists()
+
+
+def test_igdb_run_with_too_many_failures_keeps_its_checkpoint(config, monkeypatch):
+    config.max_consecutive_failures = 1
+    config.igdb_multiquery_size = 1
+    fetcher = IGDBDataFetcher(config)
+    fail_call(monkeypatch, fetcher.client, 2, http_error(503))
+
+    with pytest.raises(IncompleteFetchError, match="Too many consecutive"):
+        fetcher.fetch_games_to_json(limit=1000, output_filename="out.json")
+    fetcher.close()
+
+    state = FetchCheckpoint(Path(config.data_dir), "igdb").load()
+    assert state.cursor == 500
+    assert len(state.games) == 500
+    assert fetcher.report.failed_cursors("offset") == [500]
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson"])
+def test_partitioned_run_resumes_from_partition_cursors(
+    config, monkeypatch, output_format
+):
+    config.igdb_pagination = "partitioned"
+    config.igdb_partition_years = 50
+    config.output_format = output_format
+    data_dir = Path(config.data_dir)
+    fetcher = IGDBDataFetcher(config)
+
+    full = fetcher.fetch_games_to_json(
+        limit=5000, output_filename=f"full.{output_format}"
+    )
+    expected = igdb_ids(full)
+
+    multiquery = fail_call(monkeypatch, fetcher.client, 2, http_error(400))
+    with pytest.raises(IncompleteFetchError):
+        fetcher.fetch_games_to_json(
+            limit=5000, output_filename=f"resumed.{output_format}"
+        )
+    state = json.loads((data_dir / "igdb.checkpoint").read_text())
+    assert any(cursor for cursor in state["cursors"].values())
+    assert not (data_dir / f"resumed.{output_format}").exists()
+
+    monkeypatch.setattr(fetcher.client, "multiquery", multiquery)
+    output = fetcher.fetch_games_to_json(limit=5000, resume=True)
+    fetcher.close()
+
+    assert sorted(igdb_ids(output)) == sorted(expected)
+    assert not (data_dir / "igdb.checkpoint").exists()
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson"])
+def test_partitioned_run_keeps_the_top_rated_games(config, output_format):
+    config.output_format = output_format
+    fetcher = IGDBDataFetcher(config)
+    offset = fetcher.fetch_games_to_json(
+        limit=300, output_filename=f"offset.{output_format}"
+    )
+
+    config.igdb_pagination = "partitioned"
+    partitioned = fetcher.fetch_games_to_json(
+        limit=300, output_filename=f"partitioned.{output_format}"
+    )
+    fetcher.close()
+
+    # Every partition is fetched in full before the limit is applied, so the
+    # output holds the same games as the rating-ordered offset queries
+    ids = igdb_ids(partitioned)
+    assert ids == igdb_ids(offset)
+    assert len(ids) == len(set(ids)) == 300
+    assert fetcher.report.fetched == 300
+
+
+def test_rawg_run_drops_games_repeated_across_shifted_pages(
+    config, mock_api, monkeypatch
+):
+    fetcher = RAWGDataFetcher(config)
+    get_games_page = fetcher.client.get_games_page
+
+    def shifted_page(page, page_size, **params):
+        # Games were added at the top of the list after page 1 was read, so
+        # every later page starts with the last 5 games of the one before
+        response = get_games_page(page=page, page_size=page_size, **params)
+        if page > 1:
+            before = get_games_page(page=page - 1, page_size=page_size, **params)
+            response["results"] = (before["results"] + response["results"])[
+                page_size - 5 : 2 * page_size - 5
+            ]
+        return response
+
+    monkeypatch.setattr(fetcher.client, "get_games_page", shifted_page)
+    output = fetcher.fetch_games_to_json(limit=150, output_filename="out.json")
+    fetcher.close()
+
+    assert rawg_ids(output) == list(range(1, 151))
+    assert fetcher.report.duplicates == 5
+    # Details are fetched once per game
+    assert mock_api.stats.endpoints["rawg games/{id}"] == 150
@@ -0,0 +1,32 @@
+import pytest
+
+from src.sho_da_igram.utils.utils import (
+    GameDataHandler,
+    IGDBDataHandler,
+    RAWGDataHandler,
+)
+
+
+class IncompleteHandler(GameDataHandler):
+    SOURCE = "incomplete"
+
+
+def test_handler_without_process_game_data_cannot_be_created():
+    with pytest.raises(TypeError):
+        IncompleteHandler()
+
+
+def test_handler_without_process_game_data_fails_before_processing():
+    with pytest.raises(TypeError, match="process_game_data"):
+        IncompleteHandler.process_batch([{"id": 1}] * 3000, workers=2)
+
+
+@pytest.mark.parametrize("handler", [RAWGDataHandler, IGDBDataHandler])
+def test_source_handlers_are_complete(handler):
+    assert not handler.__abstractmethods__
+
+
+def test_invalid_games_are_collected_as_failures():
+    batch = IGDBDataHandler.process_batch([{"id": 7}, None, {"id": 8}])
+    assert [record["igdb_id"] for record in batch.records] == [7, 8]
+    assert [game_id for game_id, _ in batch.failures] == ["unknown"]
@@ -0,0 +1,180 @@
+import json
+import stat
+import time
+
+import httpx
+import pytest
+
+from src.sho_da_igram.api import igdb_auth
+from src.sho_da_igram.api.credentials import CredentialPool
+from src.sho_da_igram.api.igdb_auth import TokenProvider, get_token_provider
+from src.sho_da_igram.api.igdb_client import IGDBClient, build_auth_headers
+
+
+class Clock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+class TokenEndpoint:
+    """Stand-in for Twitch's token endpoint, handing out numbered tokens."""
+
+    def __init__(self, expires_in=3600, status=200):
+        self.expires_in = expires_in
+        self.status = status
+        self.calls = []
+
+    def __call__(self, url, data, timeout):
+        self.calls.append(data)
+        request = httpx.Request("POST", url)
+        if self.status != 200:
+            return httpx.Response(self.status, json={}, request=request)
+        token = {
+            "access_token": f"token-{len(self.calls)}",
+            "expires_in": self.expires_in,
+        }
+        return httpx.Response(200, json=token, request=request)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(igdb_auth.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def endpoint(monkeypatch):
+    endpoint = TokenEndpoint()
+    monkeypatch.setattr(igdb_auth.httpx, "post", endpoint)
+    return endpoint
+
+
+def provider(tmp_path, client_id="client", margin=600.0):
+    return TokenProvider(client_id, "secret", tmp_path / "token.json", margin)
+
+
+def test_token_is_fetched_once_and_cached_on_disk(tmp_path, clock, endpoint):
+    tokens = provider(tmp_path)
+    assert tokens.token() == "token-1"
+    assert tokens.token() == "token-1"
+    assert endpoint.calls == [
+        {
+            "client_id": "client",
+            "client_secret": "secret",
+            "grant_type": "client_credentials",
+        }
+    ]
+
+    cache_path = tmp_path / "token.json"
+    assert stat.S_IMODE(cache_path.stat().st_mode) == 0o600
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["token.json"]
+    assert json.loads(cache_path.read_text()) == {
+        "client": {"access_token": "token-1", "expires_at": clock.now + 3600}
+    }
+
+    # Another run picks the token up from the file
+    assert provider(tmp_path).token() == "token-1"
+    assert len(endpoint.calls) == 1
+
+
+def test_token_is_refreshed_inside_the_margin(tmp_path, clock, endpoint):
+    tokens = provider(tmp_path, margin=600)
+    tokens.token()
+    clock.now += 2999
+    assert tokens.token() == "token-1"
+    clock.now += 2
+    assert tokens.token() == "token-2"
+    assert len(endpoint.calls) == 2
+
+
+def test_cache_file_keeps_other_client_ids(tmp_path, clock, endpoint):
+    provider(tmp_path, "first").token()
+    provider(tmp_path, "second").token()
+    saved = json.loads((tmp_path / "token.json").read_text())
+    assert {key: value["access_token"] for key, value in saved.items()} == {
+        "first": "token-1",
+        "second": "token-2",
+    }
+
+
+def test_unreadable_cache_is_ignored(tmp_path, clock, endpoint):
+    (tmp_path / "token.json").write_text("{not json")
+    assert provider(tmp_path).token() == "token-1"
+    assert "token-1" in (tmp_path / "token.json").read_text()
+
+
+def test_invalidate_only_drops_the_refused_token(tmp_path, clock, endpoint):
+    tokens = provider(tmp_path)
+    tokens.token()
+    tokens.invalidate("token-0")
+    assert tokens.token() == "token-1"
+
+    tokens.invalidate("token-1")
+    assert tokens.token() == "token-2"
+    token, expires_at = tokens.refresh()
+    assert (token, expires_at) == ("token-3", clock.now + 3600)
+
+
+def test_refused_credentials_raise(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(igdb_auth.httpx, "post", TokenEndpoint(status=400))
+    with pytest.raises(httpx.HTTPStatusError):
+        provider(tmp_path).token()
+    assert not (tmp_path / "token.json").exists()
+
+
+def test_providers_are_shared_per_client_id(tmp_path, monkeypatch):
+    monkeypatch.setattr(igdb_auth, "_providers", {})
+    first = get_token_provider("client", "secret", tmp_path / "token.json")
+    assert get_token_provider("client", "other", tmp_path / "x.json") is first
+    assert get_token_provider("other", "secret", tmp_path / "token.json") is not first
+    with pytest.raises(ValueError):
+        TokenProvider("client", "", tmp_path / "token.json")
+
+
+def igdb_client(tmp_path, client_id, accepted):
+    """IGDB client whose API accepts only the tokens in ``accepted``."""
+    sent = []
+
+    def answer(request):
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        sent.append(token)
+        if token in accepted:
+            return httpx.Response(200, json=[{"id": 1}])
+        return httpx.Response(401, json={"message": "Authorization Failure"})
+
+    client = IGDBClient(
+        client_id=client_id,
+        access_token="",
+        rate_limit=0,
+        credentials=CredentialPool("igdb", [build_auth_headers(client_id, "")], 0),
+        token_provider=provider(tmp_path, client_id),
+        base_url="http://igdb.test/v4",
+    )
+    client.client = httpx.Client(transport=httpx.MockTransport(answer))
+    return client, sent
+
+
+def test_refused_token_is_renewed_and_resent_once(tmp_path, clock, endpoint):
+    client, sent = igdb_client(tmp_path, "renewing", accepted={"token-2"})
+    assert client.get_top_games(limit=1) == [{"id": 1}]
+    assert sent == ["token-1", "token-2"]
+    assert len(endpoint.calls) == 2
+    # The renewed token is used from then on
+    client.get_top_games(limit=2)
+    assert sent[-1] == "token-2" and len(endpoint.calls) == 2
+    assert client.transport.credentials.usage()["igdb#1"]["rejected"] == 0
+    client.close()
+
+
+def test_token_is_renewed_only_once_per_request(tmp_path, clock, endpoint):
+    client, sent = igdb_client(tmp_path, "refused", accepted=set())
+    with pytest.raises(httpx.HTTPStatusError) as error:
+        client.get_top_games(limit=1)
+    assert error.value.response.status_code == 401
+    assert sent == ["token-1", "token-2"]
+    assert client.transport.credentials.usage()["igdb#1"]["rejected"] == 1
+    client.close()
@@ -0,0 +1,201 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.sho_da_igram.api.igdb_batcher import IGDBQueryBatcher
+from src.sho_da_igram.api.igdb_client import (
+    MAX_MULTIQUERY_SIZE,
+    AsyncIGDBClient,
+    IGDBClient,
+    PayloadStats,
+    build_game_by_id_query,
+    build_multiquery,
+    count_records,
+    profile_fields,
+    unpack_multiquery,
+)
+from src.sho_da_igram.utils.utils import IGDBDataHandler
+
+
+@pytest.fixture
+def igdb_client(config):
+    client = IGDBClient(
+        client_id=config.igdb_client_id,
+        access_token=config.igdb_access_token,
+        rate_limit=config.igdb_rate_limit,
+        base_url=config.igdb_base_url,
+        batch_wait=0.2,
+    )
+    yield client
+    client.close()
+
+
+def test_batcher_sends_full_batches_at_once_and_flushes_the_rest():
+    sent = []
+
+    def send(queries):
+        sent.append(queries)
+        return [[{"query": query}] for _, query in queries]
+
+    batcher = IGDBQueryBatcher(send, max_size=3, max_wait=0.05)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda i: batcher.query("games", f"q{i}"), range(4))
+        )
+
+    assert results == [[{"query": f"q{i}"}] for i in range(4)]
+    assert sorted(len(batch) for batch in sent) == [1, 3]
+
+
+def test_batcher_fails_every_query_of_a_failed_batch():
+    def send(queries):
+        raise RuntimeError("boom")
+
+    batcher = IGDBQueryBatcher(send, max_size=2, max_wait=0.01)
+    futures = [batcher.submit("games", "a"), batcher.submit("games", "b")]
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(timeout=1)
+
+
+def test_concurrent_lookups_share_one_multiquery(igdb_client, mock_api):
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        games = list(executor.map(igdb_client.get_game_by_id, range(1, 11)))
+
+    assert [game["id"] for game in games] == list(range(1, 11))
+    assert mock_api.stats.endpoints == {"igdb multiquery": 1}
+
+
+def test_async_lookups_are_batched_by_ten(config, mock_api):
+    async def lookup():
+        async with AsyncIGDBClient(
+            client_id=config.igdb_client_id,
+            access_token=config.igdb_access_token,
+            rate_limit=config.igdb_rate_limit,
+            base_url=config.igdb_base_url,
+        ) as client:
+            return await asyncio.gather(
+                *(client.get_game_by_id(game_id) for game_id in range(1, 26))
+            )
+
+    games = asyncio.run(lookup())
+    assert [game["id"] for game in games] == list(range(1, 26))
+    assert mock_api.stats.endpoints == {"igdb multiquery": 3}
+
+
+def test_missing_game_is_none(igdb_client):
+    assert igdb_client.get_game_by_id(999_999) is None
+
+
+def test_build_multiquery_names_queries_by_position():
+    body = build_multiquery([("games", " fields name; "), ("platforms", "fields *;")])
+    assert body == (
+        'query games "q0" { fields name; };\nquery platforms "q1" { fields *; };'
+    )
+
+
+def test_build_multiquery_holds_at_most_ten_queries():
+    build_multiquery([("games", "fields name;")] * MAX_MULTIQUERY_SIZE)
+    with pytest.raises(ValueError):
+        build_multiquery([("games", "fields name;")] * (MAX_MULTIQUERY_SIZE + 1))
+
+
+def test_unpack_multiquery_restores_query_order():
+    response = [
+        {"name": "q1", "result": [{"id": 2}]},
+        {"name": "q0", "result": [{"id": 1}]},
+        {"name": "q2"},
+    ]
+    assert unpack_multiquery(response, 3) == [[{"id": 1}], [{"id": 2}], []]
+
+
+def test_unpack_multiquery_rejects_a_missing_result():
+    with pytest.raises(ValueError, match="q1"):
+        unpack_multiquery([{"name": "q0", "result": []}], 2)
+
+
+def id_queries(client, game_ids):
+    return [("games", build_game_by_id_query(i, client.fields)) for i in game_ids]
+
+
+def test_multiquery_splits_into_groups_of_ten(igdb_client, mock_api):
+    results = igdb_client.multiquery(id_queries(igdb_client, range(1, 22)))
+
+    assert [games[0]["id"] for games in results] == list(range(1, 22))
+    # 10 + 10 in /multiquery, the lone last query on its own endpoint
+    assert mock_api.stats.endpoints == {"igdb multiquery": 2, "igdb games": 1}
+
+
+def test_async_multiquery_splits_into_groups_of_ten(config, mock_api):
+    async def run():
+        async with AsyncIGDBClient(
+            client_id=config.igdb_client_id,
+            access_token=config.igdb_access_token,
+            rate_limit=config.igdb_rate_limit,
+            base_url=config.igdb_base_url,
+        ) as client:
+            return await client.multiquery(id_queries(client, range(1, 26)))
+
+    results = asyncio.run(run())
+    assert [games[0]["id"] for games in results] == list(range(1, 26))
+    assert mock_api.stats.endpoints == {"igdb multiquery": 3}
+
+
+def test_recommendation_profile_covers_the_handler(config, mock_api):
+    fields = profile_fields("recommendation")
+    for field in IGDBDataHandler.CONSUMED_FIELDS:
+        assert f"{field}," in fields or f"{field};" in fields
+
+    processed = {}
+    for profile in ("full", "recommendation"):
+        client = IGDBClient(
+            client_id=config.igdb_client_id,
+            access_token=config.igdb_access_token,
+            rate_limit=0,
+            base_url=config.igdb_base_url,
+            field_profile=profile,
+        )
+        games = client.get_top_games(limit=20, min_rating=0)
+        processed[profile] = [
+            IGDBDataHandler.process_game_data(game, fetched_at="2024-01-01")
+            for game in games
+        ]
+        client.close()
+        assert client.payload.records == 20
+
+    # The trimmed field list loses nothing the handler reads
+    assert processed["recommendation"] == processed["full"]
+    assert processed["full"][0]["developers"] and processed["full"][0]["age_ratings"]
+
+
+def test_unknown_field_profile_is_rejected():
+    with pytest.raises(ValueError, match="minimal, recommendation, full"):
+        profile_fields("everything")
+
+
+def test_payload_stats_count_network_bytes_and_records():
+    stats = PayloadStats("recommendation")
+    body = json.dumps([{"id": 1}, {"id": 2}]).encode()
+    multiquery = json.dumps(
+        [{"name": "q0", "result": [{"id": 3}]}, {"name": "q1", "result": []}]
+    ).encode()
+
+    assert stats.parse(body) == [{"id": 1}, {"id": 2}]
+    stats.parse(multiquery)
+    # Cached responses are parsed but cost no bytes on the wire
+    stats.parse(body, from_cache=True)
+
+    assert (stats.responses, stats.cached) == (3, 1)
+    assert stats.bytes_received == len(body) + len(multiquery)
+    assert stats.records == 3
+    assert stats.parse_seconds > 0
+    assert "3 games" in stats.summary() and "(1 cached)" in stats.summary()
+
+
+def test_count_records():
+    assert count_records([{"id": 1}]) == 1
+    assert count_records([]) == 0
+    assert count_records({"message": "error"}) == 0
+    assert count_records([{"name": "q0", "result": [{"id": 1}, {"id": 2}]}]) == 2
@@ -0,0 +1,32 @@
+import main
+from src.sho_da_igram.api.igdb_client import IGDBClient
+from src.sho_da_igram.data.report import IncompleteFetchError
+from tests.test_fetcher import http_error, rawg_ids
+
+
+def test_failed_source_does_not_stop_the_other(config, monkeypatch, capsys):
+    config.fetch_limit = 100
+
+    def refuse(*args, **kwargs):
+        raise http_error(400)
+
+    monkeypatch.setattr(IGDBClient, "multiquery", refuse)
+    results = main.run_pipelines(config, ["rawg", "igdb"])
+
+    rawg, igdb = results
+    assert (rawg.source, igdb.source) == ("rawg", "igdb")
+    assert rawg.error is None and rawg.records == 100
+    assert rawg_ids(rawg.output_file) == list(range(1, 101))
+    assert isinstance(igdb.error, IncompleteFetchError)
+    assert igdb.output_file is None and igdb.records == 0
+    assert rawg.seconds > 0 and igdb.seconds > 0
+
+    summary = main.run_summary(results, wall_time=1.0)
+    assert not summary["success"]
+    assert summary["sources"]["rawg"]["error"] is None
+    assert summary["sources"]["igdb"]["error"] == str(igdb.error)
+
+    main.print_summary(results, wall_time=1.0)
+    printed = capsys.readouterr().out
+    assert "✅ RAWG: 100 games" in printed
+    assert "❌ IGDB: failed after" in printed
@@ -0,0 +1,121 @@
+import json
+from pathlib import Path
+
+import httpx
+
+from src.sho_da_igram.data.fetcher import (
+    IGDBDataFetcher,
+    RAWGDataFetcher,
+    select_changed,
+)
+from src.sho_da_igram.data.manifest import FetchManifest
+from src.sho_da_igram.utils.utils import JsonUtils
+
+# Before the mock catalog's updated_at, so a delta since then returns every game
+EARLY_RUN = 1_000_000
+
+
+def write_manifest(data_dir, source, last_run, games):
+    data_dir.mkdir(parents=True, exist_ok=True)
+    state = {"source": source, "last_run": last_run, "games": games}
+    (data_dir / f"{source}.manifest.json").write_text(json.dumps(state))
+
+
+def load_manifest(data_dir, source):
+    return json.loads((data_dir / f"{source}.manifest.json").read_text())
+
+
+def test_new_and_updated_games_are_changed(tmp_path):
+    write_manifest(tmp_path, "rawg", 1, {"1": "2024-01-01", "2": "2024-01-01"})
+    manifest = FetchManifest(tmp_path, "rawg", "rawg_id", "updated")
+    entries = [
+        {"id": 1, "updated": "2024-01-01"},
+        {"id": 2, "updated": "2024-02-01"},
+        {"id": 3, "updated": "2024-01-01"},
+        {"id": 4},
+    ]
+    assert [game["id"] for game in select_changed(entries, manifest)] == [2, 3, 4]
+    assert select_changed(entries, None) == entries
+
+
+def test_save_records_games_and_stamps_the_run(tmp_path):
+    manifest = FetchManifest(tmp_path, "rawg", "rawg_id", "updated")
+    assert manifest.last_run is None
+    manifest.record({"rawg_id": 7, "updated": "2024-01-01"})
+    manifest.save()
+
+    reloaded = FetchManifest(tmp_path, "rawg", "rawg_id", "updated")
+    assert reloaded.last_run == manifest.run_started
+    assert reloaded.games == {"7": "2024-01-01"}
+    assert not reloaded.is_changed(7, "2024-01-01")
+    assert manifest.new == 1 and manifest.changed == 0
+
+
+def test_incomplete_save_keeps_the_previous_last_run(tmp_path):
+    write_manifest(tmp_path, "igdb", EARLY_RUN, {})
+    manifest = FetchManifest(tmp_path, "igdb", "igdb_id", "updated_at")
+    manifest.record({"igdb_id": 7, "updated_at": 5})
+    manifest.save(complete=False)
+
+    state = load_manifest(tmp_path, "igdb")
+    assert state["last_run"] == EARLY_RUN
+    assert state["games"] == {"7": 5}
+
+
+def test_failed_delta_window_is_fetched_by_the_next_delta(config, monkeypatch):
+    config.igdb_multiquery_size = 1
+    data_dir = Path(config.data_dir)
+    write_manifest(data_dir, "igdb", EARLY_RUN, {})
+
+    fetcher = IGDBDataFetcher(config)
+    multiquery = fetcher.client.multiquery
+    request = httpx.Request("POST", config.igdb_base_url)
+
+    def fail_second_window(queries):
+        if any("offset 500;" in query for _, query in queries):
+            raise httpx.HTTPStatusError(
+                "unavailable", request=request, response=httpx.Response(503)
+            )
+        return multiquery(queries)
+
+    monkeypatch.setattr(fetcher.client, "multiquery", fail_second_window)
+    first = fetcher.fetch_games_to_json(
+        limit=1000, output_filename="first.json", delta=True
+    )
+    assert fetcher.report.failed_cursors("offset") == [500]
+    assert load_manifest(data_dir, "igdb")["last_run"] == EARLY_RUN
+
+    monkeypatch.setattr(fetcher.client, "multiquery", multiquery)
+    second = fetcher.fetch_games_to_json(
+        limit=1000, output_filename="second.json", delta=True
+    )
+    fetcher.close()
+
+    first_ids = {game["igdb_id"] for game in JsonUtils.load_records(first)}
+    second_ids = {game["igdb_id"] for game in JsonUtils.load_records(second)}
+    # The run went on past the failed window to the end of the catalog
+    assert len(first_ids) == 700
+    assert len(second_ids) == 1000
+    assert len(second_ids - first_ids) == 500
+    assert load_manifest(data_dir, "igdb")["last_run"] > EARLY_RUN
+
+
+def test_rawg_delta_refetches_changed_games_past_the_cache(config, mock_api):
+    config.cache_enabled = True
+    data_dir = Path(config.data_dir)
+    fetcher = RAWGDataFetcher(config)
+    fetcher.fetch_games_to_json(limit=40, output_filename="first.json", delta=True)
+
+    state = load_manifest(data_dir, "rawg")
+    for game_id in range(1, 11):
+        state["games"][str(game_id)] = "2000-01-01T00:00:00"
+    write_manifest(data_dir, "rawg", state["last_run"], state["games"])
+
+    details_before = mock_api.stats.endpoints["rawg games/{id}"]
+    second = fetcher.fetch_games_to_json(
+        limit=40, output_filename="second.json", delta=True
+    )
+    fetcher.close()
+
+    assert mock_api.stats.endpoints["rawg games/{id}"] - details_before == 10
+    assert len(JsonUtils.load_records(second)) == 10
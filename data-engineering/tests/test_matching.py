@@ -0,0 +1,189 @@
+import random
+
+import pytest
+
+from src.sho_da_igram.data.matching import (
+    NAME_MATCH,
+    SLUG_MATCH,
+    GameMatch,
+    bounded_levenshtein,
+    match_games,
+    match_outputs,
+    normalize_name,
+    release_year,
+)
+from src.sho_da_igram.utils.utils import JsonUtils
+
+
+def levenshtein(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def brute_force(rawg_games, igdb_games, max_distance=2, min_name_length=3):
+    """Compare every pair with the backend rules, then pick greedily."""
+    pairs = []
+    for rawg in rawg_games:
+        rawg_name = normalize_name(rawg.get("name"))
+        rawg_slug = (rawg.get("slug") or "").lower()
+        rawg_year = release_year(rawg.get("released"))
+        for igdb in igdb_games:
+            igdb_name = normalize_name(igdb.get("name"))
+            igdb_year = release_year(igdb.get("first_release_date"))
+            if igdb_year not in (rawg_year, None):
+                continue
+            if rawg_slug and rawg_slug == (igdb.get("slug") or "").lower():
+                pairs.append(
+                    GameMatch(rawg["rawg_id"], igdb["igdb_id"], 1.0, SLUG_MATCH)
+                )
+                continue
+            if (
+                min(len(rawg_name), len(igdb_name)) < min_name_length
+                or rawg_year != igdb_year
+            ):
+                continue
+            distance = levenshtein(rawg_name, igdb_name)
+            if distance <= max_distance:
+                score = round(1.0 - distance / max(len(rawg_name), len(igdb_name)), 4)
+                pairs.append(
+                    GameMatch(rawg["rawg_id"], igdb["igdb_id"], score, NAME_MATCH)
+                )
+
+    pairs.sort(key=lambda pair: (-pair.score, pair.rawg_id, pair.igdb_id))
+    used_rawg, used_igdb, matches = set(), set(), []
+    for pair in pairs:
+        if pair.rawg_id in used_rawg or pair.igdb_id in used_igdb:
+            continue
+        used_rawg.add(pair.rawg_id)
+        used_igdb.add(pair.igdb_id)
+        matches.append(pair)
+    return sorted(matches, key=lambda match: match.rawg_id)
+
+
+def mutate(rng, name):
+    for _ in range(rng.randint(0, 3)):
+        i = rng.randrange(len(name) + 1)
+        edit = rng.choice("isd")
+        if edit == "i":
+            name = name[:i] + rng.choice("abc ") + name[i:]
+        elif edit == "s" and i < len(name):
+            name = name[:i] + rng.choice("abc") + name[i + 1 :]
+        elif i < len(name):
+            name = name[:i] + name[i + 1 :]
+    return name
+
+
+def random_games(seed, count):
+    rng = random.Random(seed)
+    names = [
+        "".join(rng.choice("abc") for _ in range(rng.randint(1, 16)))
+        for _ in range(count // 2)
+    ]
+    years = [None, 2019, 2020]
+    igdb, rawg = [], []
+    for i in range(count):
+        name = rng.choice(names)
+        igdb.append(
+            {
+                "igdb_id": i,
+                "name": mutate(rng, name),
+                "slug": f"slug-{rng.randrange(count * 4)}",
+                "first_release_date": rng.choice([None, "2019-05-01", "2020-01-02"]),
+            }
+        )
+        year = rng.choice(years)
+        rawg.append(
+            {
+                "rawg_id": 1000 + i,
+                "name": mutate(rng, name),
+                "slug": rng.choice([None, f"SLUG-{rng.randrange(count * 4)}"]),
+                "released": f"{year}-03-04" if year else None,
+            }
+        )
+    return rawg, igdb
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [("kitten", "sitting", None), ("kitten", "sittin", 2), ("abc", "abc", 0)],
+)
+def test_bounded_levenshtein(a, b, expected):
+    assert bounded_levenshtein(a, b, 2) == expected
+
+
+def test_bounded_levenshtein_agrees_with_full_distance():
+    rng = random.Random(7)
+    for _ in range(2000):
+        a = "".join(rng.choice("ab") for _ in range(rng.randint(0, 8)))
+        b = "".join(rng.choice("ab") for _ in range(rng.randint(0, 8)))
+        distance = levenshtein(a, b)
+        assert bounded_levenshtein(a, b, 2) == (distance if distance <= 2 else None)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_blocked_matching_equals_brute_force(seed):
+    rawg, igdb = random_games(seed, 150)
+    matches, report = match_games(rawg, igdb)
+    assert matches == brute_force(rawg, igdb)
+    assert report.matched == len(matches)
+    # Blocking must actually prune the comparisons
+    assert report.candidates < len(rawg) * len(igdb) // 10
+
+
+@pytest.mark.parametrize("max_distance", [1, 3])
+def test_blocked_matching_equals_brute_force_for_other_distances(max_distance):
+    rawg, igdb = random_games(42, 120)
+    matches, _ = match_games(rawg, igdb, max_distance=max_distance)
+    assert matches == brute_force(rawg, igdb, max_distance=max_distance)
+
+
+def test_match_rules():
+    igdb = [
+        {"igdb_id": 1, "name": "Half-Life", "slug": "half-life"},
+        {"igdb_id": 2, "name": "Portal 2", "first_release_date": "2011-04-19"},
+        {"igdb_id": 3, "name": "Portal 3", "first_release_date": "2011-04-19"},
+        {"igdb_id": 4, "name": "Go", "first_release_date": "2000-01-01"},
+        {"igdb_id": 5, "name": "Doom", "slug": "doom", "first_release_date": "1993"},
+        {"igdb_id": 6, "name": "Myst", "slug": "myst", "first_release_date": "1993"},
+        {"igdb_id": 7, "name": "Quake", "slug": "quake"},
+    ]
+    rawg = [
+        {"rawg_id": 10, "name": "Something else", "slug": "HALF-LIFE"},
+        {"rawg_id": 11, "name": "Portal  2", "released": "2011-04-19"},
+        {"rawg_id": 12, "name": "Portal 2", "released": "2012-01-01"},
+        {"rawg_id": 13, "name": "Go", "released": "2000-01-01"},
+        # A slug only matches IGDB games from the same year or without one
+        {"rawg_id": 14, "name": "Doom (2016)", "slug": "doom", "released": "2016"},
+        {"rawg_id": 15, "name": "Myst", "slug": "myst"},
+        {"rawg_id": 16, "name": "Quake 1", "slug": "quake", "released": "1996"},
+    ]
+    matches, report = match_games(rawg, igdb)
+    assert matches == [
+        GameMatch(10, 1, 1.0, SLUG_MATCH),
+        GameMatch(11, 2, 1.0, NAME_MATCH),
+        GameMatch(16, 7, 1.0, SLUG_MATCH),
+    ]
+    assert report.matches == {SLUG_MATCH: 2, NAME_MATCH: 1}
+
+
+def test_match_outputs_writes_match_file(tmp_path):
+    rawg, igdb = random_games(3, 50)
+    rawg_path, igdb_path = tmp_path / "rawg.json", tmp_path / "igdb.json"
+    JsonUtils.save_to_json(rawg, rawg_path)
+    JsonUtils.save_to_json(igdb, igdb_path)
+
+    output_path, report = match_outputs(tmp_path, rawg_path, igdb_path)
+    saved = JsonUtils.load_records(output_path)
+    assert [GameMatch(**match) for match in saved] == brute_force(rawg, igdb)
+    assert report.rawg_games == 50
@@ -0,0 +1,140 @@
+import json
+
+import httpx
+import pytest
+
+from src.sho_da_igram.utils.metrics import (
+    Histogram,
+    MetricsRegistry,
+    endpoint_label,
+    format_labels,
+    write_summary,
+)
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected",
+    [
+        ("games", "games"),
+        ("games/3498", "games/{id}"),
+        ("games/3498/screenshots", "games/{id}/screenshots"),
+        ("12", "{id}"),
+        ("games/gta-5", "games/gta-5"),
+    ],
+)
+def test_endpoint_label(endpoint, expected):
+    assert endpoint_label(endpoint) == expected
+
+
+def test_format_labels_escapes_values():
+    assert format_labels(()) == ""
+    labels = (("endpoint", 'say "hi"\\\n'), ("source", "rawg"))
+    assert format_labels(labels) == '{endpoint="say \\"hi\\"\\\\\\n",source="rawg"}'
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [("0.1", 2), ("1.0", 4), ("+Inf", 5)]
+    assert histogram.sum == pytest.approx(3.15)
+    assert histogram.quantile(0.2) == pytest.approx(0.05)
+    assert histogram.quantile(0.6) == pytest.approx(0.1 + 0.9 * 0.5)
+    assert histogram.quantile(0.99) == 1.0
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_render_prometheus():
+    metrics = MetricsRegistry("test")
+    metrics.record_request("rawg", "games/12", 200, 0.02, size=512)
+    metrics.record_request("rawg", "games/13", 429, 0.5)
+    metrics.inc("retries_total", target="rawg")
+    metrics.record_stage("write", "rawg", 100, 0.5)
+    metrics.set("run_success", 1, source="rawg")
+
+    text = metrics.render_prometheus()
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    assert lines[:2] == [
+        "# HELP test_requests_total HTTP requests sent, per endpoint and status",
+        "# TYPE test_requests_total counter",
+    ]
+    assert (
+        'test_requests_total{endpoint="games/{id}",source="rawg",status="200"} 1.0'
+        in lines
+    )
+    assert (
+        'test_requests_total{endpoint="games/{id}",source="rawg",status="429"} 1.0'
+        in lines
+    )
+    assert "# TYPE test_request_duration_seconds histogram" in lines
+    labels = 'endpoint="games/{id}",source="rawg"'
+    assert f'test_request_duration_seconds_bucket{{{labels},le="0.025"}} 1' in lines
+    assert f'test_request_duration_seconds_bucket{{{labels},le="0.5"}} 2' in lines
+    assert f'test_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f"test_request_duration_seconds_sum{{{labels}}} 0.52" in lines
+    assert f"test_request_duration_seconds_count{{{labels}}} 2" in lines
+    assert f"test_response_bytes_total{{{labels}}} 512.0" in lines
+    assert 'test_stage_records_per_second{source="rawg",stage="write"} 200.0' in lines
+    assert 'test_run_success{source="rawg"} 1' in lines
+    # Metrics without samples are left out
+    assert "cache_hits_total" not in text
+
+    # Families follow the declared order, each with HELP, TYPE then samples
+    families = [line.split()[2] for line in lines if line.startswith("# TYPE")]
+    assert families == [
+        "test_requests_total",
+        "test_request_duration_seconds",
+        "test_response_bytes_total",
+        "test_retries_total",
+        "test_stage_records_total",
+        "test_stage_seconds_total",
+        "test_stage_records_per_second",
+        "test_run_success",
+    ]
+
+
+def test_track_request_records_errors():
+    metrics = MetricsRegistry()
+    with metrics.track_request("igdb", "games") as sample:
+        sample.response = httpx.Response(200, content=b"[]")
+    with pytest.raises(httpx.ConnectError):
+        with metrics.track_request("igdb", "games"):
+            raise httpx.ConnectError("down")
+
+    summary = metrics.summary()["endpoints"]["igdb games"]
+    assert summary["requests"] == 2
+    assert summary["statuses"] == {"200": 1, "error": 1}
+    assert summary["bytes"] == 2
+
+
+def test_summary():
+    metrics = MetricsRegistry()
+    metrics.record_request("rawg", "games", 200, 0.1, size=10)
+    metrics.inc("cache_hits_total", source="rawg")
+    metrics.inc("rate_limit_waits_total", limiter="api.rawg.io")
+    metrics.inc("rate_limit_wait_seconds_total", 0.25, limiter="api.rawg.io")
+    metrics.record_stage("process", "rawg", 50, 0.5)
+
+    summary = metrics.summary()
+    assert summary["endpoints"]["rawg games"]["mean_ms"] == 100.0
+    assert summary["cache_hits"] == {"rawg": 1.0}
+    assert summary["rate_limit_waits"] == {"api.rawg.io": 1.0}
+    assert summary["rate_limit_wait_seconds"] == {"api.rawg.io": 0.25}
+    assert summary["stages"]["rawg process"] == {
+        "records": 50,
+        "seconds": 0.5,
+        "records_per_s": 100.0,
+    }
+
+
+def test_write_textfile_and_summary(tmp_path):
+    metrics = MetricsRegistry()
+    metrics.set("run_records", 5, source="igdb")
+    path = tmp_path / "textfile" / "sho_da_igram.prom"
+    metrics.write_textfile(path)
+    write_summary(tmp_path / "summary.json", metrics.summary())
+
+    assert path.read_text(encoding="utf-8") == metrics.render_prometheus()
+    assert json.loads((tmp_path / "summary.json").read_text())["endpoints"] == {}
+    assert sorted(p.name for p in path.parent.iterdir()) == ["sho_da_igram.prom"]
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from src.sho_da_igram.api import rate_limiter
+from src.sho_da_igram.api.rate_limiter import RateLimiter, parse_retry_after
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the waits acquire() asks for instead of sleeping."""
+    recorded = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", recorded.append)
+    return recorded
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+
+@pytest.mark.parametrize("value", [None, "", "soon"])
+def test_parse_retry_after_missing_or_malformed(value):
+    assert parse_retry_after(value) is None
+
+
+def test_burst_starts_without_waiting(sleeps):
+    limiter = RateLimiter("test", rate_limit=1.0, burst=3)
+    for _ in range(3):
+        with limiter.acquire():
+            pass
+    assert sleeps == []
+
+
+def test_requests_past_the_burst_wait_for_the_next_token(sleeps):
+    limiter = RateLimiter("test", rate_limit=0.5, burst=2)
+    for _ in range(4):
+        with limiter.acquire():
+            pass
+    assert len(sleeps) == 2
+    # Each caller reserves the next free slot, so waits grow by the interval
+    assert sleeps[0] == pytest.approx(0.5, abs=0.05)
+    assert sleeps[1] == pytest.approx(1.0, abs=0.05)
+
+
+def test_wait_time_does_not_reserve():
+    limiter = RateLimiter("test", rate_limit=1.0)
+    assert limiter.wait_time() == 0.0
+    assert limiter.wait_time() == 0.0
+    with limiter.acquire():
+        pass
+    assert limiter.wait_time() == pytest.approx(1.0, abs=0.05)
+
+
+def test_in_flight_cap():
+    limiter = RateLimiter("test", rate_limit=0, max_in_flight=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def request():
+        nonlocal active, peak
+        with limiter.acquire():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak == 2
+
+
+def test_async_in_flight_cap():
+    limiter = RateLimiter("test", rate_limit=0, max_in_flight=3)
+    active = 0
+    peak = 0
+
+    async def request():
+        nonlocal active, peak
+        async with limiter.acquire_async():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def main():
+        await asyncio.gather(*(request() for _ in range(10)))
+
+    asyncio.run(main())
+    assert peak == 3
+
+
+def test_retry_after_pauses_every_caller(sleeps):
+    limiter = RateLimiter("test", rate_limit=0.1, burst=5)
+    response = httpx.Response(429, headers={"Retry-After": "2"})
+    assert limiter.observe(response) is True
+    assert limiter.wait_time() == pytest.approx(2.0, abs=0.05)
+    with limiter.acquire():
+        pass
+    assert sleeps[0] == pytest.approx(2.0, abs=0.05)
+
+
+def test_throttling_halves_the_rate_and_success_recovers_it():
+    limiter = RateLimiter("test", rate_limit=0.1)
+    limiter.on_throttled(0)
+    assert limiter.rate == pytest.approx(5.0)
+    for _ in range(100):
+        assert limiter.observe(httpx.Response(200)) is False
+    assert limiter.rate == pytest.approx(limiter.base_rate)
+
+
+def test_unlimited_rate_only_waits_for_retry_after():
+    limiter = RateLimiter("test", rate_limit=0)
+    assert limiter.wait_time() == 0.0
+    limiter.on_throttled(1.5)
+    assert limiter.wait_time() == pytest.approx(1.5, abs=0.05)
@@ -0,0 +1,138 @@
+import io
+import json
+
+import pytest
+
+from src.sho_da_igram.utils.records import (
+    IGDBGame,
+    RAWGGame,
+    record_from_dict,
+    write_json_array,
+)
+from src.sho_da_igram.utils.utils import JsonUtils
+
+
+def rawg_game(game_id, **overrides):
+    game = {
+        "rawg_id": game_id,
+        "name": f'Gäme «{game_id}» "quoted"\n',
+        "slug": f"game-{game_id}",
+        "released": "2020-03-04",
+        "rating": 4.25,
+        "rating_top": 5,
+        "ratings_count": 10_000,
+        "metacritic": None,
+        "description_raw": "Tabs\tand \\ backslashes, emoji 🎮",
+        "background_image": None,
+        "website": "",
+        "playtime": 0,
+        "achievements_count": 12,
+        "genres": ["Action", "RPG"],
+        "genre_ids": [4, 5],
+        "platforms": [],
+        "developers": ["Studio"],
+        "publishers": ["Studio", None],
+        "tags": ["Singleplayer"],
+        "creators_count": 3,
+        "additions_count": 0,
+        "game_series_count": 1,
+        "user_game": {"status": [True, False], "score": 1e16},
+        "updated": "2024-05-27T16:00:00",
+        "fetched_at": "2024-05-28T00:00:00+00:00",
+        "data_source": "rawg",
+    }
+    game.update(overrides)
+    return game
+
+
+def igdb_game(game_id, **overrides):
+    game = {
+        "igdb_id": game_id,
+        "name": f"IGDB {game_id}",
+        "slug": f"igdb-{game_id}",
+        "summary": "Ünïcode summary",
+        "storyline": None,
+        "url": f"https://www.igdb.com/games/igdb-{game_id}",
+        "cover_url": None,
+        "first_release_date": "2011-04-19",
+        "rating": 87.123456789,
+        "rating_count": 100,
+        "total_rating": 1e-7,
+        "total_rating_count": 12,
+        "updated_at": 1716825600,
+        "genres": ["Puzzle"],
+        "platforms": ["PC", "Xbox 360"],
+        "themes": [],
+        "game_modes": ["Single player"],
+        "franchises": [],
+        "keywords": ["portals"],
+        "player_perspectives": [],
+        "game_engines": ["Source"],
+        "similar_games": [1, 2, 3],
+        "developers": ["Valve"],
+        "publishers": ["Valve", "EA"],
+        "age_ratings": {"ESRB": 10, "PEGI": 12},
+        "collection": [],
+        "fetched_at": "2024-05-28T00:00:00+00:00",
+        "data_source": "igdb",
+    }
+    game.update(overrides)
+    return game
+
+
+GAMES = [
+    rawg_game(1),
+    rawg_game(2, rating=float("nan"), genres=[], user_game=None),
+    igdb_game(3),
+    igdb_game(4, age_ratings={}, similar_games=[], rating=None),
+]
+
+
+@pytest.mark.parametrize("game", GAMES, ids=["rawg", "rawg-nan", "igdb", "igdb-empty"])
+def test_round_trip(game):
+    record = record_from_dict(game)
+    assert type(record) is (RAWGGame if "rawg_id" in game else IGDBGame)
+    assert json.dumps(record.to_dict()) == json.dumps(game)
+
+
+@pytest.mark.parametrize("indent", [2, 4])
+def test_to_json_matches_json_dump(indent):
+    for game in GAMES:
+        record = record_from_dict(game)
+        for level in range(3):
+            expected = json.dumps(game, indent=indent, ensure_ascii=False)
+            expected = expected.replace("\n", "\n" + " " * (indent * level))
+            assert record.to_json(indent, level) == expected
+
+
+@pytest.mark.parametrize("count", [0, 1, len(GAMES)])
+def test_write_json_array_matches_json_dump(count):
+    records = [record_from_dict(game) for game in GAMES[:count]]
+    stream = io.StringIO()
+    write_json_array(records, stream)
+    assert stream.getvalue() == json.dumps(GAMES[:count], indent=2, ensure_ascii=False)
+
+
+def test_saved_records_are_byte_identical_to_dicts(tmp_path):
+    records = [record_from_dict(game) for game in GAMES]
+    JsonUtils.save_to_json(records, tmp_path / "records.json")
+    JsonUtils.save_to_json(GAMES, tmp_path / "dicts.json")
+    with open(tmp_path / "stdlib.json", "w", encoding="utf-8") as stdlib_file:
+        json.dump(GAMES, stdlib_file, indent=2, ensure_ascii=False)
+
+    expected = (tmp_path / "stdlib.json").read_bytes()
+    assert (tmp_path / "records.json").read_bytes() == expected
+    assert (tmp_path / "dicts.json").read_bytes() == expected
+
+
+def test_partial_dicts_fill_defaults():
+    record = RAWGGame.from_dict({"rawg_id": 9, "genres": ["Indie", "Indie"]})
+    assert record.name is None
+    assert record.genres == ("Indie", "Indie")
+    assert record.genres[0] is record.genres[1]
+    assert record.to_dict()["tags"] == []
+
+
+def test_unknown_data_source():
+    with pytest.raises(ValueError):
+        record_from_dict({"id": 1, "data_source": "steam"})
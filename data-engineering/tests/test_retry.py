@@ -0,0 +1,184 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.sho_da_igram.api import retry
+from src.sho_da_igram.api.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    counts_as_outage,
+    describe_error,
+    is_retryable,
+)
+
+
+def http_error(status, headers=None):
+    request = httpx.Request("GET", "https://api.example.com/games?key=secret")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError(str(status), request=request, response=response)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(retry.time, "sleep", recorded.append)
+    return recorded
+
+
+def flaky(errors, result="ok"):
+    """A send function raising ``errors`` in turn, then returning ``result``."""
+    calls = []
+
+    def send():
+        calls.append(len(calls))
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+
+    return send, calls
+
+
+@pytest.mark.parametrize("status", [408, 425, 429, 500, 502, 503, 504])
+def test_transient_statuses_are_retryable(status):
+    assert is_retryable(http_error(status))
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404, 422])
+def test_client_errors_are_fatal(status):
+    assert not is_retryable(http_error(status))
+
+
+def test_network_errors_are_retryable_and_bad_data_is_not():
+    assert is_retryable(httpx.ConnectTimeout("timed out"))
+    assert is_retryable(CircuitOpenError("open"))
+    assert not is_retryable(ValueError("bad json"))
+
+
+def test_only_outages_count_towards_the_breaker():
+    assert counts_as_outage(http_error(503))
+    assert counts_as_outage(httpx.ConnectError("refused"))
+    assert not counts_as_outage(http_error(429))
+    assert not counts_as_outage(http_error(404))
+
+
+def test_describe_error_leaves_out_the_url():
+    assert describe_error(http_error(503)) == "HTTP 503 Service Unavailable"
+    assert "secret" not in describe_error(http_error(401))
+
+
+def test_transient_failures_are_retried(sleeps):
+    send, calls = flaky([http_error(503), httpx.ReadTimeout("slow")])
+    assert RetryPolicy(max_attempts=3).call(send) == "ok"
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+
+
+def test_fatal_errors_are_not_retried(sleeps):
+    send, calls = flaky([http_error(404)])
+    with pytest.raises(httpx.HTTPStatusError):
+        RetryPolicy(max_attempts=3).call(send)
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_gives_up_after_max_attempts(sleeps):
+    send, calls = flaky([http_error(503)] * 5)
+    with pytest.raises(httpx.HTTPStatusError):
+        RetryPolicy(max_attempts=3).call(send)
+    assert len(calls) == 3
+
+
+def test_backoff_is_capped_and_respects_retry_after():
+    policy = RetryPolicy(base_delay=1.0, max_delay=8.0)
+    for attempt in range(1, 10):
+        assert (
+            0
+            <= policy.backoff(attempt, http_error(503))
+            <= min(8.0, 2 ** (attempt - 1))
+        )
+    throttled = http_error(429, {"Retry-After": "5"})
+    assert policy.backoff(1, throttled) == 5.0
+    assert policy.backoff(1, http_error(429, {"Retry-After": "60"})) == 8.0
+
+
+def test_async_call_retries_like_call():
+    send, calls = flaky([http_error(502)])
+
+    async def send_async():
+        return send()
+
+    policy = RetryPolicy(max_attempts=2, base_delay=0.001)
+    assert asyncio.run(policy.call_async(send_async)) == "ok"
+    assert len(calls) == 2
+
+
+def test_breaker_opens_after_threshold_and_probes_after_timeout(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(retry.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker("host", failure_threshold=2, reset_timeout=10)
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.remaining_open_time() == 10
+
+    now[0] += 10
+    breaker.before_call()
+    # A failed probe re-opens the circuit for a full timeout
+    breaker.record_failure()
+    assert breaker.remaining_open_time() == 10
+    breaker.record_success()
+    assert breaker.remaining_open_time() == 0
+
+
+def test_open_circuit_rejects_calls_immediately(sleeps):
+    breaker = CircuitBreaker("host", failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    send, calls = flaky([])
+    with pytest.raises(CircuitOpenError):
+        RetryPolicy(max_attempts=3).call(send, breaker)
+    assert calls == []
+    assert sleeps == []
+
+
+def test_async_open_circuit_rejects_calls_immediately():
+    breaker = CircuitBreaker("host", failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    send, calls = flaky([])
+
+    async def send_async():
+        return send()
+
+    policy = RetryPolicy(max_attempts=3)
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(asyncio.wait_for(policy.call_async(send_async, breaker), 1))
+    assert calls == []
+
+
+def test_retry_stops_once_the_circuit_opens(sleeps):
+    breaker = CircuitBreaker("host", failure_threshold=1, reset_timeout=30)
+    send, calls = flaky([http_error(500)])
+    with pytest.raises(CircuitOpenError):
+        RetryPolicy(max_attempts=3, base_delay=0).call(send, breaker)
+    # The outage opened the circuit; the retry was rejected without a request
+    assert len(calls) == 1
+    assert len(sleeps) == 1
+
+
+def test_call_probes_after_the_reset_timeout(monkeypatch, sleeps):
+    now = [100.0]
+    monkeypatch.setattr(retry.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker("host", failure_threshold=1, reset_timeout=0.5)
+    breaker.record_failure()
+    send, calls = flaky([])
+    with pytest.raises(CircuitOpenError):
+        RetryPolicy().call(send, breaker)
+
+    now[0] += 0.5
+    assert RetryPolicy().call(send, breaker) == "ok"
+    assert breaker.remaining_open_time() == 0
+    assert sleeps == []
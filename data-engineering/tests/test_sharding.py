@@ -0,0 +1,109 @@
+import pytest
+
+from src.sho_da_igram.data.fetcher import IGDBDataFetcher
+from src.sho_da_igram.data.sharding import (
+    ShardWorker,
+    merge_shards,
+    plan_shards,
+    shard_dir,
+)
+from src.sho_da_igram.data.work_queue import DONE, PENDING
+from src.sho_da_igram.utils.utils import JsonLinesWriter, JsonUtils
+
+
+def rawg_games(*ids):
+    return [
+        {"rawg_id": game_id, "name": f"Game {game_id}", "data_source": "rawg"}
+        for game_id in ids
+    ]
+
+
+def complete(queue, config, games):
+    """Claim the next unit and complete it with ``games`` as its result."""
+    unit = queue.claim("test")
+    path = shard_dir(config, "rawg") / f"{unit.unit_id}.jsonl"
+    with JsonLinesWriter(path) as writer:
+        writer.write_many(games)
+    queue.complete(unit, "test", {"path": path.name, "games": 2, "failures": []})
+    return unit
+
+
+def test_merge_keeps_the_shards_of_a_run_with_failed_units(config):
+    config.shard_pages_per_unit = 1
+    config.shard_max_attempts = 1
+    queue, planned = plan_shards("rawg", config, limit=100)
+    assert planned
+    assert queue.counts()[PENDING] == 3
+
+    complete(queue, config, rawg_games(1, 2, 3))
+    complete(queue, config, rawg_games(3, 4))
+    failed = queue.claim("test")
+    queue.fail(failed, "test", "HTTP 503 Service Unavailable")
+    queue.close()
+
+    output, report = merge_shards("rawg", config)
+    assert [game["rawg_id"] for game in JsonUtils.load_records(output)] == [1, 2, 3, 4]
+    assert report.duplicates == 1
+    assert [failure.cursor for failure in report.failures] == [failed.unit_id]
+    # The queue and completed units are kept for another round
+    assert (shard_dir(config, "rawg") / "queue.sqlite3").exists()
+    assert (shard_dir(config, "rawg") / "pages-000001-000001.jsonl").exists()
+
+    queue, planned = plan_shards("rawg", config, limit=100)
+    assert not planned
+    assert queue.counts()[PENDING] == 1
+    assert queue.errors() == {}
+    retried = complete(queue, config, rawg_games(4, 5))
+    assert retried.unit_id == failed.unit_id
+    assert queue.counts()[DONE] == 3
+    queue.close()
+
+    merged, report = merge_shards("rawg", config)
+    assert merged == output
+    assert [game["rawg_id"] for game in JsonUtils.load_records(merged)] == [
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+    assert report.duplicates == 2
+    assert report.failures == []
+    assert not shard_dir(config, "rawg").exists()
+
+
+def test_merge_refuses_unfinished_shards(config):
+    queue, _ = plan_shards("rawg", config, limit=100)
+    queue.close()
+    with pytest.raises(RuntimeError, match="unfinished"):
+        merge_shards("rawg", config)
+
+
+def test_rawg_shards_match_a_single_run(config):
+    config.shard_pages_per_unit = 2
+    plan_shards("rawg", config, limit=200)[0].close()
+    worker = ShardWorker("rawg", config)
+    assert worker.run() == 3
+    worker.close()
+
+    output, report = merge_shards("rawg", config)
+    ids = [game["rawg_id"] for game in JsonUtils.load_records(output)]
+    assert ids == list(range(1, 201))
+    assert report.failures == []
+
+
+def test_igdb_shards_keep_the_top_rated_games(config):
+    config.igdb_partition_years = 20
+    queue, _ = plan_shards("igdb", config, limit=300)
+    units = sum(queue.counts().values())
+    queue.close()
+    worker = ShardWorker("igdb", config)
+    assert worker.run() == units
+    worker.close()
+    output, _ = merge_shards("igdb", config)
+
+    fetcher = IGDBDataFetcher(config)
+    expected = fetcher.fetch_games_to_json(limit=300, output_filename="offset.json")
+    fetcher.close()
+    merged = [game["igdb_id"] for game in JsonUtils.load_records(output)]
+    assert merged == [game["igdb_id"] for game in JsonUtils.load_records(expected)]
@@ -0,0 +1,120 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from src.sho_da_igram.data import similarity  # noqa: E402
+from src.sho_da_igram.data.similarity import (  # noqa: E402
+    SIMILARITY_POWER,
+    GameDocument,
+    build_document,
+    build_tfidf_matrix,
+    compute_similarities,
+    plan_blocks,
+)
+
+WORDS = [f"word{i}" for i in range(60)]
+GENRES = ["Action", "Puzzle", "RPG", "Shooter", "Strategy", "Indie"]
+
+
+def random_documents(count, seed=11):
+    rng = random.Random(seed)
+    return [
+        GameDocument(
+            "igdb",
+            game_id,
+            {
+                "description": " ".join(rng.choices(WORDS, k=rng.randrange(5, 30))),
+                "genre": " ".join(rng.sample(GENRES, rng.randrange(1, 3))),
+            },
+        )
+        for game_id in range(count)
+    ]
+
+
+def brute_force(matrix, top_k, min_score):
+    """Every row's best neighbours from the full cosine matrix."""
+    dense = matrix.toarray().astype(np.float64)
+    cosines = dense @ dense.T
+    np.fill_diagonal(cosines, -1.0)
+    expected = {}
+    for row in range(cosines.shape[0]):
+        best = sorted(range(cosines.shape[1]), key=lambda col: -cosines[row, col])
+        expected[row] = [
+            (col, cosines[row, col] ** SIMILARITY_POWER)
+            for col in best[:top_k]
+            if cosines[row, col] ** SIMILARITY_POWER >= min_score
+        ]
+    return expected
+
+
+def collect(blocks):
+    found = {}
+    for rows, columns, scores in blocks:
+        for row, column, score in zip(rows.tolist(), columns.tolist(), scores):
+            found.setdefault(row, []).append((column, float(score)))
+    return found
+
+
+def test_plan_blocks_cover_every_row(monkeypatch):
+    monkeypatch.setattr(similarity, "BLOCK_CELLS", 70)
+    assert plan_blocks(30) == [(0, 2), (2, 4)] + [
+        (start, start + 2) for start in range(4, 30, 2)
+    ]
+    assert plan_blocks(100) == [(start, start + 1) for start in range(100)]
+    assert plan_blocks(0) == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("min_score", [0.0, 0.2])
+def test_top_neighbors_match_brute_force_across_blocks(monkeypatch, workers, min_score):
+    documents = random_documents(75)
+    matrix, _ = build_tfidf_matrix(documents)
+    # Blocks of 7 rows, the last one shorter
+    monkeypatch.setattr(similarity, "BLOCK_CELLS", 7 * len(documents))
+    assert len(plan_blocks(len(documents))) == 11
+
+    blocks = list(compute_similarities(matrix, 5, min_score, workers))
+    assert len(blocks) == 11
+    rows = np.concatenate([rows for rows, _, _ in blocks])
+    assert (np.diff(rows) >= 0).all()
+
+    found = collect(blocks)
+    expected = brute_force(matrix, 5, min_score)
+    for row in range(len(documents)):
+        pairs, wanted = found.get(row, []), expected[row]
+        assert [column for column, _ in pairs] == [column for column, _ in wanted]
+        assert [score for _, score in pairs] == pytest.approx(
+            [score for _, score in wanted], abs=1e-5
+        )
+        assert row not in [column for column, _ in pairs]
+
+
+def test_rows_are_unit_length_and_fields_are_weighted():
+    documents = [
+        GameDocument("igdb", 1, {"description": "space marine", "genre": "Shooter"}),
+        GameDocument("igdb", 2, {"description": "space farm", "genre": "Shooter"}),
+        GameDocument("igdb", 3, {"description": "space marine", "genre": "Puzzle"}),
+        GameDocument("igdb", 4, {"description": "cozy farm", "genre": "Puzzle"}),
+    ]
+    matrix, terms = build_tfidf_matrix(documents)
+    assert terms == 6
+    norms = np.sqrt(matrix.multiply(matrix).sum(axis=1)).A.ravel()
+    assert norms == pytest.approx(np.ones(4), abs=1e-6)
+
+    cosines = (matrix @ matrix.T).toarray()
+    # A shared genre (weight 5) counts more than a shared description word
+    assert cosines[0, 1] > cosines[0, 2]
+
+
+def test_build_document_skips_games_without_a_description():
+    game = {"igdb_id": 1, "summary": "  ", "genres": ["RPG"]}
+    assert build_document(game, "igdb") is None
+    document = build_document(
+        {"igdb_id": 1, "summary": None, "storyline": "Tale", "keywords": ["a", "b"]},
+        "igdb",
+    )
+    assert document.fields == {"description": "Tale", "keyword": "a b"}
+    assert build_document({"rawg_id": 2, "description_raw": ""}, "rawg") is None
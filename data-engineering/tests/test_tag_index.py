@@ -0,0 +1,255 @@
+import json
+import os
+import random
+
+import pytest
+
+from src.sho_da_igram.data.tag_index import (
+    TagIndex,
+    index_path,
+    tag_set,
+    update_tag_index,
+)
+from src.sho_da_igram.utils.utils import JsonUtils
+from tests.test_records import igdb_game, rawg_game
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b)
+
+
+def random_corpus(count, vocabulary=24, seed=7):
+    """Tag sets drawn around a few themes, so some are close and most are not."""
+    rng = random.Random(seed)
+    themes = [rng.sample(range(vocabulary), 6) for _ in range(max(1, count // 20))]
+    corpus = {}
+    for game_id in range(count):
+        tags = set(rng.choice(themes))
+        for _ in range(rng.randrange(3)):
+            tags.discard(rng.choice(sorted(tags)))
+            tags.add(rng.randrange(vocabulary))
+        corpus[("igdb", game_id)] = frozenset(f"keyword:tag-{tag}" for tag in tags)
+    return corpus
+
+
+def write_output(data_dir, name, games, mtime):
+    path = data_dir / name
+    JsonUtils.save_to_json(games, path)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def neighbor_rows(path):
+    rows = {}
+    for row in JsonUtils.load_records(path):
+        key = (row["source"], row["id"])
+        rows.setdefault(key, []).append(
+            ((row["similar_source"], row["similar_id"]), row["jaccard"])
+        )
+    return rows
+
+
+def test_tag_set_prefixes_and_normalizes():
+    game = igdb_game(1, genres=["Role-playing (RPG)"], themes=["Action", ""])
+    game.update(keywords=["Action"], franchises=None)
+    assert tag_set(game, "igdb") == {
+        "genre:role-playing-rpg",
+        "theme:action",
+        "keyword:action",
+    }
+    rawg = rawg_game(2, genres=["Action"], tags=["Open World"])
+    assert tag_set(rawg, "rawg") == {"genre:action", "keyword:open-world"}
+
+
+def test_insert_shares_identical_tag_sets():
+    index = TagIndex(bands=8, rows=2)
+    shared = frozenset({"genre:action", "theme:horror"})
+    assert index.insert(("igdb", 2), shared)
+    assert index.insert(("rawg", 1), shared)
+    assert index.insert(("igdb", 1), shared)
+    assert index.members == {shared: [("igdb", 1), ("igdb", 2), ("rawg", 1)]}
+    assert len(index.signatures) == 1
+    assert sum(len(bucket) for bucket in index.buckets.values()) == 8
+
+    # The shared set is scored once, its members come out in key order
+    index.compared = 0
+    assert index.query(shared, top_k=5, exclude=("igdb", 2)) == [
+        (("igdb", 1), 1.0),
+        (("rawg", 1), 1.0),
+    ]
+    assert index.compared == 1
+
+
+def test_insert_replaces_and_remove_cleans_up():
+    index = TagIndex(bands=8, rows=2)
+    before = frozenset({"genre:action"})
+    after = frozenset({"genre:puzzle"})
+    index.insert(("igdb", 1), before)
+    index.insert(("igdb", 2), before)
+
+    index.insert(("igdb", 1), after)
+    assert index.tags[("igdb", 1)] == after
+    assert index.members[before] == [("igdb", 2)]
+
+    assert index.remove(("igdb", 2))
+    assert not index.remove(("igdb", 2))
+    assert before not in index.members and before not in index.signatures
+    assert all(before not in bucket for bucket in index.buckets.values())
+
+    # A game losing all its tags leaves the index
+    assert not index.insert(("igdb", 1), frozenset())
+    assert len(index) == 0
+    assert not index.buckets
+
+
+def test_lsh_neighbors_match_exact_jaccard():
+    corpus = random_corpus(300)
+    index = TagIndex()
+    for key, tags in corpus.items():
+        index.insert(key, tags)
+
+    min_jaccard = 0.5
+    expected_pairs = found_pairs = 0
+    for key, tags in corpus.items():
+        neighbors = index.neighbors(key, top_k=len(corpus), min_jaccard=min_jaccard)
+        # Every neighbour is scored exactly and ranked best first
+        for other, score in neighbors:
+            assert score == pytest.approx(jaccard(tags, corpus[other]))
+            assert score >= min_jaccard
+        assert [score for _, score in neighbors] == sorted(
+            (score for _, score in neighbors), reverse=True
+        )
+        assert key not in dict(neighbors)
+
+        exact = {
+            other
+            for other, other_tags in corpus.items()
+            if other != key and jaccard(tags, other_tags) >= min_jaccard
+        }
+        expected_pairs += len(exact)
+        found_pairs += len(exact & dict(neighbors).keys())
+
+    assert expected_pairs > 1000
+    assert found_pairs / expected_pairs > 0.95
+    # Banding spares most of the all-pairs comparisons
+    assert index.compared < len(corpus) * len(index.members) / 2
+
+
+def test_top_k_keeps_the_closest_neighbors():
+    corpus = random_corpus(200, seed=3)
+    index = TagIndex(bands=64, rows=1)
+    for key, tags in corpus.items():
+        index.insert(key, tags)
+
+    for key, tags in list(corpus.items())[:50]:
+        neighbors = index.neighbors(key, top_k=5)
+        exact = sorted(
+            (
+                jaccard(tags, other_tags)
+                for other, other_tags in corpus.items()
+                if other != key
+            ),
+            reverse=True,
+        )[:5]
+        # Ties may come out in any order, so compare the scores
+        assert [score for _, score in neighbors] == pytest.approx(exact)
+        for other, score in neighbors:
+            assert score == pytest.approx(jaccard(tags, corpus[other]))
+
+
+def test_save_and_load_round_trip(tmp_path):
+    corpus = random_corpus(120)
+    index = TagIndex()
+    for key, tags in corpus.items():
+        index.insert(key, tags)
+    index.insert(("rawg", 5), frozenset({"genre:action"}))
+
+    path = tmp_path / "tag_index.json"
+    index.save(path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["tag_index.json"]
+
+    loaded = TagIndex.load(path)
+    assert loaded.tags == index.tags
+    assert loaded.members == index.members
+    assert loaded.signatures == index.signatures
+    for key in list(corpus)[:20]:
+        assert loaded.neighbors(key, 5) == index.neighbors(key, 5)
+
+    # Only tag sets are saved, so the banding can change between runs
+    rebanded = TagIndex.load(path, bands=16, rows=4)
+    assert rebanded.tags == index.tags
+    assert len(rebanded.signatures[index.tags[("rawg", 5)]]) == 64
+
+
+def test_update_tag_index_with_deltas(tmp_path):
+    action = {"genres": ["Action"], "tags": ["Open World", "Co-op"]}
+    write_output(
+        tmp_path,
+        "rawg_games_20240101_000000.json",
+        [
+            rawg_game(1, **action),
+            rawg_game(2, **action),
+            rawg_game(3, genres=["Action"], tags=["Co-op"]),
+        ],
+        mtime=1_000,
+    )
+    write_output(
+        tmp_path,
+        "igdb_games_20240101_000000.json",
+        [
+            igdb_game(
+                10,
+                genres=["Action"],
+                themes=[],
+                keywords=["Open World", "Co-op"],
+                franchises=[],
+            ),
+            igdb_game(11, genres=[], themes=[], keywords=[], franchises=[]),
+        ],
+        mtime=1_000,
+    )
+    # RAWG 1 is the same game as IGDB 10 and is merged into it downstream
+    (tmp_path / "game_matches_20240101_000000.json").write_text(
+        json.dumps([{"rawg_id": 1, "igdb_id": 10, "score": 1.0, "method": "slug"}])
+    )
+
+    output, report = update_tag_index(tmp_path, top_k=5, min_jaccard=0.3)
+    assert report.games == 3
+    assert report.inserted == 4
+    assert report.removed == 1
+    assert report.tag_sets == 2
+    rows = neighbor_rows(output)
+    assert rows[("rawg", 2)] == [(("igdb", 10), 1.0), (("rawg", 3), 0.6667)]
+    assert rows[("igdb", 10)][0] == (("rawg", 2), 1.0)
+    assert ("rawg", 1) not in rows and ("igdb", 11) not in rows
+    assert report.pairs == sum(len(pairs) for pairs in rows.values())
+
+    # A delta changes one game, adds another, and still skips the matched one
+    delta = write_output(
+        tmp_path,
+        "rawg_games_delta_20240102_000000.json",
+        [
+            rawg_game(1, **action),
+            rawg_game(3, **action),
+            rawg_game(4, genres=["Action"], tags=["Co-op"]),
+        ],
+        mtime=2_000,
+    )
+    output, report = update_tag_index(tmp_path, [delta], top_k=5, min_jaccard=0.3)
+    assert report.inserted == 3
+    assert report.removed == 1
+    assert report.games == 4
+    rows = neighbor_rows(output)
+    assert rows[("rawg", 3)] == [
+        (("igdb", 10), 1.0),
+        (("rawg", 2), 1.0),
+        (("rawg", 4), 0.6667),
+    ]
+    saved = json.loads(index_path(tmp_path).read_text())["games"]
+    assert sorted(saved["rawg"]) == ["2", "3", "4"]
+    assert sorted(saved["igdb"]) == ["10"]
+
+
+def test_update_tag_index_without_outputs(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        update_tag_index(tmp_path)
@@ -0,0 +1,124 @@
+import time
+
+import pytest
+
+from src.sho_da_igram.data import work_queue
+from src.sho_da_igram.data.work_queue import WorkQueue
+
+
+class Clock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(work_queue.time, "time", clock)
+    return clock
+
+
+def planned(tmp_path, count=3, **kwargs):
+    queue = WorkQueue(tmp_path / "queue.db", **kwargs)
+    queue.plan({f"unit-{i}": {"offset": i * 10} for i in range(count)}, {"limit": 30})
+    return queue
+
+
+def test_plan_only_once(tmp_path):
+    queue = planned(tmp_path)
+    assert not queue.plan({"other": {}}, {"limit": 1})
+    assert queue.meta() == {"limit": 30}
+    assert queue.counts()["pending"] == 3
+
+
+def test_claims_in_plan_order(tmp_path, clock):
+    queue = planned(tmp_path)
+    claimed = [queue.claim("a") for _ in range(3)]
+    assert [unit.unit_id for unit in claimed] == ["unit-0", "unit-1", "unit-2"]
+    assert claimed[1].payload == {"offset": 10}
+    assert claimed[0].attempts == 1
+    assert queue.claim("b") is None
+    assert queue.counts()["leased"] == 3
+
+
+def test_expired_lease_is_reclaimed(tmp_path, clock):
+    queue = planned(tmp_path, count=1, lease_seconds=10)
+    first = queue.claim("a")
+    clock.now += 5
+    assert queue.claim("b") is None
+
+    clock.now += 6
+    second = queue.claim("b")
+    assert second.unit_id == first.unit_id
+    assert second.attempts == 2
+
+    # The first worker lost its lease and cannot finish or extend it
+    assert not queue.heartbeat(first, "a")
+    assert not queue.complete(first, "a", {"games": 1})
+    assert queue.complete(second, "b", {"games": 2})
+    assert queue.results() == [{"games": 2}]
+
+
+def test_heartbeat_keeps_the_lease(tmp_path, clock):
+    queue = planned(tmp_path, count=1, lease_seconds=10)
+    unit = queue.claim("a")
+    for _ in range(3):
+        clock.now += 8
+        assert queue.heartbeat(unit, "a")
+    assert queue.claim("b") is None
+    assert queue.complete(unit, "a", {"games": 1})
+
+
+def test_unit_fails_after_max_expired_leases(tmp_path, clock):
+    queue = planned(tmp_path, count=1, lease_seconds=10, max_attempts=2)
+    queue.claim("a")
+    clock.now += 11
+    queue.claim("b")
+    clock.now += 11
+
+    assert queue.claim("c") is None
+    assert queue.counts()["failed"] == 1
+    assert queue.errors() == {"unit-0": "lease expired"}
+
+
+def test_fail_releases_until_max_attempts(tmp_path, clock):
+    queue = planned(tmp_path, count=1, max_attempts=2)
+    queue.fail(queue.claim("a"), "a", "boom")
+    assert queue.counts()["pending"] == 1
+
+    queue.fail(queue.claim("b"), "b", "boom again")
+    assert queue.counts()["failed"] == 1
+    assert queue.errors() == {"unit-0": "boom again"}
+    assert queue.claim("c") is None
+
+
+def test_results_follow_plan_order(tmp_path, clock):
+    queue = planned(tmp_path)
+    units = [queue.claim("a") for _ in range(3)]
+    for unit in reversed(units):
+        queue.complete(unit, "a", {"offset": unit.payload["offset"]})
+    assert queue.results() == [{"offset": 0}, {"offset": 10}, {"offset": 20}]
+
+
+def test_queue_is_shared_between_connections(tmp_path, clock):
+    queue = planned(tmp_path, count=2)
+    other = WorkQueue(tmp_path / "queue.db")
+    assert queue.claim("a").unit_id == "unit-0"
+    assert other.claim("b").unit_id == "unit-1"
+    other.close()
+    queue.close()
+
+
+def test_retry_failed_requeues_with_fresh_attempts(tmp_path, clock):
+    queue = planned(tmp_path, count=2, max_attempts=1)
+    queue.fail(queue.claim("a"), "a", "boom")
+    assert queue.retry_failed() == 1
+    assert queue.errors() == {}
+
+    unit = queue.claim("b")
+    assert unit.unit_id == "unit-0"
+    assert unit.attempts == 1
+    assert queue.retry_failed() == 0
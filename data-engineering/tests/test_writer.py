@@ -0,0 +1,62 @@
+import gzip
+import json
+
+import pytest
+
+from src.sho_da_igram.utils.utils import JsonLinesWriter, JsonUtils
+from tests.test_records import GAMES
+
+
+@pytest.mark.parametrize(
+    "compression, name", [("none", "out.ndjson"), ("gzip", "out.ndjson.gz")]
+)
+def test_records_round_trip(tmp_path, compression, name):
+    path = tmp_path / name
+    writer = JsonLinesWriter(path, compression)
+    writer.write_many(GAMES)
+    # Readers never see a half-written file under the final name
+    assert not path.exists()
+    assert [p.name for p in tmp_path.iterdir()] == [f"{name}.part"]
+
+    writer.close()
+    assert [p.name for p in tmp_path.iterdir()] == [name]
+    assert writer.count == len(GAMES)
+    assert json.dumps(JsonUtils.load_records(path)) == json.dumps(GAMES)
+
+
+def test_gzip_output_is_one_compact_record_per_line(tmp_path):
+    path = tmp_path / "out.ndjson.gz"
+    with JsonLinesWriter(path, "gzip") as writer:
+        writer.write_many(GAMES)
+    with gzip.open(path, "rt", encoding="utf-8") as stream:
+        lines = stream.read().splitlines()
+    assert len(lines) == len(GAMES)
+    assert lines == [
+        json.dumps(game, separators=(",", ":"), ensure_ascii=False) for game in GAMES
+    ]
+
+
+def test_error_discards_the_partial_file(tmp_path):
+    path = tmp_path / "out.ndjson"
+    path.write_text("previous run\n")
+    with pytest.raises(RuntimeError):
+        with JsonLinesWriter(path) as writer:
+            writer.write(GAMES[0])
+            raise RuntimeError("fetch failed")
+    # The earlier output is left untouched and nothing else remains
+    assert [p.name for p in tmp_path.iterdir()] == ["out.ndjson"]
+    assert path.read_text() == "previous run\n"
+
+
+def test_unknown_compression_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="brotli"):
+        JsonLinesWriter(tmp_path / "out.ndjson", "brotli")
+    assert not list(tmp_path.iterdir())
+
+
+def test_zstd_round_trip(tmp_path):
+    pytest.importorskip("zstandard")
+    path = tmp_path / "out.ndjson.zst"
+    with JsonLinesWriter(path, "zstd") as writer:
+        writer.write_many(GAMES)
+    assert json.dumps(JsonUtils.load_records(path)) == json.dumps(GAMES)